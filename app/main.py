@@ -1,18 +1,30 @@
 import pathlib
 import os
+import json
 import asyncio
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, HTMLResponse, Response, StreamingResponse
 from jinja2 import Template
 from app.schemas import GuideQuery, GuideResponse, LatLng
 from app.services.naver_client import NaverClient, pick_top
-from app.services.rag_chain import run_chain
+from app.services.rag_chain import run_chain, stream_chain, get_stream_stats
 from app.utils.geo import resolve_location
 from app.utils.Loaction_getter import get_location
-from app.utils.Refine_query import refine_query
-from app.utils.Build_context import build_context
+from app.utils.Refine_query import refine_query, get_refine_stats
+from app.utils.Build_context import build_context, iter_place_contexts, assemble_context
+from app.utils.browser_pool import get_browser_pool, close_browser_pool
+from app.utils.page_wait import get_wait_stats
+from app.utils.http_pool import get_http_registry, close_http_clients
+from app.utils.loop_monitor import start_loop_stall_detector, stop_loop_stall_detector
+from app.utils.image_store import get_image_store
+from app.utils.cache_store import close_cache_store
+from app.utils.cache_util import get_cache_stats
+from app.utils.single_flight import get_single_flight
+from app.utils.stage_cache import get_stage_stats
+from app.utils.answer_cache import get_answer_cache
+from app.utils.geo_cache import get_reverse_geo_cache
+from app.utils.llm_pool import get_llm_registry, close_llm_clients
 import time
 
 app = FastAPI(title="PELPER-Travel-Guide", version="0.1.0")
@@ -26,21 +38,37 @@ app.add_middleware(
 )
 
 
-class NoCacheStaticFiles(StaticFiles):
-    async def get_response(self, path, scope):
-        response = await super().get_response(path, scope)
-        # 200 응답에만 캐시 무력화 헤더 부여
-        if getattr(response, "status_code", None) == 200:
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, max-age=0, private"
-            )
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-        return response
+# 이미지 URL은 원본 URL 해시라 내용이 바뀌지 않음 → 브라우저가 1년간 재검증 없이 재사용
+IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match: "a", W/"b" 또는 *
+    if if_none_match.strip() == "*":
+        return True
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return any(t.removeprefix("W/") == etag for t in tags)
+
 
+# 장소 썸네일 서빙 (image_store의 <id>.jpg, Accept에 webp가 있으면 WebP 변형)
+@app.get("/images/{filename}")
+async def get_image(filename: str, request: Request):
+    store = get_image_store()
+    image_id, ext = os.path.splitext(filename)
+    # lookup은 mtime을 갱신 → 자주 보이는 이미지가 GC(LRU)에서 먼저 지워지지 않음
+    if ext != ".jpg" or not store.is_valid_id(image_id) or not store.lookup(image_id):
+        raise HTTPException(status_code=404, detail="이미지를 찾을 수 없습니다.")
 
-# 정적 파일 서빙 설정 (이미지 폴더) - 캐시 방지
-app.mount("/images", NoCacheStaticFiles(directory="images"), name="images")
+    path, media_type, etag = store.path(image_id), "image/jpeg", f'"{image_id}"'
+    if "image/webp" in request.headers.get("accept", ""):
+        webp = await asyncio.to_thread(store.webp_path, image_id)
+        if webp:
+            path, media_type, etag = webp, "image/webp", f'"{image_id}-webp"'
+
+    headers = {"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL, "Vary": "Accept"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
 
 current_location = {"lat": 37.5665, "lng": 126.9780}  # 기본값: 서울 시청
 
@@ -60,12 +88,45 @@ async def get_startup_location():
 
 @app.on_event("startup")
 async def startup_event():
+    start_loop_stall_detector()
     await get_startup_location()
+    get_http_registry().start()
+    # 이미지 저장소 용량 정리 (오래 안 쓴 파일부터)
+    removed = await asyncio.to_thread(get_image_store().gc)
+    if removed:
+        print(f"이미지 저장소 정리: {removed}개 삭제")
+    try:
+        await get_browser_pool().start()
+    except Exception as e:
+        # 실패해도 첫 크롤링 때 다시 기동을 시도함
+        print(f"브라우저 풀 기동 실패: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    stop_loop_stall_detector()
+    await close_browser_pool()
+    await close_http_clients()
+    await close_llm_clients()
+    close_cache_store()
 
 
 @app.get("/healthz")
 async def healthz():
-    return {"status": "ok"}
+    return {
+        "status": "ok",
+        "browser_pool": get_browser_pool().health(),
+        "crawler_waits": get_wait_stats(),
+        "image_store": get_image_store().stats,
+        "cache": get_cache_stats(),
+        "single_flight": get_single_flight().health(),
+        "stages": get_stage_stats(),
+        "answer_cache": get_answer_cache().health(),
+        "refine_query": get_refine_stats(),
+        "reverse_geocode": get_reverse_geo_cache().health(),
+        "llm_stream": get_stream_stats(),
+        "llm": get_llm_registry().health(),
+    }
 
 
 # Frontend에서 사용자의 위도 경도를 반환
@@ -78,9 +139,7 @@ async def get_current_location():
     }
 
 
-@app.post("/v1/guide/query", response_model=GuideResponse)
-async def guide_query(body: GuideQuery):
-    t0 = time.perf_counter()
+def _require_location(body: GuideQuery) -> None:
     # 텍스트 주소, 위도, 경도 정보가 없을때
     if not body.location_text and (body.lat is None or body.lng is None):
         raise HTTPException(
@@ -88,6 +147,8 @@ async def guide_query(body: GuideQuery):
             detail="위치 정보(location_text 또는 lat/lng)가 필요합니다.",
         )
 
+
+async def _resolve_address(body: GuideQuery):
     lat, lng, address_data = await resolve_location(
         body.location_text, body.lat, body.lng
     )
@@ -96,7 +157,25 @@ async def guide_query(body: GuideQuery):
         resolved_address = address_data.get("main_address", None)
     else:
         resolved_address = address_data
+    return lat, lng, resolved_address
+
+
+async def _cached_answer(body: GuideQuery, resolved_address, t0: float):
+    """같은 위치에서 최근에 나온 비슷한 질문이면 저장된 응답 반환 (없으면 None)"""
+    hit = await get_answer_cache().lookup(resolved_address, body.query, body.llm_model)
+    if hit is None:
+        return None
+    cached_resp, sim, matched = hit
+    elapsed_ms = int((time.perf_counter() - t0) * 1000)
+    meta = {
+        **cached_resp.get("meta", {}),
+        "elapsed_ms": elapsed_ms,
+        "answer_cache": {"hit": True, "similarity": round(sim, 3), "matched": matched},
+    }
+    return GuideResponse(**{**cached_resp, "meta": meta})
 
+
+async def _search_places(body: GuideQuery, resolved_address):
     client = NaverClient()
 
     q = await refine_query(resolved_address, body.query)
@@ -108,11 +187,12 @@ async def guide_query(body: GuideQuery):
     for item in local_top:
         place_list.append(item["title"])
     print("places", place_list)
+    return place_list
+
 
+def _context_params(body: GuideQuery, place_list):
     # 수집량 파라미터 (필요시 body로부터 받아 커스터마이즈 가능)
-    collected, reference_link, places_info = await build_context(
-        place_list,
-        resolved_address,
+    return dict(
         blog_top_k=min(3, len(place_list)),
         review_batches=2,
         image_limit=3,
@@ -121,21 +201,152 @@ async def guide_query(body: GuideQuery):
         enable_blog_refinement=True,
     )
 
-    answer = await run_chain(body.query, collected, model_name=body.llm_model)
-    elapsed_ms = int((time.perf_counter() - t0) * 1000)
 
+async def _collect_context(body: GuideQuery, resolved_address):
+    place_list = await _search_places(body, resolved_address)
+    return await build_context(
+        place_list, resolved_address, **_context_params(body, place_list)
+    )
+
+
+async def _finish_response(
+    body: GuideQuery, lat, lng, resolved_address, answer, reference_link, places_info, meta
+) -> GuideResponse:
     # 사용자 위치를 center로 사용 (geocoding된 주소 좌표)
     center = LatLng(lat=lat, lng=lng) if lat is not None and lng is not None else None
 
-    print(f"요청 처리 시간: {elapsed_ms} ms")
+    print(f"요청 처리 시간: {meta['elapsed_ms']} ms")
 
-    return GuideResponse(
+    response = GuideResponse(
         answer=answer,
         sources=reference_link,
         center=center,
         resolved_address=resolved_address,
         places=places_info,
-        meta={"elapsed_ms": elapsed_ms},
+        meta=meta,
+    )
+    if places_info:
+        await get_answer_cache().store(
+            resolved_address, body.query, body.llm_model, response.model_dump()
+        )
+    return response
+
+
+@app.post("/v1/guide/query", response_model=GuideResponse)
+async def guide_query(body: GuideQuery):
+    t0 = time.perf_counter()
+    _require_location(body)
+
+    lat, lng, resolved_address = await _resolve_address(body)
+
+    cached = await _cached_answer(body, resolved_address, t0)
+    if cached is not None:
+        return cached
+
+    collected, reference_link, places_info, place_status = await _collect_context(
+        body, resolved_address
+    )
+
+    answer = await run_chain(body.query, collected, model_name=body.llm_model)
+    elapsed_ms = int((time.perf_counter() - t0) * 1000)
+
+    return await _finish_response(
+        body,
+        lat,
+        lng,
+        resolved_address,
+        answer,
+        reference_link,
+        places_info,
+        {"elapsed_ms": elapsed_ms, "places": place_status},
+    )
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+# /v1/guide/query의 스트리밍 버전 (Server-Sent Events)
+# event: center {"center", "resolved_address"} → 위치 해석 직후 (지도 이동)
+# event: place  {"idx", "place", "status", "info", "sources"} → 장소별 수집이 끝나는 대로
+# event: token  {"text": 답변 조각}  → 생성되는 대로 전송
+# event: done   GuideResponse       → sources / places / center / meta(elapsed_ms, first_place_ms, ttft_ms)
+# event: error  {"detail": 메시지}
+@app.post("/v1/guide/query/stream")
+async def guide_query_stream(body: GuideQuery):
+    t0 = time.perf_counter()
+    _require_location(body)
+
+    async def _events():
+        try:
+            lat, lng, resolved_address = await _resolve_address(body)
+            if lat is not None and lng is not None:
+                yield _sse(
+                    "center",
+                    {"center": {"lat": lat, "lng": lng}, "resolved_address": resolved_address},
+                )
+
+            cached = await _cached_answer(body, resolved_address, t0)
+            if cached is not None:
+                yield _sse("token", {"text": cached.answer})
+                yield _sse("done", cached.model_dump())
+                return
+
+            # 장소 카드/마커는 LLM 답변을 기다리지 않고 장소별로 먼저 보냄
+            place_list = await _search_places(body, resolved_address)
+            results = []
+            first_place_ms = None
+            async for res in iter_place_contexts(
+                place_list, resolved_address, **_context_params(body, place_list)
+            ):
+                results.append(res)
+                if first_place_ms is None:
+                    first_place_ms = int((time.perf_counter() - t0) * 1000)
+                yield _sse(
+                    "place",
+                    {
+                        "idx": res.idx,
+                        "place": res.place,
+                        "status": res.status,
+                        "info": res.info or None,
+                        "sources": res.refs,
+                    },
+                )
+            collected, reference_link, places_info, place_status = assemble_context(results)
+
+            parts = []
+            ttft_ms = None
+            async for token in stream_chain(body.query, collected, model_name=body.llm_model):
+                if ttft_ms is None:
+                    ttft_ms = int((time.perf_counter() - t0) * 1000)
+                parts.append(token)
+                yield _sse("token", {"text": token})
+
+            elapsed_ms = int((time.perf_counter() - t0) * 1000)
+            response = await _finish_response(
+                body,
+                lat,
+                lng,
+                resolved_address,
+                "".join(parts),
+                reference_link,
+                places_info,
+                {
+                    "elapsed_ms": elapsed_ms,
+                    "first_place_ms": first_place_ms,
+                    "ttft_ms": ttft_ms,
+                    "places": place_status,
+                },
+            )
+            yield _sse("done", response.model_dump())
+        except Exception as e:
+            print(f"스트리밍 응답 실패: {e}")
+            yield _sse("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -34,6 +34,7 @@ class PlaceInfo(BaseModel):
     link: str
     lat: float
     lng: float
+    images: List[str] = []
 
 
 class GuideResponse(BaseModel):
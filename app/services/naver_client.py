@@ -1,6 +1,7 @@
 import httpx
 from typing import Dict, Literal
 from ..config import settings
+from ..utils.http_pool import get_async_client
 
 BASE = "https://openapi.naver.com/v1/search"
 
@@ -19,16 +20,16 @@ class NaverClient:
         self.timeout = timeout
 
     async def _get(self, url: str, params: Dict):
-        async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-            r = await client.get(url, params=params)
-            if r.status_code == 401:
-                detail = r.text
-                raise httpx.HTTPStatusError(
-                    f"Naver API 401 Unauthorized: {detail}",
-                    request=r.request, response=r
-                )
-            r.raise_for_status()
-            return r.json()
+        client = get_async_client("naver_openapi")
+        r = await client.get(url, params=params, headers=self.headers, timeout=self.timeout)
+        if r.status_code == 401:
+            detail = r.text
+            raise httpx.HTTPStatusError(
+                f"Naver API 401 Unauthorized: {detail}",
+                request=r.request, response=r
+            )
+        r.raise_for_status()
+        return r.json()
 
     async def search_web(self, query: str, display: int = 10, start: int = 1):
         return await self._get(f"{BASE}/webkr.json",
@@ -1,7 +1,10 @@
 from typing import List, Dict, Optional
-import re, os, logging
+import re, logging
 from urllib.parse import urlparse
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
+from playwright.async_api import TimeoutError as PWTimeoutError
+
+from app.utils.browser_pool import get_browser_pool
+from app.utils.page_wait import wait_for_dom_quiet
 
 UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
       "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36")
@@ -55,13 +58,30 @@ async def _entry_frame(page, timeout_ms: int):
 async def _wait_main_root(frame, timeout_ms: int):
     await frame.wait_for_selector("#place-main-section-root", timeout=timeout_ms)
 
+_AT_BOTTOM_JS = """
+() => {
+  const el = document.scrollingElement || document.documentElement;
+  return el.scrollTop + window.innerHeight >= el.scrollHeight - 4;
+}
+"""
+
 async def _scroll_lazy(frame, steps: int = 18, dy: int = 1500, delay_ms: int = 240):
     for _ in range(steps):
         try:
-            await frame.mouse.wheel(0, dy)
+            # Frame에는 mouse가 없음 → iframe이면 스크립트로 스크롤
+            if hasattr(frame, "mouse"):
+                await frame.mouse.wheel(0, dy)
+            else:
+                await frame.evaluate("(dy) => window.scrollBy(0, dy)", dy)
+        except Exception:
+            pass
+        # 지연 로딩 이미지가 붙는 동안만 대기, 변화 없으면 바로 다음 스크롤
+        await wait_for_dom_quiet(frame, 60, delay_ms, label="place_photos")
+        try:
+            if await frame.evaluate(_AT_BOTTOM_JS):
+                break
         except Exception:
             pass
-        await frame.wait_for_timeout(delay_ms)
 
 async def _click_photo_tab_if_possible(frame, timeout_ms: int):
     try:
@@ -69,7 +89,7 @@ async def _click_photo_tab_if_possible(frame, timeout_ms: int):
         if tab:
             await tab.click()
             await frame.wait_for_selector("#place-main-section-root", timeout=timeout_ms)
-            await frame.wait_for_timeout(600)
+            await wait_for_dom_quiet(frame, 100, 600, label="place_photos")
     except Exception:
         pass
 
@@ -236,64 +256,29 @@ async def fetch_place_details(
     if not url_or_search:
         return {"photos_top": [], "source": None, "picked_place_url": None}
 
-    headless = os.getenv("HEADLESS", "1") != "0"
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-        context = await browser.new_context(
-            user_agent=UA,
-            locale="ko-KR",
-            java_script_enabled=True,
-            bypass_csp=True,
-            ignore_https_errors=True,
-            viewport={"width": 1366, "height": 900},
-        )
-
-        await context.add_init_script("""
-          Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-          window.chrome = { runtime: {} };
-          const originalQuery = window.navigator.permissions.query;
-          window.navigator.permissions.query = (parameters) =>
-            parameters.name === 'notifications'
-              ? Promise.resolve({ state: Notification.permission })
-              : originalQuery(parameters);
-          Object.defineProperty(navigator, 'plugins', {get: () => [1,2,3,4,5]});
-          Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR','ko']});
-        """)
-
-        page = await context.new_page()
+    async with get_browser_pool().page("desktop") as page:
         picked_place_url: Optional[str] = None
         photos: List[str] = []
 
-        try:
-            await page.goto(url_or_search, timeout=timeout_ms, wait_until="domcontentloaded")
-
-            target = url_or_search
-            if not _RX_PLACE_HREF.search(url_or_search):
-                # 검색 → 첫 번째 플레이스 상세 찾기
-                cand = await _find_first_place_link(page)
-                if not cand:
-                    for _ in range(14):
-                        await page.mouse.wheel(0, 1400)
-                        await page.wait_for_timeout(220)
-                    cand = await _find_first_place_link(page)
-                if cand:
-                    target = cand
+        await page.goto(url_or_search, timeout=timeout_ms, wait_until="domcontentloaded")
 
-            picked_place_url = target
-            if picked_place_url:
-                photos = await _go_photo_then_collect(page, picked_place_url, limit, timeout_ms, mode=mode)
-
-        finally:
-            await context.close()
-            await browser.close()
+        target = url_or_search
+        if not _RX_PLACE_HREF.search(url_or_search):
+            # 검색 → 첫 번째 플레이스 상세 찾기
+            cand = await _find_first_place_link(page)
+            if not cand:
+                for _ in range(14):
+                    await page.mouse.wheel(0, 1400)
+                    await wait_for_dom_quiet(page, 60, 220, label="place_photos")
+                    cand = await _find_first_place_link(page)
+                    if cand:
+                        break
+            if cand:
+                target = cand
+
+        picked_place_url = target
+        if picked_place_url:
+            photos = await _go_photo_then_collect(page, picked_place_url, limit, timeout_ms, mode=mode)
 
     return {
         "photos_top": photos[:limit],
@@ -1,9 +1,10 @@
 import re
 import urllib.parse
-import httpx
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 
+from app.utils.http_pool import get_async_client
+
 UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
@@ -93,19 +94,19 @@ async def fetch_search_panel_info(
         "https://search.naver.com/search.naver"
         f"?where=nexearch&sm=top_hty&query={urllib.parse.quote(q)}"
     )
-    async with httpx.AsyncClient(headers=HDRS, timeout=timeout, follow_redirects=True) as s:
-        r = await s.get(url)
-        if r.status_code != 200:
-            return {
-                "query": q,
-                "address": None,
-                "business_hours": None,
-                "phone": None,
-                "amenities": None,
-                "way": None,
-                "photos": [],
-                "source": url,
-            }
+    s = get_async_client("naver_web")
+    r = await s.get(url, headers=HDRS, timeout=timeout)
+    if r.status_code != 200:
+        return {
+            "query": q,
+            "address": None,
+            "business_hours": None,
+            "phone": None,
+            "amenities": None,
+            "way": None,
+            "photos": [],
+            "source": url,
+        }
 
     soup = BeautifulSoup(r.text, "html.parser")
     panel = _panel_root(soup)
@@ -1,7 +1,7 @@
-from typing import List, Dict
-from langchain_openai import ChatOpenAI
+import time
+from typing import AsyncIterator, Dict, List
 from langchain.schema import HumanMessage, SystemMessage
-from ..config import settings
+from app.utils.llm_pool import get_llm_registry
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,9 +20,9 @@ SYSTEM_PROMPT = f"""당신은 여행 가이드입니다.
 주 언어는 한국어를 사용하시고, 존댓말로 답변해주세요.
 
 추가로 장소를 소개하면서 대표 이미지 3개를 같이 출력해주고 싶어요. Place의 ### 이미지 개수 만큼 출력해주세요. 이미지가 없는 경우에는 생략해주세요.
-이미지 출력시 상대 경로를 사용해주세요. 각 장소의 이미지는 ./images/Place_장소번호_1.jpg, ./images/Place_장소번호_2.jpg, ./images/Place_장소번호_3.jpg 형식으로 저장되어 있습니다.(ex: ./images/Place_1_1.jpg, ./images/Place_1_2.jpg, ./images/Place_1_3.jpg).
-브라우저 캐싱을 방지하기 위해 각 이미지 URL에 ?t=타임스탬프 쿼리 파라미터를 추가해주세요.
-"### 장소 이름" 바로 다음 줄에 가로로 나란히(줄바꿈 없이 : ![이미지1](이미지1 경로?t=timestamp) ![이미지2](이미지2 경로?t=timestamp) ![이미지3](이미지3 경로?t=timestamp)) 이미지들을 출력해주세요.
+이미지 출력시 상대 경로를 사용해주세요. 각 장소의 이미지 경로는 Place의 ### 이미지 항목에 공백으로 구분되어 주어집니다.(ex: ./images/3f9a0c...e1.jpg). 경로를 바꾸거나 지어내지 말고 그대로 사용해주세요.
+이미지 경로에 쿼리 파라미터(?t= 등)를 붙이지 마세요.
+"### 장소 이름" 바로 다음 줄에 가로로 나란히(줄바꿈 없이 : ![이미지1](이미지1 경로) ![이미지2](이미지2 경로) ![이미지3](이미지3 경로)) 이미지들을 출력해주세요.
 """
 
 
@@ -34,14 +34,51 @@ USER_PROMPT = """사용자의 요청사항:
 """
 
 
+def _build_messages(user_query: str, context: str):
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        HumanMessage(content=USER_PROMPT.format(user_query=user_query, context=context)),
+    ]
+
+
 async def run_chain(
     user_query: str, context: str, model_name: str = "gpt-4.1-2025-04-14"
 ) -> str:
-    llm = ChatOpenAI(api_key=settings.openai_api_key, model=model_name, temperature=0.1)
-    ctx = context
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=USER_PROMPT.format(user_query=user_query, context=ctx)),
-    ]
-    resp = await llm.ainvoke(messages)
+    resp = await get_llm_registry().ainvoke(
+        _build_messages(user_query, context), model=model_name, temperature=0.1
+    )
     return resp.content
+
+
+# 스트리밍 호출의 첫 토큰까지 걸린 시간 (LLM 호출 시작 기준)
+_stream_stats = {"streams": 0, "ttft_total_ms": 0.0, "ttft_max_ms": 0.0}
+
+
+def get_stream_stats() -> Dict[str, int]:
+    n = _stream_stats["streams"]
+    return {
+        "streams": n,
+        "ttft_avg_ms": int(_stream_stats["ttft_total_ms"] / n) if n else 0,
+        "ttft_max_ms": int(_stream_stats["ttft_max_ms"]),
+    }
+
+
+async def stream_chain(
+    user_query: str, context: str, model_name: str = "gpt-4.1-2025-04-14"
+) -> AsyncIterator[str]:
+    """run_chain의 스트리밍 버전: 답변 토큰(조각)을 생성되는 대로 yield"""
+    registry = get_llm_registry()
+    llm = registry.get(model_name, temperature=0.1)
+    async with registry.slot(model_name):
+        t0 = time.perf_counter()
+        first = True
+        async for chunk in llm.astream(_build_messages(user_query, context)):
+            if not chunk.content:
+                continue
+            if first:
+                first = False
+                ttft = (time.perf_counter() - t0) * 1000
+                _stream_stats["streams"] += 1
+                _stream_stats["ttft_total_ms"] += ttft
+                _stream_stats["ttft_max_ms"] = max(_stream_stats["ttft_max_ms"], ttft)
+            yield chunk.content
@@ -1,24 +1,29 @@
 import sys
 import os
 import math
+import time
 import asyncio
-from typing import List, Tuple, Dict, Any
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, List, Tuple, Dict, Any, Optional
+from urllib.parse import urlparse
 
 sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
 from app.utils.Context_Enhance.Naver_blog_text_gatter import (
-    _pick_body_block_requests as extract_blog_body_requests,
+    _pick_body_block_async as extract_blog_body_async,
 )
-from app.utils.Context_Enhance.blog_links import fetch_top_blog_links_async
-from app.utils.Context_Enhance.Place_info import search_places
+from app.utils.Context_Enhance.Place_info import search_places_async
 from app.utils.Context_Enhance.get_place_pid import get_place_pid_async
-from app.utils.Context_Enhance.reviews_crawling import crawl_reviews_text_async
+from app.utils.Context_Enhance.place_session import crawl_place_session_async
 from app.utils.Context_Enhance.Place_Image import fetch_and_save_images
-from app.utils.Context_Enhance.Blog_text_mining import refine_multiple_blogs_async
-from app.utils.geo import geocode_address
-from app.utils.cache_util import load_cache, save_cache
+from app.utils.Context_Enhance.Blog_text_mining import get_blog_refiner
+from app.utils.geo import geocode_address_async
+from app.utils.cache_util import load_cache_entry_async, save_cache_async
+from app.utils.image_store import get_image_store
+from app.utils.stage_cache import cached_stage, load_stage, record_stage, save_stage
+from app.utils.single_flight import get_single_flight, single_flight
 
 from dotenv import load_dotenv
 
@@ -27,101 +32,301 @@ load_dotenv()
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
+BLOG_FETCH_PER_HOST = int(os.getenv("BLOG_FETCH_PER_HOST", "4"))
+BLOG_FETCH_TIMEOUT = float(os.getenv("BLOG_FETCH_TIMEOUT", "6"))
+# single(기본): 블로그마다 본문이 도착하는 대로 정제 → 수집과 정제가 겹쳐서 지연이 가장 짧음
+# batch: 장소의 블로그 본문을 다 받은 뒤 LLM 한 번으로 정제 → 호출 수·프롬프트 토큰은 줄지만
+#        가장 느린 본문을 기다린 뒤에야 정제가 시작되므로 장소당 지연은 늘어남
+BLOG_REFINE_MODE = os.getenv("BLOG_REFINE_MODE", "single")
+
+# 장소 컨텍스트 캐시: soft TTL이 지나면 캐시를 바로 주고 백그라운드에서 갱신,
+# hard TTL이 지나면(캐시 만료) 요청이 직접 크롤링을 기다림
+PLACE_CTX_SOFT_TTL = int(os.getenv("PLACE_CTX_SOFT_TTL", str(6 * 3600)))
+PLACE_CTX_HARD_TTL = int(os.getenv("PLACE_CTX_HARD_TTL", str(3 * 24 * 3600)))
+
+# 백그라운드 갱신 task 참조 유지 (GC로 중간에 사라지지 않도록)
+_refresh_tasks: set = set()
+
+# 블로그 호스트별 동시 요청 제한 (m.blog.naver.com에 한꺼번에 몰리지 않도록)
+_host_sems: Dict[str, asyncio.Semaphore] = {}
+
+
+def _host_semaphore(url: str) -> asyncio.Semaphore:
+    host = urlparse(url).hostname or ""
+    sem = _host_sems.get(host)
+    if sem is None:
+        sem = _host_sems[host] = asyncio.Semaphore(BLOG_FETCH_PER_HOST)
+    return sem
+
+
+async def _fetch_and_refine_blog(
+    blog_link: str, place_name: str, user_query: str, refine: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    블로그 하나의 본문을 받아서 곧바로 정제까지 진행.
+    BLOG_FETCH_TIMEOUT 안에 본문이 안 오면 버림 (장소 전체가 기다리지 않도록)
+    """
+    blog_link = blog_link.strip()
+
+    async def _fetch_body() -> Dict[str, str]:
+        async with _host_semaphore(blog_link):
+            body = await asyncio.wait_for(
+                extract_blog_body_async(blog_link), timeout=BLOG_FETCH_TIMEOUT
+            )
+        # html은 크기만 크고 쓰지 않으므로 캐시에서 제외
+        return {"title": body.get("title", ""), "text": body.get("text", "")}
+
+    try:
+        body = await cached_stage(
+            "blog_body", blog_link, _fetch_body, valid=lambda b: bool(b and b.get("text"))
+        )
+    except asyncio.TimeoutError:
+        print(f"블로그 추출 시간 초과: {blog_link}")
+        return None
+    except Exception as e:
+        print(f"블로그 추출 실패: {blog_link}, {e}")
+        return None
+
+    blog = {
+        "text": body.get("text", ""),
+        "url": blog_link,
+        "title": body.get("title", "블로그") or "블로그",
+    }
+    if refine and blog["text"]:
+        # refine_blog_content는 실패 시 원본 앞부분을 돌려줌
+        t0 = time.perf_counter()
+        blog["text"] = await get_blog_refiner().refine_blog_content(
+            blog["text"], place_name, user_query, max_length=1024
+        )
+        record_stage("refine", t0)
+    return blog
+
+
+async def _refine_blogs_batched(
+    blogs: List[Dict[str, Any]], place_name: str, user_query: str
+) -> None:
+    """장소의 블로그들을 배치 정제해서 text를 제자리에서 교체"""
+    targets = [b for b in blogs if b["text"]]
+    if not targets:
+        return
+    t0 = time.perf_counter()
+    refined = await get_blog_refiner().refine_blogs_batched(
+        [{"url": b["url"], "text": b["text"], "place": place_name} for b in targets],
+        user_query,
+        max_length_per_blog=1024,
+    )
+    record_stage("refine", t0)
+    for blog in targets:
+        blog["text"] = refined.get(blog["url"], blog["text"])
+
+
+def _images_available(image_ids: List[str]) -> bool:
+    store = get_image_store()
+    # lookup은 mtime을 갱신 → 자주 쓰는 장소의 이미지가 GC에서 먼저 지워지지 않음
+    return bool(image_ids) and all(store.lookup(i) for i in image_ids)
+
+
+async def _search_place(place_query: str) -> Optional[Dict[str, Any]]:
+    results = await search_places_async(place_query, display=1)
+    if len(results) != 1:
+        return None
+    return asdict(results[0])
+
+
+async def _fetch_image_ids(place_query: str, image_limit: int) -> List[str]:
+    images, _ = await fetch_and_save_images(place_query, skip=2, limit=image_limit)
+    return images
+
+
+async def _geocode(road_address: str) -> List[Any]:
+    lat, lng = await geocode_address_async(road_address)
+    return [lat, lng]
+
+
+async def _reviews_and_blog_links(
+    pid: str, review_batches: int, blog_top_k: int, force: bool = False
+) -> Tuple[List[str], List[str]]:
+    # 같은 pid 세션을 동시에 여러 번 열지 않도록 합침
+    return await single_flight(
+        f"session::{pid}::b{review_batches}::k{blog_top_k}",
+        lambda: _load_or_crawl_session(pid, review_batches, blog_top_k, force),
+    )
+
+
+async def _load_or_crawl_session(
+    pid: str, review_batches: int, blog_top_k: int, force: bool = False
+) -> Tuple[List[str], List[str]]:
+    """
+    리뷰/블로그 링크는 같은 페이지 세션에서 같이 수집하므로 캐시도 같이 확인.
+    둘 중 캐시에 없는 쪽만 크롤링 (둘 다 있으면 브라우저를 열지 않음)
+    force=True면 캐시를 무시하고 둘 다 다시 수집 (백그라운드 갱신용)
+    """
+    reviews_key = f"{pid}::b{review_batches}"
+    links_key = f"{pid}::k{blog_top_k}"
+    reviews = blog_links = None
+    if not force:
+        reviews = await load_stage("reviews", reviews_key) if review_batches > 0 else []
+        blog_links = await load_stage("blog_links", links_key) if blog_top_k > 0 else []
+    t0 = time.perf_counter()
+    if reviews is not None and blog_links is not None:
+        record_stage("session", t0, hit=True)
+        return reviews, blog_links
+
+    session = await crawl_place_session_async(
+        pid,
+        review_batches=review_batches if reviews is None else 0,
+        blog_top_k=blog_top_k if blog_links is None else 0,
+    )
+    record_stage("session", t0)
+    if reviews is None:
+        reviews = session.reviews
+        if reviews:
+            await save_stage("reviews", reviews_key, reviews)
+    if blog_links is None:
+        blog_links = session.blog_links
+        if blog_links:
+            await save_stage("blog_links", links_key, blog_links)
+    return reviews, blog_links
+
 
 async def _gather_place_context(
     place_query: str,
-    images_dir: str,
     place_num: int,
     blog_top_k: int,
     review_batches: int,
     image_limit: int,
     user_query: str = "",
     enable_blog_refinement: bool = True,
-) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    (컨텍스트, 참고 링크, 장소 정보, 캐시 상태) 반환.
+    캐시 상태: fresh(soft TTL 이내) / stale(soft~hard TTL, 백그라운드 갱신 예약) / live(직접 크롤링)
+    """
     cache_key = (
         f"place_ctx::{place_query}::k{blog_top_k}::b{review_batches}::i{image_limit}::refine{enable_blog_refinement}::q{user_query[:50] if user_query else 'none'}"
     )
-    cached = load_cache(cache_key)
-    if cached:
-        # 캐시에 의존하기 전에 실제 이미지가 존재하는지 확인
-        save_prefix = f"Place_{place_num}_"
-        try:
-            has_files = any(
-                fn.startswith(save_prefix) and fn.endswith((".jpg", ".jpeg", ".png"))
-                for fn in os.listdir(images_dir)
-            )
-        except Exception:
-            has_files = False
-        if has_files:
-            return cached
 
-    pid = await get_place_pid_async(place_query)
+    def _crawl(refresh: bool = False):
+        return _crawl_place_context(
+            cache_key,
+            place_query,
+            place_num,
+            blog_top_k,
+            review_batches,
+            image_limit,
+            user_query,
+            enable_blog_refinement,
+            refresh,
+        )
+
+    entry = await load_cache_entry_async(cache_key)
+    # 캐시에 의존하기 전에 참조하는 이미지가 저장소에 남아있는지 확인 (GC로 지워졌을 수 있음)
+    if entry and entry.value and _images_available(entry.value[2].get("images", [])):
+        ctx, refs, pinfo = entry.value
+        if time.time() - entry.created_at < PLACE_CTX_SOFT_TTL:
+            return ctx, refs, pinfo, "fresh"
+        # 같은 키의 크롤링/갱신이 이미 돌고 있으면 새로 예약하지 않음
+        if not get_single_flight().is_inflight(cache_key):
+            task = asyncio.create_task(single_flight(cache_key, lambda: _crawl(True)))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_on_refresh_done)
+        return ctx, refs, pinfo, "stale"
+
+    # 같은 장소·같은 질문이 동시에 들어오면 크롤링은 한 번만 하고 결과(예외 포함)를 공유
+    ctx, refs, pinfo = await single_flight(cache_key, _crawl)
+    return ctx, refs, pinfo, "live"
+
+
+async def wait_for_refreshes() -> None:
+    """예약된 백그라운드 갱신이 모두 끝날 때까지 대기 (warm-up 등 프로세스 종료 전)"""
+    while _refresh_tasks:
+        await asyncio.gather(*list(_refresh_tasks), return_exceptions=True)
+
+
+def _on_refresh_done(task: asyncio.Task) -> None:
+    _refresh_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"장소 컨텍스트 백그라운드 갱신 실패: {task.exception()}")
+
+
+async def _crawl_place_context(
+    cache_key: str,
+    place_query: str,
+    place_num: int,
+    blog_top_k: int,
+    review_batches: int,
+    image_limit: int,
+    user_query: str,
+    enable_blog_refinement: bool,
+    refresh: bool = False,
+) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+    """refresh=True(백그라운드 갱신)면 자주 바뀌는 리뷰/블로그 링크는 캐시를 건너뛰고 다시 수집"""
+    # 아래 단계들은 user_query와 무관 → 단계별 캐시로 다른 질문 간에도 재사용
+    pid = await cached_stage("pid", place_query, lambda: get_place_pid_async(place_query))
     if pid is None:
         return ("", [], {})
 
-    results = search_places(place_query, display=1)
-    if len(results) != 1:
+    place = await cached_stage("place", place_query, lambda: _search_place(place_query))
+    if place is None:
         return ("", [], {})
 
-    images, _ = await fetch_and_save_images(
-        place_query,
-        skip=2,
-        limit=image_limit,
-        save_name=f"Place_{place_num}",
-        save_dir=images_dir,
+    images = await cached_stage(
+        "images",
+        f"{place_query}::i{image_limit}",
+        lambda: _fetch_image_ids(place_query, image_limit),
+        valid=_images_available,
     )
+    image_paths = [f"./images/{image_id}.jpg" for image_id in images]
 
-    lat, lng = geocode_address(results[0].roadAddress)
+    lat, lng = await cached_stage(
+        "geocode",
+        place["roadAddress"] or "",
+        lambda: _geocode(place["roadAddress"]),
+        valid=lambda v: bool(v) and v[0] is not None,
+    )
     place_info = {
-        "title": results[0].title,
-        "category": results[0].category,
-        "telephone": results[0].telephone,
-        "address": results[0].address,
-        "roadAddress": results[0].roadAddress,
-        "link": results[0].link,
+        "title": place["title"],
+        "category": place["category"],
+        "telephone": place["telephone"],
+        "address": place["address"],
+        "roadAddress": place["roadAddress"],
+        "link": place["link"],
         "lat": lat,
         "lng": lng,
+        "images": image_paths,
     }
 
     ctx = []
-    ctx.append(f"# Place {place_num}\n### 장소 이름: {results[0].title}\n")
-    ctx.append(f"### 카테고리: {results[0].category}\n")
-    ctx.append(f"### 전화: {results[0].telephone}\n")
-    ctx.append(f"### 도로명주소: {results[0].roadAddress}\n")
-    ctx.append(f"### 링크: {results[0].link}\n")
-    ctx.append(f"### 이미지 개수: {len(images)}\n\n")
+    ctx.append(f"# Place {place_num}\n### 장소 이름: {place['title']}\n")
+    ctx.append(f"### 카테고리: {place['category']}\n")
+    ctx.append(f"### 전화: {place['telephone']}\n")
+    ctx.append(f"### 도로명주소: {place['roadAddress']}\n")
+    ctx.append(f"### 링크: {place['link']}\n")
+    ctx.append(f"### 이미지 개수: {len(images)}\n")
+    ctx.append(f"### 이미지: {' '.join(image_paths)}\n\n")
 
     reference_link: List[Dict[str, Any]] = []
-    blog_links = await fetch_top_blog_links_async(pid, top_k=blog_top_k, headless=True)
-    
-    # 블로그 내용 수집
-    blog_contents = []
-    for blog_link in blog_links:
-        try:
-            body = extract_blog_body_requests(blog_link.strip())
-            blog_title = body.get("title", "블로그") or "블로그"
-            blog_contents.append({
-                "text": body.get("text", ""),
-                "url": blog_link,
-                "title": blog_title
-            })
-        except Exception as e:
-            print(f"블로그 추출 실패: {blog_link}, {e}")
-            continue
-    
-    # 블로그 정제 (ChatGPT 사용)
-    if enable_blog_refinement and blog_contents and user_query:
-        try:
-            refined_blogs = await refine_multiple_blogs_async(
-                blog_contents, 
-                place_name=results[0].title,
-                query=user_query,
-                max_length_per_blog=1024
+    # 리뷰 + 블로그 링크를 한 페이지 세션에서 같이 수집 (캐시에 없는 것만)
+    reviews, blog_links = await _reviews_and_blog_links(
+        pid, review_batches, blog_top_k, force=refresh
+    )
+
+    # 블로그 본문 수집 + 정제 (ChatGPT 사용)
+    # single 모드는 블로그별로 도착하는 대로 정제, batch 모드는 본문을 다 받은 뒤 한 번에 정제
+    refine = enable_blog_refinement and bool(user_query)
+    batch_refine = refine and BLOG_REFINE_MODE == "batch"
+    fetched = await asyncio.gather(
+        *[
+            _fetch_and_refine_blog(
+                link, place["title"], user_query, refine and not batch_refine
             )
-            blog_contents = refined_blogs
-        except Exception as e:
-            print(f"블로그 정제 실패, 원본 사용: {e}")
-    
+            for link in blog_links
+        ]
+    )
+    blog_contents = [b for b in fetched if b is not None]
+    if batch_refine:
+        await _refine_blogs_batched(blog_contents, place["title"], user_query)
+
     # 정제된 블로그 내용을 컨텍스트에 추가
     for idx, blog in enumerate(blog_contents, 1):
         ctx.append(f"## Place {place_num}'s Blog {idx}\n###블로그 링크: {blog['url']}\n")
@@ -131,27 +336,28 @@ async def _gather_place_context(
             {"title": blog['title'], "url": blog['url'], "type": "blog", "score": 0.0}
         )
 
-    reviews = await crawl_reviews_text_async(pid, headless=True, batches=review_batches)
     for i, review in enumerate(reviews, 1):
         ctx.append(f"## Place {place_num}'s Reviews {i}\n### 리뷰 내용: {review}\n\n\n")
 
     context_text = "".join(ctx)
     payload = (context_text, reference_link, place_info)
     # 이미지가 비었으면 캐시 저장 스킵 → 다음 요청에서 재수집 유도
-    try:
-        img_prefix = f"Place_{place_num}_"
-        has_files = any(
-            fn.startswith(img_prefix) and fn.endswith((".jpg", ".jpeg", ".png"))
-            for fn in os.listdir(images_dir)
-        )
-    except Exception:
-        has_files = False
-    if has_files:
-        save_cache(cache_key, payload)
+    if _images_available(images):
+        await save_cache_async(cache_key, payload, ttl=PLACE_CTX_HARD_TTL)
     return payload
 
 
-async def build_context(
+@dataclass
+class PlaceContextResult:
+    idx: int  # places 안에서의 순서 (1부터, 컨텍스트의 Place 번호)
+    place: str
+    status: str  # fresh | stale | live | error
+    context: str = ""
+    refs: List[Dict[str, Any]] = field(default_factory=list)
+    info: Dict[str, Any] = field(default_factory=dict)
+
+
+async def iter_place_contexts(
     places: List[str],
     address: str,
     blog_top_k: int = 3,
@@ -160,59 +366,85 @@ async def build_context(
     max_concurrency: int = 3,
     user_query: str = "",
     enable_blog_refinement: bool = True,
-):
-    # 기존 이미지 파일들 정리 (새 요청 시마다)
-    # 절대 경로 사용
-    current_dir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    )
-    images_dir = os.path.join(current_dir, "images")
-
-    if os.path.exists(images_dir):
-        files_to_delete = []
-        for filename in os.listdir(images_dir):
-            if filename.endswith((".jpg", ".jpeg", ".png")):
-                files_to_delete.append(filename)
-
-        for filename in files_to_delete:
-            try:
-                file_path = os.path.join(images_dir, filename)
-                os.remove(file_path)
-            except Exception as e:
-                print(f"이미지 파일 삭제 실패: {filename}, {e}")
-    else:
-        print("images 디렉토리가 존재하지 않습니다.")
-
-    Place_Num = 1
-    all_ctx_parts: List[str] = []
-    all_refs: List[Dict[str, Any]] = []
-    places_info: List[Dict[str, Any]] = []
-
+) -> AsyncIterator[PlaceContextResult]:
+    """
+    장소별 컨텍스트를 끝나는 순서대로 yield (느린 장소 하나가 나머지를 붙잡지 않도록).
+    중간에 그만 받으면(aclose) 남은 수집 작업은 취소됨
+    """
+    # 이미지는 원본 URL 해시로 저장되므로 요청마다 images/를 비우지 않음
+    # (용량 관리는 image_store의 LRU GC가 담당)
     sem = asyncio.Semaphore(max_concurrency)
 
-    async def _task_wrapper(place_name: str, idx: int):
+    async def _task_wrapper(place_name: str, idx: int) -> PlaceContextResult:
         async with sem:
             q = f"{address} {place_name}"
-            ctx, refs, pinfo = await _gather_place_context(
-                q, images_dir, idx, blog_top_k, review_batches, image_limit, user_query, enable_blog_refinement
-            )
-            return (ctx, refs, pinfo)
+            try:
+                ctx, refs, pinfo, status = await _gather_place_context(
+                    q, idx, blog_top_k, review_batches, image_limit, user_query, enable_blog_refinement
+                )
+            except Exception as e:
+                print(f"장소 컨텍스트 수집 실패: {place_name}, {e}")
+                return PlaceContextResult(idx, place_name, "error")
+            return PlaceContextResult(idx, place_name, status, ctx, refs or [], pinfo or {})
 
     tasks = [
         asyncio.create_task(_task_wrapper(place, i))
         for i, place in enumerate(places, start=1)
     ]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
 
-    for res in results:
-        if isinstance(res, Exception):
-            continue
-        ctx, refs, pinfo = res
-        if not ctx:
+
+def assemble_context(
+    results: List[PlaceContextResult],
+) -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, str]]]:
+    """장소별 결과를 places 순서로 합쳐서 build_context와 같은 형태로 반환"""
+    all_ctx_parts: List[str] = []
+    all_refs: List[Dict[str, Any]] = []
+    places_info: List[Dict[str, Any]] = []
+    place_status: List[Dict[str, str]] = []
+
+    for res in sorted(results, key=lambda r: r.idx):
+        place_status.append({"place": res.place, "status": res.status})
+        if not res.context:
             continue
-        all_ctx_parts.append(ctx)
-        all_refs.extend(refs)
-        if pinfo:
-            places_info.append(pinfo)
+        all_ctx_parts.append(res.context)
+        all_refs.extend(res.refs)
+        if res.info:
+            places_info.append(res.info)
+
+    return "".join(all_ctx_parts), all_refs, places_info, place_status
+
 
-    return "".join(all_ctx_parts), all_refs, places_info
+async def build_context(
+    places: List[str],
+    address: str,
+    blog_top_k: int = 3,
+    review_batches: int = 2,
+    image_limit: int = 3,
+    max_concurrency: int = 3,
+    user_query: str = "",
+    enable_blog_refinement: bool = True,
+):
+    """
+    (전체 컨텍스트, 참고 링크, 장소 정보 목록, 장소별 캐시 상태) 반환.
+    장소별 캐시 상태는 [{"place": 이름, "status": fresh|stale|live|error}]
+    """
+    results = [
+        res
+        async for res in iter_place_contexts(
+            places,
+            address,
+            blog_top_k,
+            review_batches,
+            image_limit,
+            max_concurrency,
+            user_query,
+            enable_blog_refinement,
+        )
+    ]
+    return assemble_context(results)
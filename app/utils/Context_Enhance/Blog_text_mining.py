@@ -1,18 +1,119 @@
 import os
+import re
+import json
+import math
 import asyncio
-from typing import Dict, List, Optional
-from langchain_openai import ChatOpenAI
+from typing import Any, Dict, List, Optional
 from langchain_core.messages import HumanMessage, SystemMessage
-from app.config import settings
+from app.utils.llm_pool import get_llm_registry
+
+# 배치 정제: 요청 하나의 추정 토큰 상한 (프롬프트 + 입력 본문 + 최대 출력, 넘으면 배치를 나눔)
+BLOG_REFINE_BATCH_TOKENS = int(os.getenv("BLOG_REFINE_BATCH_TOKENS", "12000"))
+# 한국어 본문 기준 대략 1.5자 = 1토큰 (tiktoken 없이 보수적으로 추정)
+_CHARS_PER_TOKEN = 1.5
+# 글 하나당 JSON 키/따옴표 등 입력·출력 양쪽에 붙는 토큰
+_ITEM_OVERHEAD_TOKENS = 40
+_RX_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+_RX_URL_PREFIX = re.compile(r"^(https?://)?(www\.|m\.)?")
+
+BATCH_SYSTEM_PROMPT = """당신은 여행 블로그 내용을 정제하는 전문가입니다.
+여러 블로그 글이 JSON 배열로 주어집니다. 각 글마다 다음 원칙에 따라 정제해주세요:
+
+1. **핵심 정보 추출**: 각 글의 "place"(장소명)와 관련된 핵심 정보만 추출
+2. **불필요한 내용 제거**: 개인적인 일상, 광고, 중복된 내용 제거
+3. **한국어**: 한국어로 자연스럽게 작성
+4. **분량**: 글마다 {max_length}자 이내
+5. **글끼리 섞지 않기**: 각 글의 정제 결과에는 그 글의 내용만 사용
+
+반드시 아래 형식의 JSON 객체 하나만 출력하세요. id와 url은 입력 값을 그대로 사용하세요.
+{{"blogs": [{{"id": 입력 id, "url": "입력 url", "text": "정제된 내용"}}]}}
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+def _output_tokens(blog: Dict[str, Any], max_length: int) -> int:
+    """글 하나의 최대 출력 토큰 (정제 본문 max_length자 + url/JSON 키)"""
+    return (
+        math.ceil(max_length / _CHARS_PER_TOKEN)
+        + estimate_tokens(blog.get("url", ""))
+        + _ITEM_OVERHEAD_TOKENS
+    )
+
+
+def _item_tokens(blog: Dict[str, Any], max_length: int) -> int:
+    """글 하나가 요청에 더하는 토큰 (입력 본문 + 최대 출력)"""
+    text_in = blog.get("text", "") + blog.get("url", "") + blog.get("place", "")
+    return estimate_tokens(text_in) + _ITEM_OVERHEAD_TOKENS + _output_tokens(blog, max_length)
+
+
+def _prompt_tokens(query: str, max_length: int) -> int:
+    return estimate_tokens(BATCH_SYSTEM_PROMPT.format(max_length=max_length) + query) + 50
+
+
+def split_batches(
+    blogs: List[Dict[str, Any]],
+    query: str = "",
+    max_length: int = 1024,
+    max_tokens: int = BLOG_REFINE_BATCH_TOKENS,
+) -> List[List[Dict[str, Any]]]:
+    """
+    프롬프트 + 입력 본문 + 글마다 max_length자 출력의 추정 토큰 합이
+    max_tokens를 넘지 않게 순서대로 나눔 (혼자서도 넘는 글은 혼자 한 배치)
+    """
+    base = _prompt_tokens(query, max_length)
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    used = base
+    for blog in blogs:
+        tokens = _item_tokens(blog, max_length)
+        if current and used + tokens > max_tokens:
+            batches.append(current)
+            current, used = [], base
+        current.append(blog)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _normalize_url(url: str) -> str:
+    # 모델이 스킴/m./끝 슬래시를 바꿔서 돌려주는 경우까지 같은 글로 취급
+    return _RX_URL_PREFIX.sub("", url.strip().lower()).rstrip("/")
+
+
+def match_refined(
+    batch: List[Dict[str, Any]], items: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    모델 응답 항목을 입력 글의 url에 대응 → {입력 url: 정제된 내용}
+    id(입력 순서)가 맞으면 id로, 아니면 정규화한 url로 찾음. 못 찾은 항목은 버림
+    """
+    by_url = {_normalize_url(b["url"]): b["url"] for b in batch}
+    refined: Dict[str, str] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        text = str(item.get("text") or "").strip()
+        if not text:
+            continue
+        idx = item.get("id")
+        if isinstance(idx, int) and 0 <= idx < len(batch):
+            url = batch[idx]["url"]
+        else:
+            url = by_url.get(_normalize_url(str(item.get("url") or "")))
+        if url is not None and url not in refined:
+            refined[url] = text
+    return refined
 
 
 class BlogRefiner:
     def __init__(self, model_name: str = "gpt-4o", temperature: float = 0.01):
-        self.llm = ChatOpenAI(
-            model_name=model_name,
-            temperature=temperature,
-            openai_api_key=settings.openai_api_key
-        )
+        # 인스턴스/커넥션 풀과 동시 호출 상한은 llm_pool 레지스트리에서 공유
+        self.model_name = model_name
+        self.temperature = temperature
         
     async def refine_blog_content(
         self, 
@@ -46,7 +147,9 @@ class BlogRefiner:
                 HumanMessage(content=user_prompt)
             ]
             
-            response = await self.llm.ainvoke(messages)
+            response = await get_llm_registry().ainvoke(
+                messages, model=self.model_name, temperature=self.temperature
+            )
             refined_content = response.content.strip()
                 
             return refined_content
@@ -103,6 +206,90 @@ class BlogRefiner:
             return blog_contents
 
 
+    async def _invoke_batch(self, messages: List[Any], max_tokens: int) -> Any:
+        registry = get_llm_registry()
+        llm = registry.get(
+            self.model_name, temperature=self.temperature, max_tokens=max_tokens
+        ).bind(response_format={"type": "json_object"})
+        async with registry.slot(self.model_name):
+            return await llm.ainvoke(messages)
+
+    async def _refine_batch(
+        self, batch: List[Dict[str, Any]], query: str, max_length: int
+    ) -> Dict[str, str]:
+        """배치 하나를 LLM 한 번으로 정제해서 {url: 정제된 내용} 반환 (응답에 없는 글은 빠짐)"""
+        payload = [
+            {"id": i, "url": b["url"], "place": b["place"], "text": b.get("text", "")}
+            for i, b in enumerate(batch)
+        ]
+        user_prompt = f"""사용자의 요청: {query}
+
+다음 블로그 글들을 각각 정제해주세요:
+
+{json.dumps(payload, ensure_ascii=False)}"""
+        messages = [
+            SystemMessage(content=BATCH_SYSTEM_PROMPT.format(max_length=max_length)),
+            HumanMessage(content=user_prompt),
+        ]
+        # 출력 상한: 글마다 max_length자 + JSON 여유 (256 단위로 올려서 인스턴스 수를 줄임)
+        max_tokens = sum(_output_tokens(b, max_length) for b in batch) + 64
+        max_tokens = math.ceil(max_tokens / 256) * 256
+
+        response = await self._invoke_batch(messages, max_tokens)
+        finish = (getattr(response, "response_metadata", None) or {}).get("finish_reason")
+        if finish == "length":
+            # 출력이 잘리면 JSON이 깨지므로 배치 전체를 실패로 처리 (글별 정제로 재시도)
+            raise ValueError("출력 토큰 상한에 걸려 응답이 잘림")
+
+        raw = _RX_JSON_FENCE.sub("", response.content.strip())
+        return match_refined(batch, json.loads(raw).get("blogs", []))
+
+    async def refine_blogs_batched(
+        self,
+        blogs: List[Dict[str, Any]],
+        query: str,
+        max_length_per_blog: int = 1024,
+        max_batch_tokens: int = BLOG_REFINE_BATCH_TOKENS,
+    ) -> Dict[str, str]:
+        """
+        여러 블로그(여러 장소 섞여도 됨)를 배치당 LLM 한 번으로 정제.
+        blogs: [{"url", "text", "place"}], 반환: {url: 정제된 내용}
+        배치가 실패하거나 응답에서 빠진 글은 refine_blog_content로 하나씩 다시 정제
+        """
+        blogs = [b for b in blogs if b.get("text")]
+        if not blogs:
+            return {}
+
+        batches = split_batches(blogs, query, max_length_per_blog, max_batch_tokens)
+        results = await asyncio.gather(
+            *[self._refine_batch(b, query, max_length_per_blog) for b in batches],
+            return_exceptions=True,
+        )
+
+        refined: Dict[str, str] = {}
+        retry: List[Dict[str, Any]] = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                print(f"블로그 배치 정제 실패 ({len(batch)}개), 글별로 재시도: {result}")
+                result = {}
+            refined.update(result)
+            retry += [b for b in batch if b["url"] not in result]
+
+        if retry:
+            # refine_blog_content는 실패 시 원본 앞부분을 돌려줌
+            texts = await asyncio.gather(
+                *[
+                    self.refine_blog_content(
+                        b["text"], b["place"], query, max_length_per_blog
+                    )
+                    for b in retry
+                ]
+            )
+            for blog, text in zip(retry, texts):
+                refined[blog["url"]] = text
+        return refined
+
+
 # 전역 인스턴스
 _blog_refiner: Optional[BlogRefiner] = None
 
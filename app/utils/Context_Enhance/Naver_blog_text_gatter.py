@@ -1,8 +1,7 @@
 import time
 import re
-import requests
+import asyncio
 from typing import Dict, Optional, List
-import httpx
 import os
 
 from bs4 import BeautifulSoup
@@ -21,6 +20,7 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from dotenv import load_dotenv
 
+from app.utils.http_pool import get_async_client, get_sync_client
 
 load_dotenv()
 
@@ -66,10 +66,9 @@ def naver_blog_search(query: str, k: int = 3, sort: str = "date") -> List[str]:
         "sort": sort,
     }
 
-    with httpx.Client(headers=headers, timeout=10.0, follow_redirects=True) as s:
-        r = s.get(BASE, params=params)
-        r.raise_for_status()
-        data = r.json()
+    r = get_sync_client("naver_openapi").get(BASE, params=params, headers=headers)
+    r.raise_for_status()
+    data = r.json()
 
     items = data.get("items", [])
     # 'link' 필드에 원문 URL이 들어있음 (네이버블로그, 티스토리 등 혼재)
@@ -171,13 +170,22 @@ def _normalize_to_mobile(url: str) -> str:
 
 def _pick_body_block_requests(url: str) -> Dict[str, str]:
     murl = _normalize_to_mobile(url)
-    # SSL 인증서 검증 비활성화 및 경고 억제
-    import urllib3
+    # naver_blog 클라이언트는 SSL 인증서 검증 비활성화 상태
+    r = get_sync_client("naver_blog").get(murl, headers={"User-Agent": UA})
+    r.raise_for_status()
+    return _parse_body_block(r.text)
 
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    r = requests.get(murl, headers={"User-Agent": UA}, timeout=12, verify=False)
+
+async def _pick_body_block_async(url: str) -> Dict[str, str]:
+    """_pick_body_block_requests의 비동기 버전 (HTML 파싱은 스레드에서 수행)"""
+    murl = _normalize_to_mobile(url)
+    r = await get_async_client("naver_blog").get(murl, headers={"User-Agent": UA})
     r.raise_for_status()
-    soup = BeautifulSoup(r.text, "lxml")
+    return await asyncio.to_thread(_parse_body_block, r.text)
+
+
+def _parse_body_block(html: str) -> Dict[str, str]:
+    soup = BeautifulSoup(html, "lxml")
     # 페이지 <title> 추출 시도
     page_title = (soup.title.string or "").strip() if soup.title else ""
 
@@ -279,10 +287,9 @@ def naver_blog_search(query: str, k: int = 3, sort: str = "date") -> List[str]:
         "sort": sort,
     }
 
-    with httpx.Client(headers=headers, timeout=10.0, follow_redirects=True) as s:
-        r = s.get(BASE, params=params)
-        r.raise_for_status()
-        data = r.json()
+    r = get_sync_client("naver_openapi").get(BASE, params=params, headers=headers)
+    r.raise_for_status()
+    data = r.json()
 
     items = data.get("items", [])
     # 'link' 필드에 원문 URL이 들어있음 (네이버블로그, 티스토리 등 혼재)
@@ -2,11 +2,16 @@ import re
 import asyncio
 import os
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import httpx
 from bs4 import BeautifulSoup
 from PIL import Image
 import io
 
+from app.utils.http_pool import get_async_client
+from app.utils.image_store import get_image_store
+
 UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36"
@@ -37,13 +42,21 @@ def _dedup(urls, k=5, skip=0):
 
 
 def _resize_image(
-    image_data: bytes, max_width: int = 800, max_height: int = 600, quality: int = 85
+    image_data: bytes,
+    max_width: int = 800,
+    max_height: int = 600,
+    quality: int = 85,
+    draft: bool = True,
 ) -> bytes:
     """이미지를 리사이즈하고 최적화합니다."""
     try:
         # 이미지 열기
         image = Image.open(io.BytesIO(image_data))
 
+        # JPEG은 디코딩 단계에서 1/2~1/8로 줄여서 읽음 (목표 크기 이상은 유지)
+        if draft and image.format == "JPEG":
+            image.draft("RGB", (max_width, max_height))
+
         # 원본 크기
         original_width, original_height = image.size
 
@@ -76,6 +89,22 @@ def _resize_image(
 
 _IMG_SEM = asyncio.Semaphore(int(os.getenv("IMAGE_FETCH_CONCURRENCY", "3")))
 
+# Pillow 디코딩/리사이즈 + 파일 쓰기는 이벤트 루프 밖에서
+_RESIZE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("IMAGE_RESIZE_WORKERS", "4")),
+    thread_name_prefix="img-resize",
+)
+
+
+def _resize_and_store(
+    image_data: bytes, image_id: str, max_width: int, max_height: int, quality: int
+) -> str:
+    resized_data = _resize_image(
+        image_data, max_width=max_width, max_height=max_height, quality=quality
+    )
+    get_image_store().put(image_id, resized_data)
+    return image_id
+
 
 async def _get_with_retry(
     session: httpx.AsyncClient, url: str, tries: int = 3, timeout: float = 15.0
@@ -83,7 +112,7 @@ async def _get_with_retry(
     last_exc = None
     for i in range(tries):
         try:
-            r = await session.get(url, timeout=timeout)
+            r = await session.get(url, headers=HDRS, timeout=timeout)
             if r.status_code == 200:
                 return r
             last_exc = RuntimeError(f"status {r.status_code}")
@@ -97,89 +126,106 @@ async def _get_with_retry(
 
 async def fetch_and_save_images(
     query: str,
-    save_dir: str = "./images",
     skip: int = 2,
     limit: int = 3,
-    save_name: str = "",
     max_width: int = 200,
     max_height: int = 200,
     quality: int = 85,
 ):
+    """
+    검색 결과 사진을 리사이즈해서 이미지 저장소에 넣고 (image_id 목록, 성공 여부) 반환.
+    이미 저장소에 있는 사진은 다시 받지 않음.
+    """
+    store = get_image_store()
+    variant = f"{max_width}x{max_height}q{quality}"
+
     async with _IMG_SEM:
-        save_result = False
-        os.makedirs(save_dir, exist_ok=True)
         url = (
             "https://search.naver.com/search.naver?"
             f"where=nexearch&sm=top_hty&query={urllib.parse.quote(query)}"
         )
-        async with httpx.AsyncClient(
-            headers=HDRS, follow_redirects=True, timeout=15.0
-        ) as s:
+        s = get_async_client("naver_web")
+        img_client = get_async_client("image")
+        try:
+            r = await _get_with_retry(s, url, tries=3, timeout=15.0)
+        except Exception as e:
+            print("검색 실패", e)
+            r = None
+        html = r.text if r else ""
+
+        # 이미지 URL 후보 추출
+        cand = [u for u in _RE_IMG.findall(html) if not _RE_BAD.search(u)]
+        img_urls = _dedup(cand, k=limit, skip=skip)
+
+        async def _download_and_save(img_url: str) -> Optional[str]:
+            image_id = store.image_id(img_url, variant)
+            if store.lookup(image_id):
+                return image_id
+            try:
+                resp = await _get_with_retry(img_client, img_url, tries=3, timeout=12.0)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    _RESIZE_POOL,
+                    _resize_and_store,
+                    resp.content,
+                    image_id,
+                    max_width,
+                    max_height,
+                    quality,
+                )
+            except Exception:
+                return None
+
+        async def _save_all(urls: List[str]) -> List[str]:
+            # 후보 이미지를 동시에 받아서 처리, 순서는 유지
+            done = await asyncio.gather(*[_download_and_save(u) for u in urls])
+            return [f for f in done if f]
+
+        saved_files = await _save_all(img_urls)
+
+        # 폴백: 검색 파싱으로 못 찾은 경우, 네이버 플레이스 사진탭에서 시도
+        if not saved_files:
             try:
-                r = await _get_with_retry(s, url, tries=3, timeout=15.0)
-            except Exception as e:
-                print("검색 실패", e)
-                r = None
-            html = r.text if r else ""
-
-            # 이미지 URL 후보 추출
-            cand = [u for u in _RE_IMG.findall(html) if not _RE_BAD.search(u)]
-            img_urls = _dedup(cand, k=limit, skip=skip)
-
-            saved_files = []
-            for i, img_url in enumerate(img_urls, 1):
-                try:
-                    resp = await _get_with_retry(s, img_url, tries=3, timeout=12.0)
-                    resized_data = _resize_image(
-                        resp.content,
-                        max_width=max_width,
-                        max_height=max_height,
-                        quality=quality,
-                    )
-                    ext = ".jpg"
-                    fname = os.path.join(save_dir, f"{save_name}_{i}{ext}")
-                    with open(fname, "wb") as f:
-                        f.write(resized_data)
-                    saved_files.append(fname)
-                    save_result = True
-                except Exception as e:
-                    pass
-
-            # 폴백: 검색 파싱으로 못 찾은 경우, 네이버 플레이스 사진탭에서 시도
-            if not saved_files:
-                try:
-                    from app.services.naver_place import (
-                        fetch_place_details as _fetch_place_details,
-                    )
-
-                    # place_query는 검색 질의 그대로 사용
-                    details = await _fetch_place_details(
-                        f"https://map.naver.com/v5/search/{urllib.parse.quote(query)}",
-                        limit=limit,
-                        timeout_ms=20000,
-                        mode="classic",
-                    )
-                    photos = details.get("photos_top", [])
-                    for i, img_url in enumerate(photos, 1):
-                        try:
-                            resp = await _get_with_retry(
-                                s, img_url, tries=3, timeout=12.0
-                            )
-                            resized_data = _resize_image(
-                                resp.content,
-                                max_width=max_width,
-                                max_height=max_height,
-                                quality=quality,
-                            )
-                            ext = ".jpg"
-                            fname = os.path.join(save_dir, f"{save_name}_{i}{ext}")
-                            with open(fname, "wb") as f:
-                                f.write(resized_data)
-                            saved_files.append(fname)
-                            save_result = True
-                        except Exception as e:
-                            pass
-                except Exception as fe:
-                    pass
-
-            return saved_files, save_result
+                from app.services.naver_place import (
+                    fetch_place_details as _fetch_place_details,
+                )
+
+                # place_query는 검색 질의 그대로 사용
+                details = await _fetch_place_details(
+                    f"https://map.naver.com/v5/search/{urllib.parse.quote(query)}",
+                    limit=limit,
+                    timeout_ms=20000,
+                    mode="classic",
+                )
+                saved_files = await _save_all(details.get("photos_top", []))
+            except Exception as fe:
+                pass
+
+        save_result = bool(saved_files)
+        return saved_files, save_result
+
+
+if __name__ == "__main__":
+    # 리사이즈 벤치마크: python -m app.utils.Context_Enhance.Place_Image <jpg 폴더>
+    import sys
+    import glob
+    import time
+
+    src_dir = sys.argv[1] if len(sys.argv) > 1 else "./images"
+    files = sorted(glob.glob(os.path.join(src_dir, "*.jp*g")))
+    if not files:
+        sys.exit(f"{src_dir}에 jpg 파일이 없습니다.")
+    datas = [open(f, "rb").read() for f in files]
+
+    t0 = time.perf_counter()
+    for d in datas:
+        _resize_image(d, 200, 200, draft=False)
+    before = len(datas) / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    list(_RESIZE_POOL.map(lambda d: _resize_image(d, 200, 200), datas))
+    after = len(datas) / (time.perf_counter() - t0)
+
+    print(f"이미지 {len(datas)}장 (200x200)")
+    print(f"기존 (순차, full decode) : {before:8.1f} images/sec")
+    print(f"변경 (draft + 스레드풀)  : {after:8.1f} images/sec  (x{after / before:.1f})")
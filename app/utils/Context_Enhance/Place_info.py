@@ -4,9 +4,10 @@ import urllib.parse
 from typing import List, Optional
 from dataclasses import dataclass
 
-import httpx
 from dotenv import load_dotenv
 
+from app.utils.http_pool import get_async_client, get_sync_client
+
 load_dotenv()
 
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
@@ -32,12 +33,7 @@ def _strip_tags(text: str) -> str:
     return re.sub(r"<\/?b>", "", text)
 
 
-def search_places(
-    query: str, display: int = 7, start: int = 1, sort: str = "random"
-) -> List[Place]:
-    """
-    sort: 'random' | 'comment' (공식 문서 기준)
-    """
+def _build_request(query: str, display: int, start: int, sort: str):
     if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
         raise RuntimeError(
             "NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경변수가 비어 있습니다."
@@ -54,12 +50,36 @@ def search_places(
         "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
         "User-Agent": "TravelGuide/0.1 (FastAPI)",
     }
+    return params, headers
+
+
+def search_places(
+    query: str, display: int = 7, start: int = 1, sort: str = "random"
+) -> List[Place]:
+    """
+    sort: 'random' | 'comment' (공식 문서 기준)
+    """
+    params, headers = _build_request(query, display, start, sort)
+
+    client = get_sync_client("naver_openapi")
+    r = client.get(BASE, params=params, headers=headers)
+    r.raise_for_status()
+    return _parse_places(r.json())
+
+
+async def search_places_async(
+    query: str, display: int = 7, start: int = 1, sort: str = "random"
+) -> List[Place]:
+    """search_places의 비동기 버전 (이벤트 루프를 막지 않음)"""
+    params, headers = _build_request(query, display, start, sort)
+
+    client = get_async_client("naver_openapi")
+    r = await client.get(BASE, params=params, headers=headers)
+    r.raise_for_status()
+    return _parse_places(r.json())
 
-    with httpx.Client(timeout=10.0, headers=headers) as client:
-        r = client.get(BASE, params=params)
-        r.raise_for_status()
-        data = r.json()
 
+def _parse_places(data: dict) -> List[Place]:
     items = data.get("items", [])
     places: List[Place] = []
     for it in items:
@@ -8,7 +8,10 @@ import re
 import asyncio
 from urllib.parse import urlparse, urlunparse
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutAsync
+from playwright.async_api import TimeoutError as PWTimeoutAsync
+
+from app.utils.browser_pool import get_browser_pool
+from app.utils.page_wait import wait_for_count, wait_for_dom_quiet, wait_for_growth
 
 UA_MOBILE = (
     "Mozilla/5.0 (Linux; Android 10; Pixel 3) "
@@ -17,6 +20,10 @@ UA_MOBILE = (
 )
 
 
+BLOG_LINK_SEL = "a[href*='blog.naver.com'], a[href*='m.blog.naver.com']"
+TAB_SEL = "[role='tab'], a[role='button']"
+
+
 def _mplace_review_url(place_id: str) -> str:
     return f"https://m.place.naver.com/restaurant/{place_id}/review/visitor?reviewSort=recommand"
 
@@ -150,126 +157,89 @@ def fetch_top_blog_links(
     return links[:top_k]
 
 
-async def fetch_top_blog_links_async(
-    place_id: str, top_k: int = 5, headless: bool = True
-) -> List[str]:
-    """비동기 버전의 fetch_top_blog_links 함수"""
-    url = _mplace_review_url(place_id)
+async def _collect_blog_links_async(page, top_k: int) -> List[str]:
+    """이미 열린 m.place 리뷰 page에서 '블로그 리뷰' 탭으로 전환 후 상단 blog 링크 top_k개 수집"""
     links: List[str] = []
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-gpu",
-                "--disable-webgl",
-                "--disable-webgl2",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-        ctx = await browser.new_context(
-            user_agent=UA_MOBILE,
-            viewport={"width": 420, "height": 900},
-            java_script_enabled=True,
-            locale="ko-KR",
-        )
-        await ctx.route("**/*", _block_assets_async)
-        page = await ctx.new_page()
-        page.set_default_timeout(10000)
-
+    clicked = False
+    try:
+        await page.get_by_role("tab", name=re.compile("블로그\s*리뷰")).click()
+        clicked = True
+    except Exception:
+        pass
+    if not clicked:
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-        except PWTimeoutAsync:
+            await page.locator("a,button").filter(
+                has_text=re.compile("블로그\s*리뷰")
+            ).first.click()
+            clicked = True
+        except Exception:
             pass
-        await page.wait_for_timeout(300)
-
-        clicked = False
+    if not clicked:
         try:
-            await page.get_by_role("tab", name=re.compile("블로그\s*리뷰")).click()
+            await page.mouse.wheel(0, 1200)
+            await wait_for_dom_quiet(page, 60, 200, label="blog_links")
+            await page.locator("a,button").filter(
+                has_text=re.compile("블로그\s*리뷰")
+            ).first.click()
             clicked = True
         except Exception:
-            pass
-        if not clicked:
-            try:
-                await page.locator("a,button").filter(
-                    has_text=re.compile("블로그\s*리뷰")
-                ).first.click()
-                clicked = True
-            except Exception:
-                pass
-        if not clicked:
-            try:
-                await page.mouse.wheel(0, 1200)
-                await page.wait_for_timeout(200)
-                await page.locator("a,button").filter(
-                    has_text=re.compile("블로그\s*리뷰")
-                ).first.click()
-                clicked = True
-            except Exception:
-                clicked = False
+            clicked = False
 
-        await page.wait_for_timeout(400)
+    await wait_for_count(page, BLOG_LINK_SEL, 1, 2500, label="blog_links")
 
-        async def _collect_now():
-            hrefs = page.locator(
-                "a[href*='blog.naver.com'], a[href*='m.blog.naver.com']"
-            )
-            out = []
-            n = min(80, await hrefs.count())
-            for i in range(n):
-                try:
-                    u = await hrefs.nth(i).get_attribute("href") or ""
-                    if not u:
-                        continue
-                    if re.search(r"blog\.naver\.com/|m\.blog\.naver\.com/", u):
-                        out.append(_norm_blog_url(u))
-                except Exception:
-                    continue
-            return out
-
-        seen = set()
-        for _ in range(6):
-            for u in await _collect_now():
-                if u not in seen:
-                    seen.add(u)
-                    links.append(u)
-                    if len(links) >= top_k:
-                        break
-            if len(links) >= top_k:
-                break
+    async def _collect_now():
+        hrefs = page.locator(BLOG_LINK_SEL)
+        out = []
+        n = min(80, await hrefs.count())
+        for i in range(n):
             try:
-                await page.mouse.wheel(0, 1200)
+                u = await hrefs.nth(i).get_attribute("href") or ""
+                if not u:
+                    continue
+                if re.search(r"blog\.naver\.com/|m\.blog\.naver\.com/", u):
+                    out.append(_norm_blog_url(u))
             except Exception:
-                break
-            await page.wait_for_timeout(250)
+                continue
+        return out
+
+    seen = set()
+    for _ in range(6):
+        for u in await _collect_now():
+            if u not in seen:
+                seen.add(u)
+                links.append(u)
+                if len(links) >= top_k:
+                    break
+        if len(links) >= top_k:
+            break
+        try:
+            before = await page.locator(BLOG_LINK_SEL).count()
+            await page.mouse.wheel(0, 1200)
+        except Exception:
+            break
+        # 스크롤해도 링크가 더 안 늘어나면 끝
+        if not await wait_for_growth(page, BLOG_LINK_SEL, before, 800, "blog_links"):
+            break
 
-        await browser.close()
     return links[:top_k]
 
 
-async def _block_assets_async(route, req):
-    u = req.url.lower()
-    if any(
-        u.endswith(ext)
-        for ext in (
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".webp",
-            ".mp4",
-            ".webm",
-            ".svg",
-            ".woff",
-            ".woff2",
-            ".ttf",
-            ".otf",
-        )
-    ):
-        await route.abort()
-    else:
-        await route.continue_()
+async def fetch_top_blog_links_async(place_id: str, top_k: int = 5) -> List[str]:
+    """비동기 버전의 fetch_top_blog_links 함수 (브라우저는 공용 풀에서 빌려 씀, headless 여부는 풀의 HEADLESS 설정)"""
+    url = _mplace_review_url(place_id)
+
+    async with get_browser_pool().page(
+        "mobile", block_resources=True, default_timeout_ms=10000
+    ) as page:
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+        except PWTimeoutAsync:
+            pass
+        await wait_for_count(page, TAB_SEL, 1, 3000, label="blog_links")
+
+        links = await _collect_blog_links_async(page, top_k)
+
+    return links
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ import time
 from typing import Optional
 from urllib.parse import quote_plus
 
-import httpx
+from app.utils.http_pool import get_async_client, get_sync_client
 
 # ✅ 모바일 UA (모바일 검색 HTML에 place 링크가 포함되는 경우가 많아, 모바일이 유리)
 UA_MOBILE = (
@@ -32,6 +32,9 @@ PID_PATTERNS = [
 
 DEFAULT_TIMEOUT = 10.0
 
+# pid 추출 대상이 되는 DOM 요소 (PID_PATTERNS와 대응)
+PLACE_LINK_SEL = "a[href*='place.naver.com/'], [data-cid]"
+
 
 def _extract_pid_from_html(html: str) -> Optional[str]:
     for pat in PID_PATTERNS:
@@ -41,20 +44,27 @@ def _extract_pid_from_html(html: str) -> Optional[str]:
     return None
 
 
+HTTP_HEADERS = {
+    "User-Agent": UA_MOBILE,
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+}
+
+
 def _request_text(url: str, timeout: float = DEFAULT_TIMEOUT) -> str:
-    headers = {
-        "User-Agent": UA_MOBILE,
-        "Accept-Language": "ko-KR,ko;q=0.9",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
-    with httpx.Client(
-        headers=headers, timeout=timeout, follow_redirects=True
-    ) as client:
-        r = client.get(url)
-        r.raise_for_status()
-        return r.text
+    client = get_sync_client("naver_web")
+    r = client.get(url, headers=HTTP_HEADERS, timeout=timeout)
+    r.raise_for_status()
+    return r.text
+
+
+async def _request_text_async(url: str, timeout: float = DEFAULT_TIMEOUT) -> str:
+    client = get_async_client("naver_web")
+    r = await client.get(url, headers=HTTP_HEADERS, timeout=timeout)
+    r.raise_for_status()
+    return r.text
 
 
 def get_place_pid_by_query_http(
@@ -81,6 +91,26 @@ def get_place_pid_by_query_http(
     return None
 
 
+async def get_place_pid_by_query_http_async(
+    query: str, timeout: float = DEFAULT_TIMEOUT
+) -> Optional[str]:
+    """
+    1차(비동기): get_place_pid_by_query_http와 동일.
+    같은 html을 다시 파싱하던 sleep 재시도는 결과가 바뀌지 않으므로 생략.
+    """
+    q = quote_plus(query)
+    for tpl in SEARCH_URLS:
+        url = tpl.format(q=q)
+        try:
+            html = await _request_text_async(url, timeout=timeout)
+        except Exception:
+            continue
+        pid = _extract_pid_from_html(html)
+        if pid:
+            return pid
+    return None
+
+
 def get_place_pid_by_query_playwright(
     query: str, headless: bool = True, timeout_ms: int = 8000
 ) -> Optional[str]:
@@ -138,13 +168,15 @@ def get_place_pid_by_query_playwright(
 
 
 async def get_place_pid_by_query_playwright_async(
-    query: str, headless: bool = True, timeout_ms: int = 8000
+    query: str, timeout_ms: int = 8000
 ) -> Optional[str]:
     """
-    2차: Playwright 비동기 API로 m.search 또는 m.place를 열어 place 링크가 DOM에 뜨도록 한 뒤 pid 추출
+    2차: 공용 브라우저 풀의 페이지로 m.search 또는 m.place를 열어 place 링크가 DOM에 뜨도록 한 뒤 pid 추출
+    (headless 여부는 풀의 HEADLESS 설정을 따름)
     """
     try:
-        from playwright.async_api import async_playwright
+        from app.utils.browser_pool import get_browser_pool
+        from app.utils.page_wait import wait_for_count
     except Exception:
         return None
 
@@ -154,41 +186,27 @@ async def get_place_pid_by_query_playwright_async(
         f"https://m.place.naver.com/search?q={q}",
     ]
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"],
-        )
-        ctx = await browser.new_context(
-            user_agent=UA_MOBILE,
-            viewport={"width": 420, "height": 900},
-            locale="ko-KR",
-            java_script_enabled=True,
-        )
-        page = await ctx.new_page()
-        page.set_default_timeout(timeout_ms)
-
-        try:
-            for url in urls:
-                try:
-                    await page.goto(url, wait_until="domcontentloaded")
-                except Exception:
-                    continue
-
-                # 첫 페인트 후 살짝 대기
-                await page.wait_for_timeout(350)
-
+    async with get_browser_pool().page(
+        "mobile", default_timeout_ms=timeout_ms
+    ) as page:
+        for url in urls:
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+            except Exception:
+                continue
+
+            # place 링크가 뜰 때까지 대기 (이미 떠 있으면 바로 통과)
+            if not await wait_for_count(page, PLACE_LINK_SEL, 1, 1500, label="pid"):
                 # 스크롤 몇 번 내려서 동적 로드 유도
                 for _ in range(4):
                     await page.mouse.wheel(0, 1200)
-                    await page.wait_for_timeout(220)
+                    if await wait_for_count(page, PLACE_LINK_SEL, 1, 400, label="pid"):
+                        break
 
-                html = await page.content()
-                pid = _extract_pid_from_html(html)
-                if pid:
-                    return pid
-        finally:
-            await browser.close()
+            html = await page.content()
+            pid = _extract_pid_from_html(html)
+            if pid:
+                return pid
 
     return None
 
@@ -205,16 +223,16 @@ def get_place_pid(query: str, headless: bool = True) -> Optional[str]:
     return get_place_pid_by_query_playwright(query, headless=headless)
 
 
-async def get_place_pid_async(query: str, headless: bool = True) -> Optional[str]:
+async def get_place_pid_async(query: str) -> Optional[str]:
     """
     비동기 고수준 API:
     1) HTTP 정적 파싱으로 시도
     2) 실패 시 Playwright 비동기 폴백
     """
-    pid = get_place_pid_by_query_http(query)
+    pid = await get_place_pid_by_query_http_async(query)
     if pid:
         return pid
-    return await get_place_pid_by_query_playwright_async(query, headless=headless)
+    return await get_place_pid_by_query_playwright_async(query)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+"""
+pid → m.place 방문자 리뷰 페이지를 한 번만 열어서
+방문자 리뷰(최신순)와 블로그 리뷰 링크를 같은 page에서 함께 수집.
+
+기존에는 fetch_top_blog_links_async / crawl_reviews_text_async가
+같은 페이지를 각자 따로 열었음 → 장소당 네비게이션 1회 절약.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from playwright.async_api import TimeoutError as PWTimeoutAsync
+
+from app.utils.browser_pool import get_browser_pool
+from app.utils.page_wait import wait_for_count
+from app.utils.Context_Enhance.blog_links import _collect_blog_links_async
+from app.utils.Context_Enhance.reviews_crawling import (
+    REVIEW_MODE,
+    REVIEW_SEL,
+    _ReviewCapture,
+    _collect_reviews_auto_async,
+    _normalize_to_mplace,
+)
+
+
+@dataclass
+class PlaceSessionResult:
+    pid: str
+    reviews: List[str] = field(default_factory=list)
+    blog_links: List[str] = field(default_factory=list)
+
+
+async def crawl_place_session_async(
+    pid: str,
+    review_batches: int = 2,
+    blog_top_k: int = 3,
+    review_mode: str = REVIEW_MODE,
+) -> PlaceSessionResult:
+    """
+    1) 방문자 리뷰 탭(reviewSort=recent)으로 한 번 진입해서 리뷰 수집
+    2) 같은 page에서 '블로그 리뷰' 탭으로 전환해 블로그 링크 수집
+    한쪽이 실패해도 다른 쪽 결과는 살려서 반환
+    """
+    result = PlaceSessionResult(pid=pid)
+
+    async with get_browser_pool().page(
+        "mobile",
+        block_resources=True,
+        default_timeout_ms=10000,
+        navigation_timeout_ms=10000,
+    ) as page:
+        capture = (
+            _ReviewCapture(page)
+            if review_mode == "network" and review_batches > 0
+            else None
+        )
+        try:
+            await page.goto(_normalize_to_mplace(pid), wait_until="domcontentloaded")
+        except PWTimeoutAsync:
+            pass
+        await wait_for_count(page, REVIEW_SEL, 1, 3000, "place_session")
+
+        if review_batches > 0:
+            try:
+                result.reviews = await _collect_reviews_auto_async(
+                    page, review_batches, capture, review_mode
+                )
+            except Exception as e:
+                print(f"리뷰 수집 실패: {pid}, {e}")
+
+        if blog_top_k > 0:
+            try:
+                # 리뷰 수집하면서 내려간 스크롤을 탭 위치로 되돌림
+                await page.evaluate("() => window.scrollTo(0, 0)")
+                result.blog_links = await _collect_blog_links_async(page, blog_top_k)
+            except Exception as e:
+                print(f"블로그 링크 수집 실패: {pid}, {e}")
+
+    return result
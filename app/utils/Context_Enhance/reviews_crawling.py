@@ -1,7 +1,18 @@
 import re
-from typing import List
+import os
+import json
+import asyncio
+from typing import Any, Dict, List, Optional
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutAsync
+from playwright.async_api import TimeoutError as PWTimeoutAsync
+
+from app.utils.browser_pool import get_browser_pool
+from app.utils.page_wait import (
+    wait_for_count,
+    wait_for_dom_quiet,
+    wait_for_endpoint_idle,
+    wait_for_growth,
+)
 
 UA_MOBILE = (
     "Mozilla/5.0 (Linux; Android 10; Pixel 3) "
@@ -15,6 +26,11 @@ WAIT_SHORT_MS = 120
 WAIT_MED_MS = 180
 SCROLL_SMALL = 800
 SCROLL_MED = 1200
+REVIEW_SEL = "div.pui__vn15t2"
+
+# 리뷰 추출 방식: 'network'(GraphQL 응답 파싱, 실패 시 bulk 폴백) | 'bulk' | 'dom'
+REVIEW_MODE = os.getenv("REVIEW_MODE", "network")
+NETWORK_FIRST_WAIT_MS = 3000
 
 
 def _normalize_to_mplace(pid: str) -> str:
@@ -86,7 +102,8 @@ async def _click_safe_async(page, loc, wait_ms: int = WAIT_MED_MS) -> bool:
     try:
         await loc.scroll_into_view_if_needed()
         await loc.click()
-        await page.wait_for_timeout(wait_ms)
+        if wait_ms > 0:
+            await wait_for_dom_quiet(page, 40, wait_ms, label="reviews")
         return True
     except Exception:
         h = await loc.element_handle()
@@ -94,7 +111,8 @@ async def _click_safe_async(page, loc, wait_ms: int = WAIT_MED_MS) -> bool:
             return False
         try:
             await page.evaluate("(el)=>el.click()", h)
-            await page.wait_for_timeout(wait_ms)
+            if wait_ms > 0:
+                await wait_for_dom_quiet(page, 40, wait_ms, label="reviews")
             return True
         except Exception:
             return False
@@ -167,7 +185,8 @@ async def _click_next_batch_async(page) -> bool:
         btn = page.locator(sel)
         if await btn.count() == 0:
             return False
-        ok = await _click_safe_async(page, btn.first, WAIT_MED_MS)
+        # 클릭 후 대기는 _next_batch_async(graphql idle + wait_for_growth)가 담당
+        ok = await _click_safe_async(page, btn.first, 0)
         if ok:
             # print(f"[debug] next-batch clicked by: {sel}")
             pass
@@ -189,7 +208,6 @@ async def _click_next_batch_async(page) -> bool:
                 "(el)=>{ const a=el.closest('a'); if(!a) return false; a.click(); return true; }",
                 h,
             )
-            await page.wait_for_timeout(WAIT_MED_MS)
             if ok:
                 print("[debug] next-batch clicked by closest('a')")
                 return True
@@ -216,7 +234,6 @@ async def _click_next_batch_async(page) -> bool:
                 await page.mouse.click(
                     box["x"] + box["width"] / 2, box["y"] + box["height"] / 2
                 )
-                await page.wait_for_timeout(WAIT_MED_MS)
                 print("[debug] next-batch clicked by mouse coords")
                 return True
         except Exception:
@@ -225,9 +242,187 @@ async def _click_next_batch_async(page) -> bool:
     return False
 
 
-def crawl_reviews_text(url: str, headless: bool = True, batches: int = 3) -> List[str]:
-    target = _normalize_to_mplace(url)
+# 한 번의 evaluate로 offset 이후 리뷰를 모두 펼치고 텍스트를 돌려줌
+_HARVEST_JS = """
+async ([offset, waitMs]) => {
+  const cons = Array.from(document.querySelectorAll('div.pui__vn15t2')).slice(offset);
+  let clicked = 0;
+  for (const con of cons) {
+    const more = con.querySelectorAll("[data-pui-click-code='rvshowmore']");
+    if (more.length) {
+      try { more[more.length - 1].click(); clicked++; } catch (e) {}
+    }
+  }
+  if (clicked) await new Promise((r) => setTimeout(r, waitMs));
+  return cons.map((con) =>
+    (con.innerText || con.textContent || '').trim().replace(/\\s*(더보기|접기)\\s*$/, '').trim()
+  );
+}
+"""
+_COUNT_GROWN_JS = (
+    "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before"
+)
+
+
+async def _next_batch_async(page, before: int) -> bool:
+    """
+    '펼쳐서 더보기' 클릭 → 그 클릭으로 나간 graphql(리뷰 페이지) 요청이 끝날 때까지 대기
+    → 리뷰 요소가 before보다 늘었는지 확인. 버튼이 없으면 False.
+    """
+    clicked: List[bool] = []
+
+    async def _click() -> None:
+        clicked.append(await _click_next_batch_async(page))
+
+    await wait_for_endpoint_idle(page, "graphql", _click, 3000, "reviews_api")
+    if not clicked or not clicked[0]:
+        return False
+    # 응답은 이미 왔으므로 렌더링만 기다림
+    if not await wait_for_growth(page, REVIEW_SEL, before, 600, "reviews"):
+        await page.mouse.wheel(0, SCROLL_MED)
+        await wait_for_growth(page, REVIEW_SEL, before, WAIT_MED_MS, "reviews")
+    return True
+
+
+def _collect_reviews_bulk(page, batches: int) -> List[str]:
+    """bulk 모드: 펼치기/텍스트 추출은 페이지 안에서 한 번에, 파이썬은 '다음 묶음' 클릭만 반복"""
+    need = batches * 10
+    out: List[str] = []
+    offset = 0
+    while len(out) < need:
+        texts = page.evaluate(_HARVEST_JS, [offset, WAIT_SHORT_MS])
+        if not texts:
+            # 렌더링이 늦는 페이지: 한 번 스크롤하고 다시 수집 (기존 요소 단위 방식과 동일)
+            page.mouse.wheel(0, SCROLL_SMALL)
+            page.wait_for_timeout(WAIT_SHORT_MS)
+            texts = page.evaluate(_HARVEST_JS, [offset, WAIT_SHORT_MS])
+            if not texts and offset == 0:
+                break
+        offset += len(texts)
+        out.extend(t for t in texts if t)
+        if len(out) >= need:
+            break
+        if not _click_next_batch(page):
+            break
+        try:
+            page.wait_for_function(_COUNT_GROWN_JS, arg=offset, timeout=1800)
+        except Exception:
+            page.mouse.wheel(0, SCROLL_MED)
+            page.wait_for_timeout(WAIT_MED_MS)
+    return out[:need]
+
+
+async def _collect_reviews_bulk_async(page, batches: int) -> List[str]:
+    """_collect_reviews_bulk의 비동기 버전"""
+    need = batches * 10
+    out: List[str] = []
+    offset = 0
+    while len(out) < need:
+        texts = await page.evaluate(_HARVEST_JS, [offset, WAIT_SHORT_MS])
+        if not texts:
+            # 렌더링이 늦는 페이지: 한 번 스크롤하고 다시 수집 (기존 요소 단위 방식과 동일)
+            await page.mouse.wheel(0, SCROLL_SMALL)
+            await wait_for_count(page, REVIEW_SEL, offset + 1, WAIT_MED_MS, "reviews")
+            texts = await page.evaluate(_HARVEST_JS, [offset, WAIT_SHORT_MS])
+            if not texts and offset == 0:
+                break
+        offset += len(texts)
+        out.extend(t for t in texts if t)
+        if len(out) >= need:
+            break
+        if not await _next_batch_async(page, offset):
+            break
+    return out[:need]
+
+
+def _collect_reviews(page, batches: int) -> List[str]:
+    """이미 방문자 리뷰 탭이 열린 page에서 batches*10개까지 리뷰 텍스트 수집 (요소 단위)"""
     out: List[str] = []
+    processed_offset = 0
+
+    for b in range(batches):
+        cons = page.locator("div.pui__vn15t2")
+        total = cons.count()
+        if total == 0:
+            page.mouse.wheel(0, SCROLL_SMALL)
+            page.wait_for_timeout(WAIT_SHORT_MS)
+            cons = page.locator("div.pui__vn15t2")
+            total = cons.count()
+            if total == 0:
+                break
+
+        # 이번 배치에서 정확히 10개 텍스트를 확보할 때까지 킵고잉
+        need = 10
+        collected_this_batch = 0
+
+        while collected_this_batch < need:
+            cons = page.locator("div.pui__vn15t2")
+            total = cons.count()
+
+            # 부족하면 버튼 눌러 다음 10개 노출
+            if processed_offset >= total:
+                before = total
+                if not _click_next_batch(page):
+                    break
+                try:
+                    page.wait_for_function(
+                        "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
+                        arg=before,
+                        timeout=1800,
+                    )
+                except Exception:
+                    page.mouse.wheel(0, SCROLL_MED)
+                    page.wait_for_timeout(WAIT_MED_MS)
+                cons = page.locator("div.pui__vn15t2")
+                total = cons.count()
+                if processed_offset >= total:
+                    break
+
+            end = min(processed_offset + (need - collected_this_batch), total)
+            for i in range(processed_offset, end):
+                con = cons.nth(i)
+                sm = con.locator("[data-pui-click-code='rvshowmore']")
+                if sm.count() > 0:
+                    _click_safe(page, sm.last, WAIT_SHORT_MS)
+
+                txt = _inner_text(page, con)
+                txt = re.sub(r"\s*(더보기|접기)\s*$", "", txt).strip()
+                if txt:
+                    out.append(txt)
+                    collected_this_batch += 1
+                else:
+                    # 빈 텍스트 패~~~~~~~~~~스
+                    pass
+
+                processed_offset += 1
+
+                if collected_this_batch >= need:
+                    break
+
+            if collected_this_batch < need and processed_offset >= total:
+                before = total
+                if not _click_next_batch(page):
+                    break
+                try:
+                    page.wait_for_function(
+                        "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
+                        arg=before,
+                        timeout=1800,
+                    )
+                except Exception:
+                    page.mouse.wheel(0, SCROLL_MED)
+                    page.wait_for_timeout(WAIT_MED_MS)
+
+        if b == batches - 1:
+            break
+
+    return out[: batches * 10]
+
+
+def crawl_reviews_text(
+    url: str, headless: bool = True, batches: int = 3, mode: str = "bulk"
+) -> List[str]:
+    target = _normalize_to_mplace(url)
 
     with sync_playwright() as p:
         browser = p.chromium.launch(
@@ -257,199 +452,259 @@ def crawl_reviews_text(url: str, headless: bool = True, batches: int = 3) -> Lis
             pass
         page.wait_for_timeout(WAIT_MED_MS)
 
-        processed_offset = 0
+        if mode == "bulk":
+            out = _collect_reviews_bulk(page, batches)
+        else:
+            out = _collect_reviews(page, batches)
+
+        browser.close()
+    return out
+
 
-        for b in range(batches):
+async def _collect_reviews_async(page, batches: int) -> List[str]:
+    """이미 방문자 리뷰 탭이 열린 page에서 batches*10개까지 리뷰 텍스트 수집"""
+    out: List[str] = []
+    processed_offset = 0
+
+    for b in range(batches):
+        cons = page.locator("div.pui__vn15t2")
+        total = await cons.count()
+        if total == 0:
+            await page.mouse.wheel(0, SCROLL_SMALL)
+            await wait_for_count(page, REVIEW_SEL, 1, WAIT_MED_MS, "reviews")
             cons = page.locator("div.pui__vn15t2")
-            total = cons.count()
+            total = await cons.count()
             if total == 0:
-                page.mouse.wheel(0, SCROLL_SMALL)
-                page.wait_for_timeout(WAIT_SHORT_MS)
+                break
+
+        # 이번 배치에서 정확히 10개 텍스트를 확보할 때까지 킵고잉
+        need = 10
+        collected_this_batch = 0
+
+        while collected_this_batch < need:
+            cons = page.locator("div.pui__vn15t2")
+            total = await cons.count()
+
+            # 부족하면 버튼 눌러 다음 10개 노출
+            if processed_offset >= total:
+                before = total
+                if not await _next_batch_async(page, before):
+                    break
                 cons = page.locator("div.pui__vn15t2")
-                total = cons.count()
-                if total == 0:
+                total = await cons.count()
+                if processed_offset >= total:
                     break
 
-            # 이번 배치에서 정확히 10개 텍스트를 확보할 때까지 킵고잉
-            need = 10
-            collected_this_batch = 0
+            end = min(processed_offset + (need - collected_this_batch), total)
+            for i in range(processed_offset, end):
+                con = cons.nth(i)
+                sm = con.locator("[data-pui-click-code='rvshowmore']")
+                if await sm.count() > 0:
+                    await _click_safe_async(page, sm.last, WAIT_SHORT_MS)
+
+                txt = await _inner_text_async(page, con)
+                txt = re.sub(r"\s*(더보기|접기)\s*$", "", txt).strip()
+                if txt:
+                    out.append(txt)
+                    collected_this_batch += 1
+                else:
+                    # 빈 텍스트 패~~~~~~~~~~스
+                    pass
+
+                processed_offset += 1
+
+                if collected_this_batch >= need:
+                    break
 
-            while collected_this_batch < need:
-                cons = page.locator("div.pui__vn15t2")
-                total = cons.count()
+            if collected_this_batch < need and processed_offset >= total:
+                before = total
+                if not await _next_batch_async(page, before):
+                    break
 
-                # 부족하면 버튼 눌러 다음 10개 노출
-                if processed_offset >= total:
-                    before = total
-                    if not _click_next_batch(page):
-                        break
-                    try:
-                        page.wait_for_function(
-                            "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
-                            arg=before,
-                            timeout=1800,
-                        )
-                    except Exception:
-                        page.mouse.wheel(0, SCROLL_MED)
-                        page.wait_for_timeout(WAIT_MED_MS)
-                    cons = page.locator("div.pui__vn15t2")
-                    total = cons.count()
-                    if processed_offset >= total:
-                        break
-
-                end = min(processed_offset + (need - collected_this_batch), total)
-                for i in range(processed_offset, end):
-                    con = cons.nth(i)
-                    sm = con.locator("[data-pui-click-code='rvshowmore']")
-                    if sm.count() > 0:
-                        _click_safe(page, sm.last, WAIT_SHORT_MS)
-
-                    txt = _inner_text(page, con)
-                    txt = re.sub(r"\s*(더보기|접기)\s*$", "", txt).strip()
-                    if txt:
-                        out.append(txt)
-                        collected_this_batch += 1
-                    else:
-                        # 빈 텍스트 패~~~~~~~~~~스
-                        pass
-
-                    processed_offset += 1
-
-                    if collected_this_batch >= need:
-                        break
-
-                if collected_this_batch < need and processed_offset >= total:
-                    before = total
-                    if not _click_next_batch(page):
-                        break
-                    try:
-                        page.wait_for_function(
-                            "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
-                            arg=before,
-                            timeout=1800,
-                        )
-                    except Exception:
-                        page.mouse.wheel(0, SCROLL_MED)
-                        page.wait_for_timeout(WAIT_MED_MS)
-
-            if b == batches - 1:
-                break
+        if b == batches - 1:
+            break
 
-        browser.close()
     return out[: batches * 10]
 
 
-async def crawl_reviews_text_async(
-    url: str, headless: bool = True, batches: int = 3
-) -> List[str]:
-    target = _normalize_to_mplace(url)
-    out: List[str] = []
+class _ReviewCapture:
+    """
+    m.place가 스스로 호출하는 GraphQL(visitorReviews) 응답을 가로채 리뷰 본문을 파싱.
+    page.goto 전에 붙여야 첫 페이지 응답을 놓치지 않음.
+    다음 페이지는 '펼쳐서 더보기'가 보내는 요청을 page 번호만 바꿔 재전송해서 가져옴.
+    """
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-gpu",
-                "--disable-webgl",
-                "--disable-webgl2",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-        ctx = await browser.new_context(
-            user_agent=UA_MOBILE,
-            viewport={"width": 420, "height": 900},
-            java_script_enabled=True,
-            locale="ko-KR",
-        )
-        await ctx.route("**/*", _block_assets)
-        page = await ctx.new_page()
-        page.set_default_timeout(8000)
-        page.set_default_navigation_timeout(8000)
+    def __init__(self, page):
+        self.page = page
+        self.reviews: List[str] = []
+        self._seen = set()
+        self._template: Optional[Dict[str, Any]] = None
+        self._pending: List[asyncio.Future] = []
+        self._first = asyncio.Event()
+        page.on("response", self._on_response)
 
+    def detach(self) -> None:
         try:
-            await page.goto(target, wait_until="domcontentloaded")
-        except PWTimeoutAsync:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
             pass
-        await page.wait_for_timeout(WAIT_MED_MS)
 
-        processed_offset = 0
+    def _on_response(self, resp) -> None:
+        req = resp.request
+        if req.method != "POST" or "graphql" not in req.url:
+            return
+        if "visitorReviews" not in (req.post_data or ""):
+            return
+        self._pending.append(asyncio.ensure_future(self._read(resp)))
 
-        for b in range(batches):
-            cons = page.locator("div.pui__vn15t2")
-            total = await cons.count()
-            if total == 0:
-                await page.mouse.wheel(0, SCROLL_SMALL)
-                await page.wait_for_timeout(WAIT_SHORT_MS)
-                cons = page.locator("div.pui__vn15t2")
-                total = await cons.count()
-                if total == 0:
+    async def _read(self, resp) -> None:
+        try:
+            data = await resp.json()
+        except Exception:
+            return
+        if self._template is None:
+            req = resp.request
+            headers = {
+                k: v
+                for k, v in req.headers.items()
+                if not k.startswith(":") and k.lower() != "content-length"
+            }
+            self._template = {
+                "url": req.url,
+                "headers": headers,
+                "payload": req.post_data_json,
+            }
+        self._add(data)
+        self._first.set()
+
+    def _add(self, data: Any) -> int:
+        added = 0
+        for body in _extract_review_bodies(data):
+            txt = body.strip()
+            if txt and txt not in self._seen:
+                self._seen.add(txt)
+                self.reviews.append(txt)
+                added += 1
+        return added
+
+    async def collect(self, batches: int) -> List[str]:
+        need = batches * 10
+        try:
+            await asyncio.wait_for(
+                self._first.wait(), timeout=NETWORK_FIRST_WAIT_MS / 1000
+            )
+        except asyncio.TimeoutError:
+            return []
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+        page_no = _current_page_no(self._template["payload"]) or 1
+        while len(self.reviews) < need:
+            page_no += 1
+            payload = _with_page_no(self._template["payload"], page_no)
+            if payload is None:
+                break
+            try:
+                r = await self.page.request.post(
+                    self._template["url"],
+                    data=json.dumps(payload),
+                    headers=self._template["headers"],
+                )
+                if not r.ok:
                     break
+                if self._add(await r.json()) == 0:
+                    break
+            except Exception:
+                break
+        return self.reviews[:need]
 
-            # 이번 배치에서 정확히 10개 텍스트를 확보할 때까지 킵고잉
-            need = 10
-            collected_this_batch = 0
 
-            while collected_this_batch < need:
-                cons = page.locator("div.pui__vn15t2")
-                total = await cons.count()
+def _extract_review_bodies(data: Any) -> List[str]:
+    """GraphQL 응답(단일/배치)에서 visitorReviews.items[].body만 뽑아냄"""
+    out: List[str] = []
+    if isinstance(data, list):
+        for d in data:
+            out.extend(_extract_review_bodies(d))
+    elif isinstance(data, dict):
+        vr = data.get("visitorReviews")
+        if isinstance(vr, dict):
+            for it in vr.get("items") or []:
+                if isinstance(it, dict) and it.get("body"):
+                    out.append(it["body"])
+        for k, v in data.items():
+            if k != "visitorReviews" and isinstance(v, (dict, list)):
+                out.extend(_extract_review_bodies(v))
+    return out
+
+
+def _find_page_input(payload: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(payload, list):
+        for p in payload:
+            found = _find_page_input(p)
+            if found is not None:
+                return found
+    elif isinstance(payload, dict):
+        if "page" in payload and isinstance(payload["page"], int):
+            return payload
+        for v in payload.values():
+            found = _find_page_input(v)
+            if found is not None:
+                return found
+    return None
+
+
+def _current_page_no(payload: Any) -> Optional[int]:
+    inp = _find_page_input(payload)
+    return inp["page"] if inp is not None else None
+
+
+def _with_page_no(payload: Any, page_no: int) -> Optional[Any]:
+    payload = json.loads(json.dumps(payload))
+    inp = _find_page_input(payload)
+    if inp is None:
+        return None
+    inp["page"] = page_no
+    return payload
+
+
+async def _collect_reviews_auto_async(
+    page, batches: int, capture: Optional[_ReviewCapture], mode: str = REVIEW_MODE
+) -> List[str]:
+    """
+    network 모드면 캡처 결과를 우선 쓰고, 비어 있으면 DOM 방식으로 폴백.
+    DOM 방식은 'dom'일 때만 요소 단위, 그 외에는 bulk(evaluate 한 번) 사용
+    """
+    if capture is not None:
+        try:
+            reviews = await capture.collect(batches)
+        finally:
+            capture.detach()
+        if reviews:
+            return reviews
+    if mode == "dom":
+        return await _collect_reviews_async(page, batches)
+    return await _collect_reviews_bulk_async(page, batches)
 
-                # 부족하면 버튼 눌러 다음 10개 노출
-                if processed_offset >= total:
-                    before = total
-                    if not await _click_next_batch_async(page):
-                        break
-                    try:
-                        await page.wait_for_function(
-                            "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
-                            arg=before,
-                            timeout=1800,
-                        )
-                    except Exception:
-                        await page.mouse.wheel(0, SCROLL_MED)
-                        await page.wait_for_timeout(WAIT_MED_MS)
-                    cons = page.locator("div.pui__vn15t2")
-                    total = await cons.count()
-                    if processed_offset >= total:
-                        break
-
-                end = min(processed_offset + (need - collected_this_batch), total)
-                for i in range(processed_offset, end):
-                    con = cons.nth(i)
-                    sm = con.locator("[data-pui-click-code='rvshowmore']")
-                    if await sm.count() > 0:
-                        await _click_safe_async(page, sm.last, WAIT_SHORT_MS)
-
-                    txt = await _inner_text_async(page, con)
-                    txt = re.sub(r"\s*(더보기|접기)\s*$", "", txt).strip()
-                    if txt:
-                        out.append(txt)
-                        collected_this_batch += 1
-                    else:
-                        # 빈 텍스트 패~~~~~~~~~~스
-                        pass
-
-                    processed_offset += 1
-
-                    if collected_this_batch >= need:
-                        break
-
-                if collected_this_batch < need and processed_offset >= total:
-                    before = total
-                    if not await _click_next_batch_async(page):
-                        break
-                    try:
-                        await page.wait_for_function(
-                            "(before)=> document.querySelectorAll('div.pui__vn15t2').length > before",
-                            arg=before,
-                            timeout=1800,
-                        )
-                    except Exception:
-                        await page.mouse.wheel(0, SCROLL_MED)
-                        await page.wait_for_timeout(WAIT_MED_MS)
-
-            if b == batches - 1:
-                break
 
-        await browser.close()
-    return out[: batches * 10]
\ No newline at end of file
+async def crawl_reviews_text_async(
+    url: str, batches: int = 3, mode: str = REVIEW_MODE
+) -> List[str]:
+    """공용 브라우저 풀에서 페이지를 빌려 리뷰 수집 (headless 여부는 풀의 HEADLESS 설정)"""
+    target = _normalize_to_mplace(url)
+
+    async with get_browser_pool().page(
+        "mobile",
+        block_resources=True,
+        default_timeout_ms=8000,
+        navigation_timeout_ms=8000,
+    ) as page:
+        capture = _ReviewCapture(page) if mode == "network" else None
+        try:
+            await page.goto(target, wait_until="domcontentloaded")
+        except PWTimeoutAsync:
+            pass
+        await wait_for_count(page, REVIEW_SEL, 1, 3000, "reviews")
+
+        out = await _collect_reviews_auto_async(page, batches, capture, mode)
+
+    return out
\ No newline at end of file
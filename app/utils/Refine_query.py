@@ -1,10 +1,238 @@
-from langchain_openai import ChatOpenAI
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from app.utils.cache_util import load_cache_async, save_cache_async
+from app.utils.llm_pool import get_llm_registry
+
+REFINE_RULES = os.getenv("REFINE_RULES", "1") == "1"
+REFINE_CACHE_TTL = int(os.getenv("REFINE_CACHE_TTL", str(7 * 24 * 3600)))
+
+# 요청 표현 → 검색 수식어 (프롬프트 예시의 "가성비", "오션뷰" 등)
+_MODIFIERS = {
+    "가성비": "가성비", "싸고": "가성비", "싼": "가성비", "값싼": "가성비",
+    "저렴": "가성비", "저렴한": "가성비", "저렴하고": "가성비",
+    "오션뷰": "오션뷰", "바다가 보이는": "오션뷰", "바다 보이는": "오션뷰", "바다뷰": "오션뷰",
+    "회식": "회식", "데이트": "데이트", "혼밥": "혼밥", "조용한": "조용한",
+    "야경": "야경", "뷰 맛집": "뷰", "24시": "24시", "애견": "애견동반", "애견동반": "애견동반",
+    "반려견": "애견동반", "반려견동반": "애견동반",
+}
+# 장소 종류 (검색 쿼리 맨 뒤에 붙는 단어)
+_CATEGORIES = {
+    "카페": "카페", "맛집": "맛집", "식당": "맛집", "음식점": "맛집", "밥집": "맛집",
+    "술집": "술집", "호프": "술집", "bar": "바", "베이커리": "베이커리", "빵집": "베이커리",
+    "호텔": "호텔", "숙소": "숙소", "펜션": "펜션", "게스트하우스": "게스트하우스",
+    "전시회": "전시회", "전시": "전시회", "미술관": "미술관", "박물관": "박물관",
+    "야시장": "야시장", "시장": "시장", "공원": "공원", "관광지": "관광지", "놀거리": "놀거리",
+}
+# 음식/메뉴 키워드 (카페·맛집 앞에 붙는 핵심어)
+_FOODS = {
+    "소금빵", "브런치", "디저트", "케이크", "빙수", "커피", "빵",
+    "삼겹살", "돼지갈비", "소갈비", "갈비", "곱창", "막창", "족발", "보쌈", "치킨", "피자",
+    "파스타", "초밥", "스시", "라멘", "우동", "돈까스", "국밥", "냉면", "칼국수", "짬뽕",
+    "짜장면", "중식", "한식", "일식", "양식", "회", "해산물", "조개구이", "고기", "한우",
+    "떡볶이", "햄버거", "수제버거", "쌀국수", "마라탕", "샤브샤브", "닭갈비", "해장국",
+}
+# 의미 없는 표현 (규칙 판단에서 무시)
+_STOPWORDS = {
+    "좋은", "하기", "괜찮은", "유명한", "가볼만한", "가고", "싶어", "싶은", "보이는",
+    "곳", "데", "할", "만한", "수", "있는", "집", "거", "것", "가장", "제일", "진짜", "정말",
+    "요즘", "핫한", "인기", "인기있는", "가까운", "하는", "먹을", "갈",
+}
+# 맛 표현: 카페와 같이 오면 예시처럼 "맛집 카페"
+_TASTE = {"맛있는", "맛있고", "맛있어요", "맛있게", "맛있다", "맛난", "맛좋은"}
+# 요청 어미/부사 (단어 단위로만 제거, 여러 단어 표현은 단어 순서로 비교)
+_FILLERS = [
+    "추천해 주세요", "추천해 줘", "추천 좀", "알려 주세요", "알려 줘", "찾아 주세요", "찾아 줘",
+    "이 근처", "해 줘",
+    "추천해주세요", "추천해줘", "추천", "알려주세요", "알려줘", "찾아주세요", "찾아줘",
+    "있을까요", "있나요", "어디야", "어디", "해줘", "좀", "혹시", "근처", "주변", "여기",
+]
+# 사전에 없는 단어에서 떼어도 안전한 조사 (이/가/면 등은 음식 이름 끝과 겹쳐서 제외)
+_SAFE_PARTICLES = ("에서", "으로", "을", "를", "의")
+# 사전 단어 뒤에 붙은 조사 (떼고 난 말이 사전에 있을 때만 뗌)
+_PARTICLES = ("에서", "으로", "이", "가", "을", "를", "은", "는", "의", "로", "에", "도")
+# 규칙으로 처리하지 않고 LLM에 맡길 의도 (길찾기, 부정 표현 등)
+# 안/못은 단어 앞(안 비싼, 못가는), 없/않/별로 등은 어디에 있어도 부정으로 봄
+_RX_LLM_ONLY = re.compile(
+    r"가는\s*(방법|길)|어떻게\s*가|에서\s*.+까지|체험"
+    r"|(^|\s)(안|못)|없|않|별로|말고|싫|아닌|아니|빼고|제외"
+)
+_RX_FOOD_HOUSE = re.compile(r"^(.+?)집$")  # 삼겹살집 → 삼겹살
+_RX_VERB_SUFFIX = re.compile(r"(하기|하는|할)$")  # 회식하기 → 회식
+_RX_PUNCT = re.compile(r"[^\w\s]")
+
+_stats = {"rule": 0, "llm_cache": 0, "llm": 0}
+
+_MODIFIER_SEQS = sorted(
+    ((tuple(phrase.split()), mod) for phrase, mod in _MODIFIERS.items()),
+    key=lambda kv: -len(kv[0]),
+)  # 긴 표현부터 매칭 ("바다가 보이는"이 "바다가"보다 먼저)
+_SINGLE_MODIFIERS = {seq[0] for seq, _ in _MODIFIER_SEQS if len(seq) == 1}
+_FILLER_SEQS = sorted((tuple(f.split()) for f in _FILLERS), key=lambda seq: -len(seq))
+_SINGLE_FILLERS = {seq[0] for seq in _FILLER_SEQS if len(seq) == 1}
+_KNOWN = (
+    _SINGLE_MODIFIERS | set(_CATEGORIES) | _FOODS | _STOPWORDS | _TASTE
+)
+
+
+def _match_seq(tokens: List[str], i: int, seq: Tuple[str, ...]) -> bool:
+    return tuple(tokens[i : i + len(seq)]) == seq
+
+
+def _tokenize(query: str) -> List[str]:
+    """소문자 + 문장부호 제거 후 단어 단위로 요청 어미 제거 (단어 안쪽은 건드리지 않음)"""
+    tokens = _RX_PUNCT.sub(" ", query.lower()).split()
+    out: List[str] = []
+    i = 0
+    while i < len(tokens):
+        for seq in _FILLER_SEQS:
+            if _match_seq(tokens, i, seq):
+                i += len(seq)
+                break
+        else:
+            if not _is_filler(tokens[i]):
+                out.append(tokens[i])
+            i += 1
+    return out
+
+
+def _is_filler(token: str) -> bool:
+    # 근처에서, 여기서 처럼 조사가 붙은 요청 어미
+    return any(
+        token == f + p for f in _SINGLE_FILLERS for p in ("에서", "서", "의", "에")
+    )
+
+
+def _base_word(token: str) -> str:
+    """
+    사전 단어는 그대로, 아니면 명시적인 규칙으로만 어미/조사를 뗌:
+    - 회식하기 → 회식 (뗀 말이 수식어일 때)
+    - 카페를 → 카페, 소금빵이 → 소금빵 (뗀 말이 사전에 있을 때)
+    - 강남역에서 → 강남역 (사전에 없으면 _SAFE_PARTICLES만)
+    """
+    if token in _KNOWN or _RX_FOOD_HOUSE.match(token):
+        return token
+    base = _RX_VERB_SUFFIX.sub("", token)
+    if base in _SINGLE_MODIFIERS:
+        return base
+    for p in _PARTICLES:
+        stem = token[: -len(p)]
+        if token.endswith(p) and len(stem) >= 1 and (
+            stem in _KNOWN or (_RX_FOOD_HOUSE.match(stem) and len(stem) >= 3)
+        ):
+            return stem
+    for p in _SAFE_PARTICLES:
+        if token.endswith(p) and len(token) - len(p) >= 2:
+            return token[: -len(p)]
+    return token
+
+
+def get_refine_stats() -> Dict[str, int]:
+    return dict(_stats)
+
+
+def rule_based_refine(location_text: str, query: str) -> Optional[str]:
+    """
+    자주 나오는 패턴(키워드 + 수식어 + 장소 종류)은 LLM 없이 검색 쿼리로 변환.
+    모든 비교는 단어 단위 ("비싼"이 "싼"으로, "싼타페"가 "싼"으로 잡히지 않도록)
+    부정 표현(안/못/없/않/별로/말고 등)이 있거나, 장소 종류가 없거나 2개 이상이거나,
+    해석 못 한 단어가 2개 이상이면 None (LLM으로 넘김)
+    """
+    if _RX_LLM_ONLY.search(query):
+        return None
+    tokens = [_base_word(t) for t in _tokenize(query)]
+
+    modifiers: List[str] = []
+    rest: List[str] = []
+    i = 0
+    while i < len(tokens):
+        for seq, mod in _MODIFIER_SEQS:
+            if _match_seq(tokens, i, seq):
+                if mod not in modifiers:
+                    modifiers.append(mod)
+                i += len(seq)
+                break
+        else:
+            rest.append(tokens[i])
+            i += 1
+
+    loc_tokens = set(location_text.split()) if location_text else set()
+    categories: List[str] = []
+    keywords: List[str] = []
+    unknown: List[str] = []
+    tasty = False
+    for token in rest:
+        if token in _STOPWORDS or any(token in loc for loc in loc_tokens):
+            continue
+        if token in _TASTE:
+            tasty = True
+            continue
+        if len(token) == 1 and token not in _FOODS:
+            # 조사 등 한 글자는 무시 (부정어 안/못은 위에서 이미 LLM으로 넘김)
+            continue
+        if token in _CATEGORIES:
+            if _CATEGORIES[token] not in categories:
+                categories.append(_CATEGORIES[token])
+            continue
+        m = _RX_FOOD_HOUSE.match(token)
+        if token in _FOODS or (m and m.group(1) in _FOODS):
+            food = m.group(1) if m and token not in _FOODS else token
+            if food not in keywords:
+                keywords.append(food)
+            if m and token not in _FOODS and "맛집" not in categories:
+                categories.append("맛집")
+            continue
+        unknown.append(token)
+
+    if len(categories) != 1 or len(unknown) > 1:
+        return None
+    category = categories[0]
+    foods = bool(keywords)
+    keywords += unknown  # 모르는 단어 1개는 핵심어로 사용 (예: 지역 특산물)
+
+    parts = [location_text] if location_text else []
+    parts += modifiers + keywords
+    # 예시처럼 음식 키워드(또는 맛 표현) + 카페는 "맛집 카페"
+    if category == "카페" and (foods or tasty):
+        parts.append("맛집")
+    if category == "맛집" and parts[-1:] == ["맛집"]:
+        return " ".join(parts)
+    parts.append(category)
+    return " ".join(parts)
+
+
 async def refine_query(location_text: str, query: str) -> str:
+    """
+    사용자 요청 → 네이버 검색 쿼리.
+    1) 규칙 기반 변환 (확신이 있을 때만) 2) (위치, 정규화한 질문) 캐시 3) LLM
+    """
+    if REFINE_RULES:
+        refined = rule_based_refine(location_text, query)
+        if refined:
+            _stats["rule"] += 1
+            return refined
+
+    cache_key = f"refine::{location_text}::{' '.join(_tokenize(query))}"
+    cached = await load_cache_async(cache_key)
+    if cached:
+        _stats["llm_cache"] += 1
+        return cached
+
+    refined = (await _refine_with_llm(location_text, query)).strip()
+    _stats["llm"] += 1
+    if refined:
+        await save_cache_async(cache_key, refined, REFINE_CACHE_TTL)
+    return refined
+
+
+async def _refine_with_llm(location_text: str, query: str) -> str:
 
-    llm = ChatOpenAI(model_name="gpt-4o", temperature=0.0001, max_tokens=64)
+    registry = get_llm_registry()
+    llm = registry.get("gpt-4o", temperature=0.0001, max_tokens=64)
 
     prompt_text = """## 개선된 검색 쿼리 생성 프롬프트
 
@@ -77,4 +305,5 @@ async def refine_query(location_text: str, query: str) -> str:
     
     chain = prompt | llm | StrOutputParser()
 
-    return chain.invoke({"query": query, "location_text": location_text})
+    async with registry.slot("gpt-4o"):
+        return await chain.ainvoke({"query": query, "location_text": location_text})
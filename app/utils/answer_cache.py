@@ -0,0 +1,204 @@
+"""
+답변 캐시 (비슷한 질문 재사용).
+
+같은 위치에서 몇 분 전에 나온 질문과 거의 같은 질문이면
+refine_query / 크롤링 / run_chain을 건너뛰고 저장된 GuideResponse를 그대로 반환.
+- 키: 해석된 주소 + 모델 + 정규화한 질문
+- 유사도: 단어 + 글자 2~3-gram을 해싱한 희소 벡터의 코사인 유사도 (외부 의존성 없음)
+  정규화 단계에서 요청 어미("추천해줘", "알려줘"), 조사, 행정구역 접미사를 단어 단위로 제거
+  "강남 브런치 카페 추천" ↔ "강남구 브런치 카페 알려줘" 같은 표현 차이를 흡수
+- 부정 표현(말고/빼고/제외/없/않/안/못/불가 등)이 다르면 유사도와 무관하게 miss
+  ("소금빵 카페" ↔ "소금빵 카페 말고"는 글자가 거의 같아도 반대 의미)
+- ANSWER_CACHE_TTL(초), ANSWER_CACHE_THRESHOLD(0~1), ANSWER_CACHE_ENABLED=0 으로 끄기
+"""
+
+import os
+import re
+import math
+import time
+import zlib
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from app.utils.cache_util import load_cache_async, save_cache_async
+
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "1") == "1"
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", "1800"))
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.85"))
+ANSWER_CACHE_MAX_PER_LOCATION = 50
+
+_DIM = 1 << 14
+_NGRAMS = (2, 3)
+
+# 의미 없이 붙는 요청 어미/부사 (단어 단위로만 제거, 여러 단어 표현은 단어 순서로 비교)
+_FILLERS = [
+    "추천해 주세요", "추천해 줘", "추천 좀", "알려 주세요", "알려 줘",
+    "찾아 주세요", "찾아 줘", "해 줘", "이 근처",
+    "추천해주세요", "추천해줘", "추천", "알려주세요", "알려줘", "찾아주세요", "찾아줘",
+    "있을까요", "있나요", "있어", "어디야", "어디", "해줘", "좀", "혹시",
+    "근처", "주변", "여기", "여기서",
+]
+_FILLER_SEQS = sorted((tuple(f.split()) for f in _FILLERS), key=lambda seq: -len(seq))
+# 단어 끝 조사: 명사 끝과 잘 겹치지 않는 것만 (이/가/로/도/에는 떡볶이·인도 등과 겹쳐서 제외)
+_RX_PARTICLE = re.compile(r"(에서|으로|을|를|은|는|의)$")
+# 행정구역 접미사: 구/시/군만 (동/읍/면은 냉면·우동 등 음식 이름과 겹침)
+_RX_REGION_SUFFIX = re.compile(r"(구|시|군)$")
+# 부정 표현: 안/못은 따로 쓰였거나 되/돼/가 앞일 때만 (안동 제외),
+# 불은 불가능/불편 등으로 한정 (불고기 제외)
+_RX_NEGATION = re.compile(
+    r"말고|빼고|제외|없|않|(?:^|\s)(?:안|못)(?=\s|$|되|돼|가)|불(?:가|편|친절|만족|허)"
+)
+_RX_PUNCT = re.compile(r"[^\w\s]")
+_TOKEN_WEIGHT = 2.0  # 단어 전체 일치에 주는 가중치 (수식어 차이를 더 크게 반영)
+
+
+def _strip_token(token: str) -> str:
+    # 떼고 남는 말이 2글자 이상일 때만 (강남구 → 강남, 카페를 → 카페, 냉면은 그대로)
+    stripped = _RX_PARTICLE.sub("", token)
+    if len(stripped) >= 2:
+        token = stripped
+    stripped = _RX_REGION_SUFFIX.sub("", token)
+    if len(stripped) >= 2:
+        token = stripped
+    return token
+
+
+def normalize_query(query: str) -> str:
+    # 조사를 먼저 떼고 비교해야 "근처에서" 같은 어미도 단어 단위로 걸러짐
+    tokens = [_strip_token(t) for t in _RX_PUNCT.sub(" ", query.lower()).split()]
+    out: List[str] = []
+    i = 0
+    while i < len(tokens):
+        for seq in _FILLER_SEQS:
+            if tuple(tokens[i : i + len(seq)]) == seq:
+                i += len(seq)
+                break
+        else:
+            out.append(tokens[i])
+            i += 1
+    return " ".join(out)
+
+
+def negation_markers(text: str) -> FrozenSet[str]:
+    """부정 표현 집합 (두 질문의 집합이 다르면 비슷해 보여도 다른 질문)"""
+    return frozenset(m.group(0).strip() for m in _RX_NEGATION.finditer(text))
+
+
+def _vectorize(text: str) -> Dict[int, float]:
+    vec: Dict[int, float] = {}
+    for token in text.split():
+        idx = zlib.crc32(f"w:{token}".encode("utf-8")) % _DIM
+        vec[idx] = vec.get(idx, 0.0) + _TOKEN_WEIGHT
+        padded = f" {token} "
+        for n in _NGRAMS:
+            for i in range(len(padded) - n + 1):
+                idx = zlib.crc32(padded[i : i + n].encode("utf-8")) % _DIM
+                vec[idx] = vec.get(idx, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+    return {k: v / norm for k, v in vec.items()}
+
+
+def similarity(a: str, b: str) -> float:
+    if negation_markers(a) != negation_markers(b):
+        return 0.0
+    va, vb = _vectorize(a), _vectorize(b)
+    if len(va) > len(vb):
+        va, vb = vb, va
+    return sum(w * vb.get(k, 0.0) for k, w in va.items())
+
+
+class AnswerCache:
+    def __init__(
+        self, ttl: int = ANSWER_CACHE_TTL, threshold: float = ANSWER_CACHE_THRESHOLD
+    ):
+        self.ttl = ttl
+        self.threshold = threshold
+        self._vectors: Dict[str, Dict[int, float]] = {}
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def _index_key(address: str, model: str) -> str:
+        return f"answer_index::{model}::{address}"
+
+    @staticmethod
+    def _answer_key(address: str, model: str, norm: str) -> str:
+        return f"answer::{model}::{address}::{norm}"
+
+    def _vector(self, norm: str) -> Dict[int, float]:
+        vec = self._vectors.get(norm)
+        if vec is None:
+            if len(self._vectors) > 10000:
+                self._vectors.clear()
+            vec = self._vectors[norm] = _vectorize(norm)
+        return vec
+
+    def _best_match(
+        self, norm: str, index: List[List[Any]]
+    ) -> Tuple[Optional[str], float]:
+        now = time.time()
+        qv = self._vector(norm)
+        negations = negation_markers(norm)
+        best, best_sim = None, 0.0
+        for cand, saved_at in index:
+            if now - saved_at > self.ttl or negation_markers(cand) != negations:
+                continue
+            cv = self._vector(cand)
+            sim = sum(w * cv.get(k, 0.0) for k, w in qv.items())
+            if sim > best_sim:
+                best, best_sim = cand, sim
+        return best, best_sim
+
+    async def lookup(
+        self, address: Optional[str], query: str, model: str
+    ) -> Optional[Tuple[Dict[str, Any], float, str]]:
+        """(저장된 응답, 유사도, 매칭된 정규화 질문) 또는 None"""
+        if not ANSWER_CACHE_ENABLED or not address:
+            return None
+        norm = normalize_query(query)
+        index = await load_cache_async(self._index_key(address, model)) or []
+        cand, sim = self._best_match(norm, index)
+        if cand is not None and sim >= self.threshold:
+            response = await load_cache_async(self._answer_key(address, model, cand))
+            if response is not None:
+                self.stats["hits"] += 1
+                return response, sim, cand
+        self.stats["misses"] += 1
+        return None
+
+    async def store(
+        self, address: Optional[str], query: str, model: str, response: Dict[str, Any]
+    ) -> None:
+        if not ANSWER_CACHE_ENABLED or not address:
+            return
+        norm = normalize_query(query)
+        now = time.time()
+        index_key = self._index_key(address, model)
+        index = await load_cache_async(index_key) or []
+        # 만료된 항목과 같은 질문은 빼고 최신 것을 뒤에 추가
+        index = [
+            [q, at] for q, at in index if q != norm and now - at <= self.ttl
+        ][-(ANSWER_CACHE_MAX_PER_LOCATION - 1) :]
+        index.append([norm, now])
+        await save_cache_async(self._answer_key(address, model, norm), response, self.ttl)
+        await save_cache_async(index_key, index, self.ttl)
+        self.stats["stores"] += 1
+
+    def health(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "threshold": self.threshold,
+            "ttl": self.ttl,
+        }
+
+
+# 전역 인스턴스
+_answer_cache: Optional[AnswerCache] = None
+
+
+def get_answer_cache() -> AnswerCache:
+    """AnswerCache 싱글톤 인스턴스 반환"""
+    global _answer_cache
+    if _answer_cache is None:
+        _answer_cache = AnswerCache()
+    return _answer_cache
@@ -0,0 +1,235 @@
+"""
+프로세스 전역 Chromium 브라우저 풀.
+
+크롤러마다 async_playwright() + chromium.launch()를 새로 하던 것을
+앱 수명 동안 하나의 브라우저를 띄워두고 컨텍스트/페이지만 빌려주는 방식으로 바꾼다.
+- 프로필(mobile / desktop)별로 미리 설정된 컨텍스트를 발급
+- 브라우저 연결 상태 확인(health check) 후 끊겼으면 재기동
+- 페이지 N개를 발급하면 브라우저를 교체(recycle)해 메모리 누수 방지
+- 앱 종료 시 close()로 정리
+"""
+
+import os
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.utils.resource_blocker import apply_resource_blocking, get_block_stats
+
+UA_MOBILE = (
+    "Mozilla/5.0 (Linux; Android 10; Pixel 3) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/124.0.0.0 Mobile Safari/537.36"
+)
+UA_DESKTOP = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36"
+)
+
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+_STEALTH_SCRIPT = """
+  Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+  window.chrome = { runtime: {} };
+  const originalQuery = window.navigator.permissions.query;
+  window.navigator.permissions.query = (parameters) =>
+    parameters.name === 'notifications'
+      ? Promise.resolve({ state: Notification.permission })
+      : originalQuery(parameters);
+  Object.defineProperty(navigator, 'plugins', {get: () => [1,2,3,4,5]});
+  Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR','ko']});
+"""
+
+# 크롤러별 컨텍스트 설정
+PROFILES: Dict[str, Dict[str, Any]] = {
+    # m.place / m.search 용 (리뷰, 블로그 링크, pid)
+    "mobile": {
+        "user_agent": UA_MOBILE,
+        "viewport": {"width": 420, "height": 900},
+        "java_script_enabled": True,
+        "locale": "ko-KR",
+    },
+    # map.naver.com 용 (사진 탭)
+    "desktop": {
+        "user_agent": UA_DESKTOP,
+        "viewport": {"width": 1366, "height": 900},
+        "java_script_enabled": True,
+        "locale": "ko-KR",
+        "bypass_csp": True,
+        "ignore_https_errors": True,
+    },
+}
+_PROFILE_INIT_SCRIPTS: Dict[str, str] = {"desktop": _STEALTH_SCRIPT}
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        headless: Optional[bool] = None,
+        max_pages_per_browser: int = int(os.getenv("BROWSER_MAX_PAGES", "200")),
+        max_contexts: int = int(os.getenv("BROWSER_MAX_CONTEXTS", "8")),
+    ):
+        self.headless = (
+            headless if headless is not None else os.getenv("HEADLESS", "1") != "0"
+        )
+        self.max_pages_per_browser = max_pages_per_browser
+        self._sem = asyncio.Semaphore(max_contexts)
+        self._lock = asyncio.Lock()
+        self._pw = None
+        self._browser = None
+        self._served = 0  # 현재 브라우저가 발급한 페이지 수
+        self._active: Dict[Any, int] = {}  # 브라우저별 사용 중 페이지 수
+        self._retired: set = set()  # 교체 대기 중인 브라우저
+        self.stats = {"launches": 0, "recycles": 0, "restarts": 0, "pages": 0}
+
+    async def start(self) -> None:
+        async with self._lock:
+            await self._ensure_browser()
+
+    async def close(self) -> None:
+        async with self._lock:
+            browsers = list(self._retired)
+            if self._browser is not None:
+                browsers.append(self._browser)
+            for b in browsers:
+                try:
+                    await b.close()
+                except Exception:
+                    pass
+            self._browser = None
+            self._retired.clear()
+            self._active.clear()
+            if self._pw is not None:
+                try:
+                    await self._pw.stop()
+                except Exception:
+                    pass
+                self._pw = None
+
+    def is_healthy(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.is_healthy(),
+            "served": self._served,
+            "active": sum(self._active.values()),
+            **self.stats,
+            "resource_blocking": get_block_stats(),
+        }
+
+    async def _launch(self):
+        if self._pw is None:
+            from playwright.async_api import async_playwright
+
+            self._pw = await async_playwright().start()
+        browser = await self._pw.chromium.launch(
+            headless=self.headless, args=LAUNCH_ARGS
+        )
+        self.stats["launches"] += 1
+        self._served = 0
+        self._active[browser] = 0
+        return browser
+
+    async def _retire(self, browser) -> None:
+        # 사용 중인 페이지가 있으면 반납될 때 닫는다
+        if self._active.get(browser, 0) > 0 and browser.is_connected():
+            self._retired.add(browser)
+            return
+        self._active.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def _ensure_browser(self):
+        b = self._browser
+        if b is not None and not b.is_connected():
+            # 크래시/연결 끊김 → 재기동
+            self.stats["restarts"] += 1
+            self._active.pop(b, None)
+            b = self._browser = None
+        if b is not None and self._served >= self.max_pages_per_browser:
+            self.stats["recycles"] += 1
+            await self._retire(b)
+            b = self._browser = None
+        if b is None:
+            b = self._browser = await self._launch()
+        return b
+
+    async def _acquire_browser(self):
+        async with self._lock:
+            browser = await self._ensure_browser()
+            self._served += 1
+            self._active[browser] = self._active.get(browser, 0) + 1
+            self.stats["pages"] += 1
+            return browser
+
+    async def _release_browser(self, browser) -> None:
+        async with self._lock:
+            if browser in self._active:
+                self._active[browser] -= 1
+            if browser in self._retired and self._active.get(browser, 0) <= 0:
+                self._retired.discard(browser)
+                await self._retire(browser)
+
+    @asynccontextmanager
+    async def page(
+        self,
+        profile: str = "mobile",
+        block_resources: bool = False,
+        default_timeout_ms: Optional[int] = None,
+        navigation_timeout_ms: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        프로필에 맞게 설정된 새 컨텍스트의 페이지를 빌려준다.
+        컨텍스트는 블록을 벗어나면 닫히므로 쿠키/스토리지가 요청 간 섞이지 않는다.
+        block_resources=True면 이미지/미디어/폰트/CSS/분석 호스트를 브라우저 레벨에서 차단.
+        """
+        async with self._sem:
+            browser = await self._acquire_browser()
+            ctx = None
+            try:
+                ctx = await browser.new_context(**PROFILES[profile])
+                init_script = _PROFILE_INIT_SCRIPTS.get(profile)
+                if init_script:
+                    await ctx.add_init_script(init_script)
+                page = await ctx.new_page()
+                if block_resources:
+                    await apply_resource_blocking(ctx, page)
+                if default_timeout_ms is not None:
+                    page.set_default_timeout(default_timeout_ms)
+                if navigation_timeout_ms is not None:
+                    page.set_default_navigation_timeout(navigation_timeout_ms)
+                yield page
+            finally:
+                if ctx is not None:
+                    try:
+                        await ctx.close()
+                    except Exception:
+                        pass
+                await self._release_browser(browser)
+
+
+# 전역 인스턴스
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """BrowserPool 싱글톤 인스턴스 반환"""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
@@ -0,0 +1,233 @@
+"""
+SQLite(WAL) 기반 캐시 저장소.
+
+키마다 pickle 파일을 하나씩 쓰던 cache_util을 대체한다.
+- 항목별 TTL (만료된 항목은 조회 시 miss 처리, gc 때 삭제)
+- 전체 용량 상한(CACHE_MAX_MB)을 넘으면 오래 안 쓴 항목부터 삭제 (LRU, accessed 기준)
+- 쓰기는 트랜잭션 단위 → 중간에 죽어도 반쯤 쓰인 항목이 남지 않음
+- 값은 JSON(+zlib) 직렬화: pickle 대신 안전하고 작음. tuple은 list로 돌아옴
+- hit/miss/expired/write/eviction 카운터, 비동기 API(aget/aset)
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+CACHE_MAX_MB = int(os.getenv("CACHE_MAX_MB", "256"))
+CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", str(7 * 24 * 3600)))
+_COMPRESS_MIN = 1024  # 이 크기 이상이면 zlib 압축
+_TOUCH_INTERVAL = 30.0  # accessed 갱신 최소 간격(초), 조회마다 쓰기가 생기지 않도록
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key      TEXT PRIMARY KEY,
+    value    BLOB NOT NULL,
+    size     INTEGER NOT NULL,
+    created  REAL NOT NULL,
+    expires  REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed);
+CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires);
+"""
+
+
+def _db_path() -> str:
+    path = os.getenv("CACHE_DB_PATH")
+    if path:
+        return path
+    # 프로젝트 루트 기준 cache 디렉토리
+    here = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(here, "cache", "cache.sqlite3")
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _compress(raw: bytes) -> bytes:
+    if len(raw) >= _COMPRESS_MIN:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def _decompress(blob: bytes) -> bytes:
+    tag, body = blob[:1], blob[1:]
+    if tag == b"z":
+        body = zlib.decompress(body)
+    return body
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    created_at: float
+    expires_at: Optional[float]  # None이면 만료 없음
+    size: int = 0  # 압축 전 JSON 크기(bytes), L1 용량 계산에 사용
+
+
+class CacheStore:
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.path = path or _db_path()
+        self.max_bytes = max_bytes if max_bytes is not None else CACHE_MAX_MB * 1024 * 1024
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=10
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()[0]
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evictions": 0}
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created, expires, accessed FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            blob, created, expires, accessed = row
+            if expires is not None and expires <= now:
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            if now - accessed > _TOUCH_INTERVAL:
+                self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+        try:
+            raw = _decompress(blob)
+            value = json.loads(raw.decode("utf-8"))
+        except Exception:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return CacheEntry(value, created, expires, len(raw))
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def set(
+        self, key: str, value: Any, ttl: Optional[float] = CACHE_DEFAULT_TTL
+    ) -> CacheEntry:
+        """
+        ttl(초)이 None/0이면 만료 없음.
+        저장된 JSON을 다시 읽은 항목을 반환 → 조회 결과와 같은 타입(list 등), 호출자 객체와 분리
+        """
+        raw = _encode(value)
+        blob = _compress(raw)
+        now = time.time()
+        expires = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                old = self._conn.execute(
+                    "SELECT size FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache(key, value, size, created, expires, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), now, expires, now),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._total += len(blob) - (old[0] if old else 0)
+            self.stats["writes"] += 1
+            if self._total > self.max_bytes:
+                self._evict_locked()
+        return CacheEntry(json.loads(raw.decode("utf-8")), now, expires, len(raw))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM cache WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._total -= row[0]
+
+    def _evict_locked(self) -> None:
+        # 만료된 항목 먼저, 그래도 넘치면 오래 안 쓴 순서로 상한의 90%까지
+        removed = self._conn.execute(
+            "DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (time.time(),)
+        ).rowcount
+        target = int(self.max_bytes * 0.9)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()[0]
+        if self._total > target:
+            victims = []
+            excess = self._total - target
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM cache ORDER BY accessed"
+            ).fetchall():
+                victims.append((key,))
+                excess -= size
+                self._total -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+            removed += len(victims)
+        self.stats["evictions"] += removed
+
+    def gc(self) -> None:
+        with self._lock:
+            self._evict_locked()
+
+    def health(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "bytes": self._total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # 비동기 API: sqlite 호출은 스레드에서 실행해 이벤트 루프를 막지 않음
+    async def aget_entry(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self.get_entry, key)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(
+        self, key: str, value: Any, ttl: Optional[float] = CACHE_DEFAULT_TTL
+    ) -> CacheEntry:
+        return await asyncio.to_thread(self.set, key, value, ttl)
+
+
+# 전역 인스턴스
+_cache_store: Optional[CacheStore] = None
+_init_lock = threading.Lock()
+
+
+def get_cache_store() -> CacheStore:
+    """CacheStore 싱글톤 인스턴스 반환"""
+    global _cache_store
+    if _cache_store is None:
+        with _init_lock:
+            if _cache_store is None:
+                _cache_store = CacheStore()
+    return _cache_store
+
+
+def close_cache_store() -> None:
+    global _cache_store
+    if _cache_store is not None:
+        _cache_store.close()
+        _cache_store = None
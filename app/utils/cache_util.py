@@ -1,37 +1,74 @@
-import os
-import pickle
-import hashlib
-from typing import Any, Optional
+"""
+캐시 facade: L1(프로세스 메모리 LRU) → L2(cache_store, SQLite WAL).
+기존 호출부는 load_cache / save_cache 그대로, 비동기 코드는 *_async 사용.
+L1 hit은 스레드 전환 없이 바로 반환된다.
+L1에는 호출자가 넘긴 객체가 아니라 L2에 저장된 JSON을 다시 읽은 값을 넣으므로
+어느 티어에서 꺼내도 같은 타입(tuple → list)이고, 저장 후 호출자가 객체를 바꿔도 영향이 없다.
+저장 시각/만료 시각이 필요하면 load_cache_entry_async (stale-while-revalidate 용).
+"""
 
+from typing import Any, Dict, Optional
 
-def _cache_dir() -> str:
-    # 프로젝트 루트 기준 cache 디렉토리
-    here = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    cdir = os.path.join(here, "cache")
-    os.makedirs(cdir, exist_ok=True)
-    return cdir
+from app.utils.cache_store import CACHE_DEFAULT_TTL, CacheEntry, get_cache_store
+from app.utils.memory_cache import get_memory_cache
 
 
-def _key_to_path(key: str) -> str:
-    h = hashlib.md5(key.encode("utf-8")).hexdigest()
-    return os.path.join(_cache_dir(), f"{h}.pkl")
+def load_cache_entry(key: str) -> Optional[CacheEntry]:
+    l1 = get_memory_cache()
+    entry = l1.get_entry(key)
+    if entry is not None:
+        return entry
+    try:
+        entry = get_cache_store().get_entry(key)
+    except Exception:
+        return None
+    if entry is not None:
+        l1.set(key, entry)
+    return entry
 
 
-def load_cache(key: str) -> Optional[Any]:
-    path = _key_to_path(key)
-    if not os.path.exists(path):
-        return None
+async def load_cache_entry_async(key: str) -> Optional[CacheEntry]:
+    l1 = get_memory_cache()
+    entry = l1.get_entry(key)
+    if entry is not None:
+        return entry
     try:
-        with open(path, "rb") as f:
-            return pickle.load(f)
+        entry = await get_cache_store().aget_entry(key)
     except Exception:
         return None
+    if entry is not None:
+        l1.set(key, entry)
+    return entry
+
+
+def load_cache(key: str) -> Optional[Any]:
+    entry = load_cache_entry(key)
+    return entry.value if entry is not None else None
 
 
-def save_cache(key: str, data: Any) -> None:
-    path = _key_to_path(key)
+def save_cache(key: str, data: Any, ttl: Optional[float] = CACHE_DEFAULT_TTL) -> None:
     try:
-        with open(path, "wb") as f:
-            pickle.dump(data, f)
+        entry = get_cache_store().set(key, data, ttl)
     except Exception:
-        pass
+        return
+    get_memory_cache().set(key, entry)
+
+
+async def load_cache_async(key: str) -> Optional[Any]:
+    entry = await load_cache_entry_async(key)
+    return entry.value if entry is not None else None
+
+
+async def save_cache_async(
+    key: str, data: Any, ttl: Optional[float] = CACHE_DEFAULT_TTL
+) -> None:
+    try:
+        entry = await get_cache_store().aset(key, data, ttl)
+    except Exception:
+        return
+    get_memory_cache().set(key, entry)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """티어별 hit ratio 등 (healthz용)"""
+    return {"l1": get_memory_cache().health(), "l2": get_cache_store().health()}
@@ -1,15 +1,35 @@
 from typing import Optional, Tuple
-import requests
 from ..config import settings
+from .http_pool import get_async_client, get_sync_client
+from .geo_cache import get_reverse_geo_cache
 import os
 
-def geocode_address(address):
-    url = f"https://maps.apigw.ntruss.com/map-geocode/v2/geocode?query={address}"
-    headers = {
+GEOCODE_URL = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
+REVERSE_GEOCODE_URL = "https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc"
+
+
+def _map_headers():
+    return {
         'X-NCP-APIGW-API-KEY-ID': settings.naver_map_client_id,
         'X-NCP-APIGW-API-KEY': settings.naver_map_reversegeocode_client_secret
     }
-    response = requests.get(url, headers=headers)
+
+
+def geocode_address(address):
+    response = get_sync_client("naver_maps").get(
+        GEOCODE_URL, params={"query": address}, headers=_map_headers()
+    )
+    return _parse_geocode(response)
+
+
+async def geocode_address_async(address):
+    response = await get_async_client("naver_maps").get(
+        GEOCODE_URL, params={"query": address}, headers=_map_headers()
+    )
+    return _parse_geocode(response)
+
+
+def _parse_geocode(response):
     if response.status_code == 200:
         data = response.json()
         if data['addresses']:
@@ -22,20 +42,28 @@ def geocode_address(address):
         return None, None
         
 
-def naver_reverse_address(lat: float, lng: float):
-    url = "https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc"
-    headers = {
-        "X-NCP-APIGW-API-KEY-ID": settings.naver_map_client_id,
-        "X-NCP-APIGW-API-KEY": settings.naver_map_reversegeocode_client_secret,
-    }
-    params = {
+def _reverse_params(lat: float, lng: float):
+    return {
         "request": "coordsToaddr",
         "coords": f"{lng},{lat}",
         "sourcecrs": "epsg:4326",
         "output": "json",
         "orders": "roadaddr,addr,admcode",  # 도로명/지번/행정구역
     }
-    r = requests.get(url, headers=headers, params=params)
+
+
+def naver_reverse_address(lat: float, lng: float):
+    r = get_sync_client("naver_maps").get(
+        REVERSE_GEOCODE_URL, headers=_map_headers(), params=_reverse_params(lat, lng)
+    )
+    r.raise_for_status()
+    return r.json()
+
+
+async def naver_reverse_address_async(lat: float, lng: float):
+    r = await get_async_client("naver_maps").get(
+        REVERSE_GEOCODE_URL, headers=_map_headers(), params=_reverse_params(lat, lng)
+    )
     r.raise_for_status()
     return r.json()
 
@@ -147,12 +175,17 @@ def extract_clean_address(geocoding_result: dict) -> str:
     return address_info["main_address"]
 
 
+async def _reverse_clean_address(lat: float, lng: float) -> str:
+    adress_json = await naver_reverse_address_async(lat, lng)
+    return extract_clean_address(adress_json)
+
+
 async def resolve_location(
     location_text: Optional[str], lat: Optional[float], lng: Optional[float]
 ):
     if lat is not None and lng is not None:
-        adress_json = naver_reverse_address(lat, lng)
-        address = extract_clean_address(adress_json)
+        # 근처 위치(같은 geohash 셀)는 캐시된 읍/면/동 주소를 재사용
+        address = await get_reverse_geo_cache().resolve(lat, lng, _reverse_clean_address)
         return (lat, lng, address)
     if location_text:
         return (None, None, location_text)
@@ -0,0 +1,98 @@
+"""
+역지오코딩 결과 캐시 (geohash 셀 단위).
+
+resolve_location은 매 요청마다 raw 위경도로 reverse geocode를 호출하지만,
+extract_clean_address 결과는 읍/면/동 수준이라 수백 m 안에서는 거의 같다.
+위경도를 geohash 셀로 묶어서 셀당 한 번만 호출하고 결과를 디스크 캐시에 보관.
+- REVERSE_GEO_PRECISION: geohash 자릿수 (6 ≈ 1.2km x 0.6km, 7 ≈ 150m x 150m, 기본 7)
+- REVERSE_GEO_TTL: 보관 기간(초, 기본 30일)
+"""
+
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.utils.cache_util import load_cache_async, save_cache_async
+from app.utils.single_flight import single_flight
+
+REVERSE_GEO_PRECISION = int(os.getenv("REVERSE_GEO_PRECISION", "7"))
+REVERSE_GEO_TTL = int(os.getenv("REVERSE_GEO_TTL", str(30 * 24 * 3600)))
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# 실패 응답은 캐시하지 않음
+_FAILED = {"지오코딩 실패", "주소 정보 없음", ""}
+
+
+def geohash(lat: float, lng: float, precision: int = REVERSE_GEO_PRECISION) -> str:
+    lat_rng, lng_rng = [-90.0, 90.0], [-180.0, 180.0]
+    out, bits, ch, even = [], 0, 0, True
+    while len(out) < precision:
+        rng, val = (lng_rng, lng) if even else (lat_rng, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if val >= mid:
+            ch = (ch << 1) | 1
+            rng[0] = mid
+        else:
+            ch <<= 1
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            out.append(_BASE32[ch])
+            bits, ch = 0, 0
+    return "".join(out)
+
+
+class ReverseGeoCache:
+    def __init__(self, precision: int = REVERSE_GEO_PRECISION, ttl: int = REVERSE_GEO_TTL):
+        self.precision = precision
+        self.ttl = ttl
+        self._live_ms_avg = 0.0  # 실제 API 호출 평균 소요 시간 (절약 시간 추정용)
+        self.stats = {"hits": 0, "misses": 0, "saved_ms": 0.0}
+
+    async def resolve(
+        self, lat: float, lng: float, fetch: Callable[[float, float], Awaitable[str]]
+    ) -> str:
+        """셀 캐시에 있으면 반환, 없으면 fetch(lat, lng)로 주소를 구해 저장"""
+        cell = geohash(lat, lng, self.precision)
+        key = f"revgeo::{self.precision}::{cell}"
+        cached = await load_cache_async(key)
+        if cached:
+            self.stats["hits"] += 1
+            self.stats["saved_ms"] += self._live_ms_avg
+            return cached
+        self.stats["misses"] += 1
+
+        async def _fetch() -> str:
+            t0 = time.perf_counter()
+            address = await fetch(lat, lng)
+            ms = (time.perf_counter() - t0) * 1000
+            self._live_ms_avg = ms if not self._live_ms_avg else self._live_ms_avg * 0.8 + ms * 0.2
+            if address not in _FAILED:
+                await save_cache_async(key, address, self.ttl)
+            return address
+
+        return await single_flight(key, _fetch)
+
+    def health(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "saved_ms": int(self.stats["saved_ms"]),
+            "live_ms_avg": int(self._live_ms_avg),
+            "precision": self.precision,
+        }
+
+
+# 전역 인스턴스
+_reverse_geo_cache: Optional[ReverseGeoCache] = None
+
+
+def get_reverse_geo_cache() -> ReverseGeoCache:
+    """ReverseGeoCache 싱글톤 인스턴스 반환"""
+    global _reverse_geo_cache
+    if _reverse_geo_cache is None:
+        _reverse_geo_cache = ReverseGeoCache()
+    return _reverse_geo_cache
@@ -0,0 +1,139 @@
+"""
+앱 전역 HTTP 클라이언트 레지스트리.
+
+호출마다 httpx.AsyncClient / httpx.Client / requests를 새로 만들면
+openapi.naver.com, search.naver.com, pstatic.net 등에 매번 TLS 핸드셰이크를 다시 함.
+호스트 그룹별로 커넥션 풀을 하나씩 두고 keep-alive + HTTP/2(h2 설치 시)로 재사용한다.
+시작 시 warm-up, 종료 시 close_http_clients()로 정리.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    _HAS_H2 = True
+except Exception:
+    _HAS_H2 = False
+
+UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36"
+)
+HDRS = {"User-Agent": UA, "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8"}
+
+# 호스트 그룹별 설정 (인증 헤더는 호출부에서 요청 단위로 넘김)
+CLIENT_PROFILES: Dict[str, Dict[str, Any]] = {
+    # openapi.naver.com (검색 API: local / blog / webkr)
+    "naver_openapi": {
+        "headers": {"User-Agent": "TravelGuide/0.1 (FastAPI)"},
+        "timeout": httpx.Timeout(10.0, connect=5.0),
+        "limits": httpx.Limits(
+            max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+        ),
+    },
+    # maps.apigw.ntruss.com (geocode / reverse geocode)
+    "naver_maps": {
+        "timeout": httpx.Timeout(10.0, connect=5.0),
+        "limits": httpx.Limits(
+            max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+        ),
+    },
+    # search.naver.com, m.search.naver.com, m.place.naver.com (HTML 파싱)
+    "naver_web": {
+        "headers": HDRS,
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "follow_redirects": True,
+        "limits": httpx.Limits(
+            max_connections=30, max_keepalive_connections=15, keepalive_expiry=30
+        ),
+    },
+    # m.blog.naver.com 본문 (기존 requests 폴백과 동일하게 인증서 검증 생략)
+    "naver_blog": {
+        "headers": HDRS,
+        "timeout": httpx.Timeout(12.0, connect=5.0),
+        "follow_redirects": True,
+        "verify": False,
+        "limits": httpx.Limits(
+            max_connections=30, max_keepalive_connections=15, keepalive_expiry=30
+        ),
+    },
+    # *.pstatic.net 이미지
+    "image": {
+        "headers": HDRS,
+        "timeout": httpx.Timeout(15.0, connect=5.0),
+        "follow_redirects": True,
+        "limits": httpx.Limits(
+            max_connections=40, max_keepalive_connections=20, keepalive_expiry=30
+        ),
+    },
+}
+
+
+class HttpClientRegistry:
+    def __init__(self, http2: bool = _HAS_H2):
+        self.http2 = http2
+        self._async: Dict[str, httpx.AsyncClient] = {}
+        self._sync: Dict[str, httpx.Client] = {}
+
+    def get_async(self, name: str) -> httpx.AsyncClient:
+        client = self._async.get(name)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(http2=self.http2, **CLIENT_PROFILES[name])
+            self._async[name] = client
+        return client
+
+    def get_sync(self, name: str) -> httpx.Client:
+        """아직 동기 코드에서 호출되는 곳(스크립트, 스레드풀)용"""
+        client = self._sync.get(name)
+        if client is None or client.is_closed:
+            client = httpx.Client(http2=self.http2, **CLIENT_PROFILES[name])
+            self._sync[name] = client
+        return client
+
+    def start(self) -> None:
+        for name in CLIENT_PROFILES:
+            self.get_async(name)
+
+    async def aclose(self) -> None:
+        for client in self._async.values():
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+        for client in self._sync.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        self._async.clear()
+        self._sync.clear()
+
+
+# 전역 인스턴스
+_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_registry() -> HttpClientRegistry:
+    """HttpClientRegistry 싱글톤 인스턴스 반환"""
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry()
+    return _registry
+
+
+def get_async_client(name: str) -> httpx.AsyncClient:
+    return get_http_registry().get_async(name)
+
+
+def get_sync_client(name: str) -> httpx.Client:
+    return get_http_registry().get_sync(name)
+
+
+async def close_http_clients() -> None:
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
@@ -0,0 +1,173 @@
+"""
+원본 URL 해시 기반(content-addressed) 장소 이미지 저장소.
+
+요청마다 images/를 비우고 Place_{n}_{i}.jpg로 덮어쓰던 방식 대신
+- 파일명 = sha256(원본 URL + 리사이즈 옵션) → 같은 사진은 한 번만 받음
+- 임시 파일에 쓰고 os.replace로 교체 → 동시 요청이 같은 파일을 써도 안전
+- 용량 상한(IMAGE_STORE_MAX_MB)을 넘으면 오래 안 쓴 파일부터 삭제 (LRU, mtime 기준)
+- 브라우저가 WebP를 받으면 jpg에서 WebP 변형을 한 번만 만들어 같이 보관
+"""
+
+import io
+import os
+import re
+import time
+import hashlib
+import threading
+from typing import List, Optional, Tuple
+
+try:
+    from PIL import Image, features
+
+    _HAS_WEBP = bool(features.check("webp"))
+except Exception:
+    _HAS_WEBP = False
+
+IMAGE_STORE_MAX_MB = int(os.getenv("IMAGE_STORE_MAX_MB", "200"))
+IMAGE_WEBP = os.getenv("IMAGE_WEBP", "1") == "1" and _HAS_WEBP
+IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+IMAGE_EXT = ".jpg"
+WEBP_EXT = ".webp"
+_RX_IMAGE_ID = re.compile(r"^[0-9a-f]{32}$")
+_TMP_MAX_AGE_SEC = 3600
+
+
+def _images_dir() -> str:
+    # 프로젝트 루트 기준 images 디렉토리
+    here = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(here, "images")
+
+
+class ImageStore:
+    def __init__(self, root: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.root = root or _images_dir()
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else IMAGE_STORE_MAX_MB * 1024 * 1024
+        )
+        os.makedirs(self.root, exist_ok=True)
+        self._gc_lock = threading.Lock()
+        self._bytes_since_gc = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "webp_encodes": 0,
+        }
+
+    @staticmethod
+    def image_id(source_url: str, variant: str = "") -> str:
+        return hashlib.sha256(f"{source_url}|{variant}".encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def is_valid_id(image_id: str) -> bool:
+        return bool(_RX_IMAGE_ID.match(image_id))
+
+    def path(self, image_id: str, ext: str = IMAGE_EXT) -> str:
+        return os.path.join(self.root, f"{image_id}{ext}")
+
+    def exists(self, image_id: str) -> bool:
+        return os.path.exists(self.path(image_id))
+
+    def lookup(self, image_id: str) -> bool:
+        """있으면 mtime을 갱신(LRU touch)하고 True"""
+        try:
+            os.utime(self.path(image_id))
+        except OSError:
+            self.stats["misses"] += 1
+            return False
+        self.stats["hits"] += 1
+        return True
+
+    def _write(self, dst: str, data: bytes) -> str:
+        """원자적 쓰기: 같은 디렉토리의 임시 파일 → os.replace"""
+        tmp = f"{dst}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, dst)
+        self._bytes_since_gc += len(data)
+        # 상한의 10%만큼 새로 쓸 때마다 GC
+        if self._bytes_since_gc >= self.max_bytes // 10:
+            self.gc()
+        return dst
+
+    def put(self, image_id: str, data: bytes) -> str:
+        self.stats["writes"] += 1
+        return self._write(self.path(image_id), data)
+
+    def webp_path(self, image_id: str) -> Optional[str]:
+        """
+        WebP 변형 경로 반환 (없으면 jpg에서 만들어 저장).
+        WebP 미지원이거나 변환 실패 시 None → 호출부는 jpg를 그대로 씀. 블로킹이므로 스레드에서 호출.
+        """
+        if not IMAGE_WEBP:
+            return None
+        dst = self.path(image_id, WEBP_EXT)
+        if os.path.exists(dst):
+            return dst
+        try:
+            with Image.open(self.path(image_id)) as img:
+                buf = io.BytesIO()
+                img.save(buf, format="WEBP", quality=IMAGE_WEBP_QUALITY, method=4)
+        except Exception:
+            return None
+        self.stats["webp_encodes"] += 1
+        return self._write(dst, buf.getvalue())
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        out = []
+        now = time.time()
+        for fn in os.listdir(self.root):
+            fp = os.path.join(self.root, fn)
+            try:
+                st = os.stat(fp)
+            except OSError:
+                continue
+            if fn.endswith(".tmp"):
+                # 크래시로 남은 임시 파일 정리
+                if now - st.st_mtime > _TMP_MAX_AGE_SEC:
+                    try:
+                        os.remove(fp)
+                    except OSError:
+                        pass
+                continue
+            # 저장소가 만든 파일만 GC 대상
+            stem, ext = os.path.splitext(fn)
+            if ext in (IMAGE_EXT, WEBP_EXT) and _RX_IMAGE_ID.match(stem):
+                out.append((st.st_mtime, st.st_size, fp))
+        return out
+
+    def gc(self) -> int:
+        """총 용량이 max_bytes 이하가 될 때까지 오래 안 쓴 파일부터 삭제, 삭제 개수 반환"""
+        if not self._gc_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._bytes_since_gc = 0
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, fp in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(fp)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    pass
+            self.stats["evictions"] += removed
+            return removed
+        finally:
+            self._gc_lock.release()
+
+
+# 전역 인스턴스
+_image_store: Optional[ImageStore] = None
+
+
+def get_image_store() -> ImageStore:
+    """ImageStore 싱글톤 인스턴스 반환"""
+    global _image_store
+    if _image_store is None:
+        _image_store = ImageStore()
+    return _image_store
@@ -0,0 +1,149 @@
+"""
+앱 전역 LLM 클라이언트 레지스트리.
+
+run_chain / stream_chain / refine_query가 호출마다 ChatOpenAI를 새로 만들어서
+매 요청이 새 HTTP 클라이언트로 api.openai.com에 TLS 핸드셰이크부터 다시 했다.
+- (model, temperature, max_tokens)별로 ChatOpenAI 인스턴스를 하나씩 두고 재사용
+- 모든 인스턴스가 keep-alive httpx.AsyncClient 하나(커넥션 풀)를 공유
+- 모델별 동시 호출 상한: LLM_MAX_CONCURRENCY (기본 8),
+  모델별로는 LLM_MAX_CONCURRENCY_<모델명 대문자, 영숫자 외는 _> (예: LLM_MAX_CONCURRENCY_GPT_4O=4)
+- 모델별 in-flight / 대기 수는 health()로 확인 (healthz)
+종료 시 close_llm_clients()로 정리.
+"""
+
+import os
+import re
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from app.config import settings
+from app.utils.http_pool import _HAS_H2
+
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+# 답변 생성은 수십 초 걸리므로 읽기 타임아웃을 넉넉하게
+LLM_HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+LLM_HTTP_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=120
+)
+
+_LLMKey = Tuple[str, float, Optional[int]]
+
+
+def _model_limit(model: str) -> int:
+    env = "LLM_MAX_CONCURRENCY_" + re.sub(r"[^0-9A-Za-z]", "_", model).upper()
+    return max(1, int(os.getenv(env, str(LLM_MAX_CONCURRENCY))))
+
+
+class LLMRegistry:
+    def __init__(self, http2: bool = _HAS_H2):
+        self.http2 = http2
+        self._http: Optional[httpx.AsyncClient] = None
+        self._llms: Dict[_LLMKey, ChatOpenAI] = {}
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._models: Dict[str, Dict[str, int]] = {}
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=self.http2, timeout=LLM_HTTP_TIMEOUT, limits=LLM_HTTP_LIMITS
+            )
+            # 닫힌 클라이언트를 들고 있는 인스턴스는 버림
+            self._llms.clear()
+        return self._http
+
+    def get(
+        self, model: str, temperature: float = 0.1, max_tokens: Optional[int] = None
+    ) -> ChatOpenAI:
+        """(model, temperature, max_tokens)별 ChatOpenAI 인스턴스 (없으면 생성)"""
+        http_client = self._http_client()
+        key = (model, float(temperature), max_tokens)
+        llm = self._llms.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                api_key=settings.openai_api_key or None,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                http_async_client=http_client,
+            )
+            self._llms[key] = llm
+        return llm
+
+    def _model_stats(self, model: str) -> Dict[str, int]:
+        st = self._models.get(model)
+        if st is None:
+            st = self._models[model] = {
+                "limit": _model_limit(model),
+                "inflight": 0,
+                "waiting": 0,
+                "calls": 0,
+            }
+            self._sems[model] = asyncio.Semaphore(st["limit"])
+        return st
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[None]:
+        """모델별 동시 호출 상한 안에서 실행 (스트리밍은 끝날 때까지 슬롯 점유)"""
+        st = self._model_stats(model)
+        st["waiting"] += 1
+        try:
+            await self._sems[model].acquire()
+        finally:
+            st["waiting"] -= 1
+        st["inflight"] += 1
+        st["calls"] += 1
+        try:
+            yield
+        finally:
+            st["inflight"] -= 1
+            self._sems[model].release()
+
+    async def ainvoke(
+        self,
+        messages: Any,
+        model: str,
+        temperature: float = 0.1,
+        max_tokens: Optional[int] = None,
+    ) -> Any:
+        llm = self.get(model, temperature, max_tokens)
+        async with self.slot(model):
+            return await llm.ainvoke(messages)
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "instances": len(self._llms),
+            "models": {k: dict(v) for k, v in self._models.items()},
+        }
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            try:
+                await self._http.aclose()
+            except Exception:
+                pass
+        self._http = None
+        self._llms.clear()
+
+
+# 전역 인스턴스
+_registry: Optional[LLMRegistry] = None
+
+
+def get_llm_registry() -> LLMRegistry:
+    """LLMRegistry 싱글톤 인스턴스 반환"""
+    global _registry
+    if _registry is None:
+        _registry = LLMRegistry()
+    return _registry
+
+
+async def close_llm_clients() -> None:
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
@@ -0,0 +1,95 @@
+"""
+디버그용 이벤트 루프 정지(stall) 감지기.
+
+루프 안에서 interval마다 heartbeat를 찍고, 별도 감시 스레드가 heartbeat가
+threshold 이상 밀리면 그 순간 루프 스레드의 스택을 출력한다.
+→ 동기 I/O, 무거운 파싱 등 루프를 막는 콜백을 찾는 용도.
+
+LOOP_STALL_DEBUG=1 일 때만 켜짐, 기준 시간은 LOOP_STALL_MS (기본 100ms).
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from typing import Optional
+
+LOOP_STALL_DEBUG = os.getenv("LOOP_STALL_DEBUG", "0") == "1"
+LOOP_STALL_MS = int(os.getenv("LOOP_STALL_MS", "100"))
+
+
+class LoopStallDetector:
+    def __init__(self, threshold_ms: int = LOOP_STALL_MS, interval_ms: int = 20):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.stalls = 0
+        self._last = time.perf_counter()
+        self._loop_thread_id: Optional[int] = None
+        self._beat_task: Optional[asyncio.Task] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._last = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        reported_for = None
+        while not self._stop.wait(self.interval):
+            last = self._last
+            lag = time.perf_counter() - last
+            if lag < self.threshold or reported_for == last:
+                continue
+            # 같은 정지에 대해서는 한 번만 보고
+            reported_for = last
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "(스택 없음)"
+            print(
+                f"[loop-stall] 이벤트 루프가 {lag * 1000:.0f} ms 이상 멈춤\n{stack}",
+                file=sys.stderr,
+            )
+
+    def start(self) -> None:
+        if self._beat_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last = time.perf_counter()
+        self._stop.clear()
+        self._beat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watch_thread = threading.Thread(
+            target=self._watch, name="loop-stall-detector", daemon=True
+        )
+        self._watch_thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._beat_task is not None:
+            self._beat_task.cancel()
+            self._beat_task = None
+
+
+# 전역 인스턴스
+_detector: Optional[LoopStallDetector] = None
+
+
+def start_loop_stall_detector() -> Optional[LoopStallDetector]:
+    """LOOP_STALL_DEBUG=1이면 실행 중인 루프에 감지기를 붙임 (startup 훅에서 호출)"""
+    global _detector
+    if not LOOP_STALL_DEBUG:
+        return None
+    if _detector is None:
+        _detector = LoopStallDetector()
+        _detector.start()
+        print(f"이벤트 루프 stall 감지 활성화 (기준 {LOOP_STALL_MS} ms)")
+    return _detector
+
+
+def stop_loop_stall_detector() -> None:
+    global _detector
+    if _detector is not None:
+        _detector.stop()
+        _detector = None
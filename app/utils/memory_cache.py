@@ -0,0 +1,92 @@
+"""
+프로세스 내 L1 캐시 (디스크 캐시 앞단).
+
+자주 묻는 장소는 매번 SQLite 조회 + 역직렬화를 거치지 않고 메모리에서 바로 반환.
+- 용량은 압축 전 JSON 크기(bytes) 기준으로 계산, CACHE_L1_MB를 넘으면 LRU로 제거
+  (파이썬 객체는 JSON보다 크므로 실제 메모리 사용량은 이보다 다소 큼)
+- 만료 시각은 디스크 항목의 것을 그대로 물려받음 (L1이 디스크보다 오래 살지 않음)
+주의: 같은 객체를 여러 요청이 공유하므로 꺼낸 값을 수정하지 말 것.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.utils.cache_store import CacheEntry
+
+CACHE_L1_MB = int(os.getenv("CACHE_L1_MB", "32"))
+
+_MISSING = object()
+
+
+class MemoryLRU:
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes if max_bytes is not None else CACHE_L1_MB * 1024 * 1024
+        self._data: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry.expires_at is None or entry.expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry
+                # 만료 → 제거
+                del self._data[key]
+                self._bytes -= entry.size
+            self.stats["misses"] += 1
+            return None
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else default
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes // 4:
+            # 너무 큰 항목은 L1에 두지 않음 (다른 항목을 다 밀어내지 않도록)
+            self.pop(key)
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._data[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes and self._data:
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= evicted.size
+                self.stats["evictions"] += 1
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+
+    def health(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 전역 인스턴스
+_memory_cache: Optional[MemoryLRU] = None
+
+
+def get_memory_cache() -> MemoryLRU:
+    """MemoryLRU 싱글톤 인스턴스 반환"""
+    global _memory_cache
+    if _memory_cache is None:
+        _memory_cache = MemoryLRU()
+    return _memory_cache
@@ -0,0 +1,179 @@
+"""
+크롤러 공용 대기 유틸.
+
+wait_for_timeout(고정 sleep) 대신 페이지 상태를 보고 기다린다.
+- wait_for_count  : 셀렉터 요소가 n개 이상 될 때까지 (이미 있으면 즉시 반환)
+- wait_for_growth : 요소 개수가 before보다 늘어날 때까지
+- wait_for_dom_quiet : MutationObserver로 DOM 변경이 quiet_ms 동안 멈출 때까지
+- wait_for_endpoint_idle : 특정 URL(예: graphql) 요청이 모두 끝날 때까지
+모든 함수는 timeout이 있고, 실패해도 예외 대신 False를 반환한다.
+label(크롤러 이름)별로 대기 시간을 누적해 get_wait_stats()로 확인 가능.
+"""
+
+import time
+import asyncio
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+_COUNT_JS = """
+([sel, minCount, timeoutMs]) => new Promise((resolve) => {
+  const ok = () => document.querySelectorAll(sel).length >= minCount;
+  if (ok()) return resolve(true);
+  const obs = new MutationObserver(() => { if (ok()) done(true); });
+  const hard = setTimeout(() => done(ok()), timeoutMs);
+  function done(v) { obs.disconnect(); clearTimeout(hard); resolve(v); }
+  obs.observe(document.documentElement || document, {childList: true, subtree: true});
+})
+"""
+
+_QUIET_JS = """
+([quietMs, timeoutMs]) => new Promise((resolve) => {
+  let quiet = setTimeout(() => done(true), quietMs);
+  const obs = new MutationObserver(() => {
+    clearTimeout(quiet);
+    quiet = setTimeout(() => done(true), quietMs);
+  });
+  const hard = setTimeout(() => done(false), timeoutMs);
+  function done(v) { obs.disconnect(); clearTimeout(quiet); clearTimeout(hard); resolve(v); }
+  obs.observe(document.documentElement || document,
+              {childList: true, subtree: true, attributes: true, attributeFilter: ['src', 'style', 'class']});
+})
+"""
+
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _record(label: str, started: float) -> None:
+    ms = (time.perf_counter() - started) * 1000
+    st = _stats.setdefault(label, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+    st["count"] += 1
+    st["total_ms"] += ms
+    st["max_ms"] = max(st["max_ms"], ms)
+    logger.debug(f"[wait:{label}] {ms:.0f} ms")
+
+
+def get_wait_stats() -> Dict[str, Dict[str, Any]]:
+    return {
+        k: {
+            "count": int(v["count"]),
+            "total_ms": int(v["total_ms"]),
+            "avg_ms": int(v["total_ms"] / v["count"]) if v["count"] else 0,
+            "max_ms": int(v["max_ms"]),
+        }
+        for k, v in _stats.items()
+    }
+
+
+async def wait_for_count(
+    target, selector: str, min_count: int = 1, timeout_ms: int = 3000, label: str = "default"
+) -> bool:
+    """target(page/frame)에 selector 요소가 min_count개 이상 생길 때까지 대기"""
+    t0 = time.perf_counter()
+    try:
+        return bool(await target.evaluate(_COUNT_JS, [selector, min_count, timeout_ms]))
+    except Exception:
+        return False
+    finally:
+        _record(label, t0)
+
+
+async def wait_for_growth(
+    target, selector: str, before: int, timeout_ms: int = 1800, label: str = "default"
+) -> bool:
+    """selector 요소 개수가 before보다 많아질 때까지 대기"""
+    return await wait_for_count(target, selector, before + 1, timeout_ms, label)
+
+
+async def wait_for_dom_quiet(
+    target, quiet_ms: int = 80, timeout_ms: int = 1500, label: str = "default"
+) -> bool:
+    """DOM 변경(노드 추가/삭제, src·style·class 변경)이 quiet_ms 동안 없으면 반환"""
+    t0 = time.perf_counter()
+    try:
+        return bool(await target.evaluate(_QUIET_JS, [quiet_ms, timeout_ms]))
+    except Exception:
+        return False
+    finally:
+        _record(label, t0)
+
+
+class EndpointTracker:
+    """
+    url_part가 포함된 요청의 in-flight 수를 추적.
+    클릭 전에 만들어두고, 클릭 후 wait_idle()로 해당 요청들이 끝날 때까지 대기.
+    """
+
+    def __init__(self, page, url_part: str):
+        self.page = page
+        self.url_part = url_part
+        self.inflight = 0
+        self.seen = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _match(self, req) -> bool:
+        return self.url_part in req.url
+
+    def _on_request(self, req) -> None:
+        if self._match(req):
+            self.inflight += 1
+            self.seen += 1
+            self._idle.clear()
+
+    def _on_done(self, req) -> None:
+        if self._match(req):
+            self.inflight = max(0, self.inflight - 1)
+            if self.inflight == 0:
+                self._idle.set()
+
+    def detach(self) -> None:
+        for ev, fn in (
+            ("request", self._on_request),
+            ("requestfinished", self._on_done),
+            ("requestfailed", self._on_done),
+        ):
+            try:
+                self.page.remove_listener(ev, fn)
+            except Exception:
+                pass
+
+    async def wait_idle(
+        self, timeout_ms: int = 3000, start_ms: int = 300, label: str = "default"
+    ) -> bool:
+        """
+        요청이 시작되길 최대 start_ms 기다린 뒤, in-flight가 0이 될 때까지 대기.
+        start_ms 안에 요청이 하나도 안 나가면 바로 반환.
+        """
+        t0 = time.perf_counter()
+        try:
+            seen_before = self.seen
+            deadline = t0 + timeout_ms / 1000
+            while self.seen == seen_before and self._idle.is_set():
+                if (time.perf_counter() - t0) * 1000 >= start_ms:
+                    return True
+                await asyncio.sleep(0.02)
+            remaining = max(0.0, deadline - time.perf_counter())
+            await asyncio.wait_for(self._idle.wait(), timeout=remaining)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            _record(label, t0)
+
+
+async def wait_for_endpoint_idle(
+    page, url_part: str, action=None, timeout_ms: int = 3000, label: str = "default"
+) -> bool:
+    """action(코루틴 함수)을 실행하고, 그로 인해 나간 url_part 요청이 모두 끝날 때까지 대기"""
+    tracker = EndpointTracker(page, url_part)
+    try:
+        if action is not None:
+            await action()
+        return await tracker.wait_idle(timeout_ms=timeout_ms, label=label)
+    finally:
+        tracker.detach()
@@ -0,0 +1,113 @@
+"""
+크롤러 공용 리소스 차단 정책.
+
+ctx.route("**/*", ...)로 모든 서브리퀘스트를 파이썬까지 끌고 와서 확장자를 검사하던 방식 대신,
+페이지마다 CDP Network.setBlockedURLs를 한 번 설정해 브라우저 안에서 바로 차단한다.
+차단 건수(리소스 타입별)와 통과한 리소스의 전송 바이트는 RESOURCE_BLOCK_STATS=1일 때만
+전역 카운터로 집계 (요청마다 CDP 이벤트를 파이썬으로 받아야 해서 기본은 끔).
+(차단된 요청은 아예 전송되지 않으므로 '아낀 바이트'는 측정할 수 없음)
+"""
+
+import os
+from typing import Any, Dict, List
+
+RESOURCE_BLOCK_STATS = os.getenv("RESOURCE_BLOCK_STATS", "0") == "1"
+
+BLOCKED_EXTENSIONS = {
+    "image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif", "bmp"],
+    "media": ["mp4", "webm", "m3u8", "mp3", "ogg"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "stylesheet": ["css"],
+}
+
+# 분석/광고 호스트 (place 페이지 본문 렌더링과 무관)
+BLOCKED_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "wcs.naver.net",
+    "lcs.naver.com",
+    "nlog.naver.com",
+    "tivan.naver.com",
+    "veta.naver.com",
+    "adcr.naver.com",
+]
+
+# CDP를 못 쓰는 경우(route 폴백)에 쓰는 playwright resource_type 기준
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+
+def blocked_url_patterns(block_stylesheets: bool = True) -> List[str]:
+    patterns: List[str] = []
+    for kind, exts in BLOCKED_EXTENSIONS.items():
+        if kind == "stylesheet" and not block_stylesheets:
+            continue
+        for ext in exts:
+            patterns.append(f"*.{ext}")
+            patterns.append(f"*.{ext}?*")
+    for host in BLOCKED_HOSTS:
+        patterns.append(f"*{host}/*")
+    return patterns
+
+
+class BlockStats:
+    def __init__(self):
+        self.blocked = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.loaded = 0
+        self.loaded_bytes = 0
+
+    def on_failed(self, event: Dict[str, Any]) -> None:
+        if not event.get("blockedReason"):
+            return
+        self.blocked += 1
+        t = (event.get("type") or "Other").lower()
+        self.blocked_by_type[t] = self.blocked_by_type.get(t, 0) + 1
+
+    def on_finished(self, event: Dict[str, Any]) -> None:
+        self.loaded += 1
+        self.loaded_bytes += int(event.get("encodedDataLength") or 0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "blocked_requests": self.blocked,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "loaded_requests": self.loaded,
+            "loaded_bytes": self.loaded_bytes,
+        }
+
+
+_stats = BlockStats()
+
+
+def get_block_stats() -> Dict[str, Any]:
+    return {"enabled": RESOURCE_BLOCK_STATS, **_stats.as_dict()}
+
+
+async def _route_fallback(route, req):
+    if req.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        h in req.url for h in BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def apply_resource_blocking(ctx, page, block_stylesheets: bool = True) -> None:
+    """page 하나에 차단 정책을 설정 (새 페이지마다 1회)"""
+    try:
+        cdp = await ctx.new_cdp_session(page)
+        # setBlockedURLs는 Network 도메인이 켜져 있을 때만 적용됨
+        await cdp.send("Network.enable")
+        await cdp.send(
+            "Network.setBlockedURLs",
+            {"urls": blocked_url_patterns(block_stylesheets)},
+        )
+        if RESOURCE_BLOCK_STATS:
+            cdp.on("Network.loadingFailed", _stats.on_failed)
+            cdp.on("Network.loadingFinished", _stats.on_finished)
+    except Exception as e:
+        # Chromium이 아니거나 CDP 세션 실패 시 resource_type 기반 route로 폴백
+        print(f"CDP 리소스 차단 실패, route 폴백 사용: {e}")
+        await ctx.route("**/*", _route_fallback)
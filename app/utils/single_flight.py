@@ -0,0 +1,58 @@
+"""
+동시 요청 합치기(single-flight).
+
+같은 지역에서 여러 사용자가 동시에 물어보면 같은 장소/pid/블로그를 각자 크롤링했다.
+키가 같은 작업이 이미 실행 중이면 새로 시작하지 않고 그 결과(예외 포함)를 같이 기다린다.
+- 작업은 Task로 실행하고 호출자는 shield로 기다림 → 먼저 부른 쪽이 취소돼도 나머지는 결과를 받음
+- 끝나면 키를 지우므로 결과를 보관하지 않음 (보관은 캐시의 몫)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"calls": 0, "shared": 0}
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 호출자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key로 실행 중인 작업이 있으면 합류, 없으면 fn()을 실행"""
+        self.stats["calls"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+        else:
+            self.stats["shared"] += 1
+        return await asyncio.shield(task)
+
+    def is_inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def health(self) -> Dict[str, Any]:
+        return {**self.stats, "inflight": len(self._inflight)}
+
+
+# 전역 인스턴스
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """SingleFlight 싱글톤 인스턴스 반환"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+async def single_flight(key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+    return await get_single_flight().do(key, fn)
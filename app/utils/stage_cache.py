@@ -0,0 +1,114 @@
+"""
+장소 수집 단계별 캐시.
+
+place_ctx 캐시는 user_query까지 키에 들어가서, 같은 장소를 다른 말로 물어보면
+pid/이미지/좌표/리뷰/블로그를 전부 다시 크롤링했다.
+단계마다 user_query와 무관한 키로 따로 캐시하고 TTL도 단계별로 둔다.
+- pid        : 검색어 → place id
+- place      : 검색어 → 지역검색 결과(Place)
+- images     : 검색어 → image_id 목록
+- geocode    : 도로명주소 → (lat, lng)
+- reviews    : pid → 방문자 리뷰 목록
+- blog_links : pid → 블로그 리뷰 링크 목록
+- blog_body  : 블로그 URL → 본문(title, text)
+TTL은 STAGE_TTL_<STAGE 대문자> 환경변수(초)로 조정.
+단계별 소요 시간/캐시 hit 수는 get_stage_stats()로 확인 (healthz, warm-up 요약).
+"""
+
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.utils.cache_util import load_cache_async, save_cache_async
+from app.utils.single_flight import single_flight
+
+_DAY = 24 * 3600
+
+_DEFAULT_TTLS: Dict[str, int] = {
+    "pid": 30 * _DAY,
+    "place": 7 * _DAY,
+    "images": 7 * _DAY,
+    "geocode": 30 * _DAY,
+    "reviews": 1 * _DAY,
+    "blog_links": 3 * _DAY,
+    "blog_body": 14 * _DAY,
+}
+
+STAGE_TTLS: Dict[str, int] = {
+    stage: int(os.getenv(f"STAGE_TTL_{stage.upper()}", str(ttl)))
+    for stage, ttl in _DEFAULT_TTLS.items()
+}
+
+
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def record_stage(stage: str, started: float, hit: bool = False) -> None:
+    """단계 하나의 소요 시간 기록 (cached_stage 밖에서 도는 단계도 여기로 기록)"""
+    ms = (time.perf_counter() - started) * 1000
+    st = _stats.setdefault(
+        stage, {"count": 0, "hits": 0, "total_ms": 0.0, "max_ms": 0.0}
+    )
+    st["count"] += 1
+    st["hits"] += int(hit)
+    st["total_ms"] += ms
+    st["max_ms"] = max(st["max_ms"], ms)
+
+
+def get_stage_stats() -> Dict[str, Dict[str, Any]]:
+    return {
+        k: {
+            "count": int(v["count"]),
+            "hits": int(v["hits"]),
+            "total_ms": int(v["total_ms"]),
+            "avg_ms": int(v["total_ms"] / v["count"]) if v["count"] else 0,
+            "max_ms": int(v["max_ms"]),
+        }
+        for k, v in _stats.items()
+    }
+
+
+def stage_key(stage: str, key: str) -> str:
+    return f"stage::{stage}::{key}"
+
+
+async def load_stage(stage: str, key: str) -> Optional[Any]:
+    return await load_cache_async(stage_key(stage, key))
+
+
+async def save_stage(stage: str, key: str, value: Any) -> None:
+    await save_cache_async(stage_key(stage, key), value, STAGE_TTLS[stage])
+
+
+async def cached_stage(
+    stage: str,
+    key: str,
+    producer: Callable[[], Awaitable[Any]],
+    valid: Callable[[Any], bool] = bool,
+) -> Any:
+    """
+    캐시에 있으면 반환, 없으면 producer()를 실행해서 저장.
+    valid(value)가 False인 결과(빈 목록, None 등)는 저장하지 않음 → 다음 요청에서 재시도
+    캐시된 값도 valid로 다시 확인 (예: 이미지 파일이 GC로 지워진 경우)
+    같은 (stage, key)를 동시에 요청하면 producer는 한 번만 실행 (single-flight)
+    """
+    t0 = time.perf_counter()
+    cached = await load_stage(stage, key)
+    if cached is not None and valid(cached):
+        record_stage(stage, t0, hit=True)
+        return cached
+
+    async def _produce() -> Any:
+        # 앞선 작업이 방금 끝나 캐시에 들어갔을 수 있으므로 한 번 더 확인
+        cached = await load_stage(stage, key)
+        if cached is not None and valid(cached):
+            return cached
+        value = await producer()
+        if valid(value):
+            await save_stage(stage, key, value)
+        return value
+
+    try:
+        return await single_flight(stage_key(stage, key), _produce)
+    finally:
+        record_stage(stage, t0)
@@ -0,0 +1,279 @@
+"""
+피크 시간 전 캐시 미리 채우기 (warm-up CLI).
+
+guide_query와 같은 파이프라인(search_local → pick_top → build_context)을 일괄 실행해서
+pid / 이미지 / 좌표 / 리뷰 / 블로그 / 장소 컨텍스트 캐시를 채운다.
+
+사용 예:
+  python -m app.warmup --pairs "서울특별시 마포구 서교동:카페" --pairs "부산광역시 해운대구 우동:맛집"
+  python -m app.warmup --pairs-file regions.tsv --concurrency 2 --rate 20 --no-llm
+  python -m app.warmup --queries-file past_queries.tsv --state warmup_state.jsonl
+
+- pairs-file  : 한 줄에 "지역<TAB>카테고리" (탭이 없으면 마지막 쉼표로 구분)
+- queries-file: 한 줄에 "주소<TAB>사용자 질문" 또는 {"address": ..., "query": ...} JSON
+지역/주소는 resolve_location이 만드는 형식(예: 서울특별시 마포구 서교동)과 같아야 캐시 키가 맞는다.
+--state 파일에 끝난 작업을 기록하므로 중단 후 같은 명령으로 이어서 실행 가능.
+
+캐시 키 정렬:
+- 단계 캐시(pid/이미지/좌표/리뷰/블로그 링크·본문)는 질문과 무관 → 같은 장소를 묻는 모든 요청이 재사용
+- 장소 컨텍스트 캐시는 guide_query와 같은 키(질문 앞 50자 + 블로그 정제 여부)로 저장.
+  카테고리(pairs)는 그 단어를 그대로 질문으로 쓰므로 같은 문장으로 물어본 요청만 바로 맞음
+- --no-llm은 블로그 정제를 하지 않으므로 장소 컨텍스트 키가 요청 경로와 달라짐 → 단계 캐시만 채움
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.naver_client import NaverClient, pick_top
+from app.utils.Build_context import build_context, wait_for_refreshes
+from app.utils.browser_pool import get_browser_pool, close_browser_pool
+from app.utils.http_pool import get_http_registry, close_http_clients
+from app.utils.cache_store import close_cache_store
+from app.utils.llm_pool import close_llm_clients
+from app.utils.cache_util import get_cache_stats
+from app.utils.stage_cache import get_stage_stats
+
+
+@dataclass
+class WarmupJob:
+    address: str
+    query: str  # pairs는 카테고리, queries-file은 사용자 질문 (둘 다 질문으로 취급)
+    from_user: bool  # True면 queries-file 출처 (job_id 구분용)
+
+    @property
+    def job_id(self) -> str:
+        raw = f"{self.address}|{self.query}|{int(self.from_user)}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _split_pair(line: str) -> Optional[List[str]]:
+    if "\t" in line:
+        parts = line.split("\t", 1)
+    elif "," in line:
+        parts = line.rsplit(",", 1)
+    elif ":" in line:
+        parts = line.rsplit(":", 1)
+    else:
+        return None
+    parts = [p.strip() for p in parts]
+    return parts if all(parts) else None
+
+
+def _read_lines(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [ln.strip() for ln in f if ln.strip() and not ln.startswith("#")]
+
+
+def load_jobs(args) -> List[WarmupJob]:
+    jobs: List[WarmupJob] = []
+    for raw in args.pairs or []:
+        pair = _split_pair(raw)
+        if pair:
+            jobs.append(WarmupJob(pair[0], pair[1], False))
+        else:
+            print(f"잘못된 --pairs 값 무시: {raw}")
+    if args.pairs_file:
+        for line in _read_lines(args.pairs_file):
+            pair = _split_pair(line)
+            if pair:
+                jobs.append(WarmupJob(pair[0], pair[1], False))
+    if args.queries_file:
+        for line in _read_lines(args.queries_file):
+            if line.startswith("{"):
+                try:
+                    obj = json.loads(line)
+                    jobs.append(WarmupJob(obj["address"], obj["query"], True))
+                except (ValueError, KeyError):
+                    print(f"잘못된 질의 줄 무시: {line[:60]}")
+                continue
+            pair = _split_pair(line) if "\t" in line else None
+            if pair:
+                jobs.append(WarmupJob(pair[0], pair[1], True))
+
+    # 중복 제거 (순서 유지)
+    seen: Set[str] = set()
+    unique = []
+    for job in jobs:
+        if job.job_id not in seen:
+            seen.add(job.job_id)
+            unique.append(job)
+    return unique
+
+
+def load_done(state_path: Optional[str]) -> Set[str]:
+    if not state_path or not os.path.exists(state_path):
+        return set()
+    done = set()
+    for line in _read_lines(state_path):
+        try:
+            done.add(json.loads(line)["job_id"])
+        except (ValueError, KeyError):
+            continue
+    return done
+
+
+class RateLimiter:
+    """작업 시작 간격을 60/rate 초 이상으로 유지 (rate: 분당 작업 수, 0이면 제한 없음)"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
+
+
+async def warm_one(job: WarmupJob, client: NaverClient, use_llm: bool) -> Dict:
+    """guide_query와 같은 검색어/파라미터로 컨텍스트 수집 (값이 다르면 캐시 키가 달라짐)"""
+    from app.utils.Refine_query import refine_query, rule_based_refine
+
+    if use_llm:
+        search_q = await refine_query(job.address, job.query)
+    else:
+        # LLM 없이: 규칙 변환이 되면 요청 경로와 같은 검색어
+        search_q = rule_based_refine(job.address, job.query) or f"{job.address} {job.query}"
+
+    local = await client.search_local(search_q, display=10)
+    place_list = [item["title"] for item in pick_top(local, kind="place", k=5)]
+    if not place_list:
+        return {"places": 0, "status": {}}
+
+    _, _, places_info, place_status = await build_context(
+        place_list,
+        job.address,
+        blog_top_k=min(3, len(place_list)),
+        review_batches=2,
+        image_limit=3,
+        max_concurrency=5,
+        user_query=job.query,
+        # guide_query는 항상 정제 → --no-llm이면 장소 컨텍스트 키가 달라짐 (단계 캐시만 공유)
+        enable_blog_refinement=use_llm,
+    )
+    counts: Dict[str, int] = {}
+    for st in place_status:
+        counts[st["status"]] = counts.get(st["status"], 0) + 1
+    return {"places": len(places_info), "status": counts}
+
+
+async def run(args) -> int:
+    jobs = load_jobs(args)
+    done = load_done(args.state)
+    todo = [j for j in jobs if j.job_id not in done]
+    print(f"작업 {len(jobs)}개 중 {len(jobs) - len(todo)}개 완료됨, {len(todo)}개 실행")
+    if not todo:
+        return 0
+
+    get_http_registry().start()
+    try:
+        await get_browser_pool().start()
+    except Exception as e:
+        print(f"브라우저 풀 기동 실패: {e}")
+
+    client = NaverClient()
+    limiter = RateLimiter(args.rate)
+    sem = asyncio.Semaphore(args.concurrency)
+    state_f = open(args.state, "a", encoding="utf-8") if args.state else None
+    progress = {"done": 0, "ok": 0, "failed": 0}
+    t_start = time.perf_counter()
+
+    async def _worker(job: WarmupJob) -> None:
+        async with sem:
+            await limiter.wait()
+            t0 = time.perf_counter()
+            try:
+                result = await warm_one(job, client, use_llm=not args.no_llm)
+                ok = True
+            except Exception as e:
+                result = {"error": str(e)}
+                ok = False
+            elapsed = time.perf_counter() - t0
+
+            progress["done"] += 1
+            progress["ok" if ok else "failed"] += 1
+            print(
+                f"[{progress['done']}/{len(todo)}] {'ok' if ok else 'FAIL'} "
+                f"{elapsed:5.1f}s {job.address} | {job.query} {result}"
+            )
+            if ok and state_f is not None:
+                state_f.write(
+                    json.dumps(
+                        {"job_id": job.job_id, "address": job.address, "query": job.query},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+                state_f.flush()
+
+    try:
+        await asyncio.gather(*[_worker(job) for job in todo])
+        # stale 응답으로 예약된 백그라운드 갱신까지 끝내고 종료
+        await wait_for_refreshes()
+    finally:
+        if state_f is not None:
+            state_f.close()
+        await close_browser_pool()
+        await close_http_clients()
+        await close_llm_clients()
+
+    total = time.perf_counter() - t_start
+    print(
+        f"\n완료: 성공 {progress['ok']}, 실패 {progress['failed']}, 총 {total:.1f}s"
+    )
+    print("\n단계별 소요 시간")
+    print(f"{'stage':<12}{'count':>7}{'hits':>7}{'avg_ms':>9}{'max_ms':>9}{'total_s':>9}")
+    for stage, st in sorted(get_stage_stats().items()):
+        print(
+            f"{stage:<12}{st['count']:>7}{st['hits']:>7}{st['avg_ms']:>9}"
+            f"{st['max_ms']:>9}{st['total_ms'] / 1000:>9.1f}"
+        )
+    cache = get_cache_stats()
+    print(
+        f"\n캐시: L1 hit {cache['l1']['hit_ratio']:.0%}, L2 hit {cache['l2']['hit_ratio']:.0%}, "
+        f"L2 {cache['l2']['bytes'] / 1024 / 1024:.1f} MB"
+    )
+    close_cache_store()
+    return 0 if progress["failed"] == 0 else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="장소 캐시 warm-up",
+        epilog="장소 컨텍스트 캐시는 질문 문장까지 키에 들어가므로 같은 질문에만 바로 맞고, "
+        "단계 캐시(pid/이미지/리뷰/블로그)는 같은 장소를 묻는 모든 요청이 재사용합니다.",
+    )
+    parser.add_argument("--pairs", action="append", help='"지역:카테고리" (여러 번 지정 가능)')
+    parser.add_argument("--pairs-file", help="지역<TAB>카테고리 목록 파일")
+    parser.add_argument("--queries-file", help="주소<TAB>질문 또는 JSON 줄 목록 파일")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시에 실행할 작업 수")
+    parser.add_argument("--rate", type=float, default=30, help="분당 최대 작업 시작 수 (0: 제한 없음)")
+    parser.add_argument("--state", default="warmup_state.jsonl", help="완료 기록 파일 (resume용, 빈 값이면 기록 안 함)")
+    parser.add_argument(
+        "--no-llm",
+        action="store_true",
+        help="refine_query / 블로그 정제(LLM) 단계 생략 (장소 컨텍스트 키가 요청과 달라져 단계 캐시만 채움)",
+    )
+    args = parser.parse_args(argv)
+
+    if not (args.pairs or args.pairs_file or args.queries_file):
+        parser.error("--pairs, --pairs-file, --queries-file 중 하나는 필요합니다.")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import pytest
+
+from app.utils.answer_cache import (
+    ANSWER_CACHE_THRESHOLD,
+    negation_markers,
+    normalize_query,
+    similarity,
+)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("강남구 브런치 카페 알려줘", "강남 브런치 카페"),
+        ("카페를 추천해 주세요", "카페"),
+        ("이 근처에서 카페", "카페"),
+        # 요청 어미는 단어 단위로만 제거
+        ("맛있어요", "맛있어요"),
+        ("여기어때", "여기어때"),
+        ("좀비카페", "좀비카페"),
+        # 이/면/구/동으로 끝나는 음식 이름은 그대로
+        ("떡볶이 맛집", "떡볶이 맛집"),
+        ("물냉면 맛집", "물냉면 맛집"),
+        ("조개구이 맛집", "조개구이 맛집"),
+        ("우동 맛집", "우동 맛집"),
+    ],
+)
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("강남 브런치 카페 추천", "강남구 브런치 카페 알려줘"),
+        ("홍대 파스타 맛집 추천해줘", "홍대 파스타 맛집 알려 주세요"),
+    ],
+)
+def test_similar_queries_hit(a, b):
+    assert similarity(normalize_query(a), normalize_query(b)) >= ANSWER_CACHE_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("소금빵 맛있는 카페", "소금빵 맛있는 카페 말고"),
+        ("주차 가능한", "주차 불가능한"),
+        ("애견 동반 카페", "애견 동반 안 되는 카페"),
+        ("가성비 돼지갈비 맛집", "돼지갈비 맛집"),
+        ("물냉면 맛집", "냉면 맛집"),
+        ("조개구이 맛집", "조개 맛집"),
+    ],
+)
+def test_different_queries_miss(a, b):
+    assert similarity(normalize_query(a), normalize_query(b)) < ANSWER_CACHE_THRESHOLD
+
+
+def test_negation_markers():
+    assert negation_markers("주차 불가능한") == {"불가"}
+    assert negation_markers("불고기 맛집") == frozenset()
+    assert negation_markers("안동 찜닭") == frozenset()
+    assert negation_markers("고기 빼고 맛집 말고") == {"빼고", "말고"}
@@ -0,0 +1,93 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.utils.Context_Enhance.Blog_text_mining import (
+    BlogRefiner,
+    _item_tokens,
+    _prompt_tokens,
+    match_refined,
+    split_batches,
+)
+
+
+def _blog(i, text="가" * 600, place="카페"):
+    return {"url": f"https://blog.naver.com/user/{i}", "text": text, "place": place}
+
+
+def test_split_batches_counts_prompt_and_output():
+    blogs = [_blog(i) for i in range(6)]
+    ceiling = _prompt_tokens("카페", 1024) + 3 * _item_tokens(blogs[0], 1024)
+    batches = split_batches(blogs, "카페", max_length=1024, max_tokens=ceiling)
+    assert [len(b) for b in batches] == [3, 3]
+
+    # 입력은 짧아도 출력 상한(max_length)이 크면 더 잘게 나눔
+    short = [_blog(i, text="짧은 글") for i in range(6)]
+    assert len(split_batches(short, "카페", max_length=4000, max_tokens=ceiling)) > 1
+
+
+def test_split_batches_oversized_blog_is_alone():
+    blogs = [_blog(0), _blog(1, text="가" * 50000), _blog(2)]
+    batches = split_batches(blogs, "카페", max_length=1024, max_tokens=5000)
+    assert [[b["url"] for b in batch] for batch in batches] == [
+        [blogs[0]["url"]],
+        [blogs[1]["url"]],
+        [blogs[2]["url"]],
+    ]
+
+
+def test_match_refined_by_id_and_altered_url():
+    batch = [_blog(0), _blog(1), _blog(2)]
+    items = [
+        {"id": 0, "url": "엉뚱한 값", "text": "정제0"},
+        # id 없이 스킴/m./끝 슬래시가 바뀐 url
+        {"url": "http://m.blog.naver.com/user/1/", "text": "정제1"},
+        {"url": "https://blog.naver.com/other/9", "text": "모르는 글"},
+    ]
+    assert match_refined(batch, items) == {
+        batch[0]["url"]: "정제0",
+        batch[1]["url"]: "정제1",
+    }
+
+
+def test_missing_blogs_are_refined_one_by_one(monkeypatch):
+    refiner = BlogRefiner()
+    blogs = [_blog(0), _blog(1)]
+
+    async def fake_invoke(messages, max_tokens):
+        out = {"blogs": [{"id": 0, "url": blogs[0]["url"], "text": "배치 정제"}]}
+        return SimpleNamespace(
+            content=json.dumps(out, ensure_ascii=False),
+            response_metadata={"finish_reason": "stop"},
+        )
+
+    single = []
+
+    async def fake_single(text, place, query, max_length=1024):
+        single.append(text)
+        return "글별 정제"
+
+    monkeypatch.setattr(refiner, "_invoke_batch", fake_invoke)
+    monkeypatch.setattr(refiner, "refine_blog_content", fake_single)
+    result = asyncio.run(refiner.refine_blogs_batched(blogs, "카페"))
+    assert result == {blogs[0]["url"]: "배치 정제", blogs[1]["url"]: "글별 정제"}
+    assert len(single) == 1
+
+
+def test_truncated_batch_falls_back_to_single(monkeypatch):
+    refiner = BlogRefiner()
+    blogs = [_blog(0), _blog(1)]
+
+    async def fake_invoke(messages, max_tokens):
+        return SimpleNamespace(
+            content='{"blogs": [{"id": 0, "text": "잘린',
+            response_metadata={"finish_reason": "length"},
+        )
+
+    async def fake_single(text, place, query, max_length=1024):
+        return "글별 정제"
+
+    monkeypatch.setattr(refiner, "_invoke_batch", fake_invoke)
+    monkeypatch.setattr(refiner, "refine_blog_content", fake_single)
+    result = asyncio.run(refiner.refine_blogs_batched(blogs, "카페"))
+    assert result == {b["url"]: "글별 정제" for b in blogs}
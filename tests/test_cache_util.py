@@ -0,0 +1,38 @@
+import pytest
+
+from app.utils import cache_util
+from app.utils.cache_store import CacheStore
+from app.utils.memory_cache import MemoryLRU
+
+
+@pytest.fixture
+def tiers(tmp_path, monkeypatch):
+    l2 = CacheStore(path=str(tmp_path / "cache.sqlite3"))
+    l1 = MemoryLRU(max_bytes=1024 * 1024)
+    monkeypatch.setattr(cache_util, "get_cache_store", lambda: l2)
+    monkeypatch.setattr(cache_util, "get_memory_cache", lambda: l1)
+    yield l1, l2
+    l2.close()
+
+
+def test_l1_holds_decoded_copy_not_caller_object(tiers):
+    l1, _ = tiers
+    data = {"refs": ("a", "b"), "n": 1}
+    cache_util.save_cache("k", data)
+    data["n"] = 2  # 저장 후 호출자가 바꿔도 캐시에는 영향 없음
+
+    from_l1 = cache_util.load_cache("k")
+    assert from_l1 == {"refs": ["a", "b"], "n": 1}
+    assert from_l1 is not data
+
+    l1.pop("k")
+    from_l2 = cache_util.load_cache("k")
+    assert from_l2 == from_l1  # 두 티어가 같은 타입(list)을 돌려줌
+
+
+def test_l1_size_is_uncompressed_json_length(tiers):
+    l1, l2 = tiers
+    cache_util.save_cache("big", "가" * 5000)  # zlib으로 크게 줄어드는 값
+    entry = l1.get_entry("big")
+    assert entry.size >= 15000  # 압축 전 UTF-8 JSON 길이
+    assert l2.health()["bytes"] < entry.size
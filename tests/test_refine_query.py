@@ -0,0 +1,79 @@
+import pytest
+
+from app.utils.Refine_query import rule_based_refine
+
+LOC = "서울특별시 마포구 서교동"
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("소금빵이 맛있는 카페를 추천해줘", f"{LOC} 소금빵 맛집 카페"),
+        ("바다가 보이는 맛집을 추천해줘", f"{LOC} 오션뷰 맛집"),
+        ("값싼 숙소를 추천해줘", f"{LOC} 가성비 숙소"),
+        ("싼 맛집", f"{LOC} 가성비 맛집"),
+        ("회식하기 좋은 삼겹살집 찾아줘", f"{LOC} 회식 삼겹살 맛집"),
+    ],
+)
+def test_rule_based_refine_examples(query, expected):
+    assert rule_based_refine(LOC, query) == expected
+
+
+def test_modifier_matches_whole_tokens_only():
+    # "비싼"/"싼타페"가 "싼"(가성비)으로 잡히면 안 됨
+    assert rule_based_refine(LOC, "비싼 맛집") == f"{LOC} 비싼 맛집"
+    assert rule_based_refine(LOC, "싼타페 전시") == f"{LOC} 싼타페 전시회"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "카페 말고 술집 추천해줘",
+        "회식 하기 싫은 날 혼밥 식당",
+        "술집 아닌 카페",
+        "고기 빼고 맛집",
+        "안 비싼 맛집",
+        "애견 못 가는 카페",
+        "맛없는 카페",
+        "주차 안되는 식당",
+        "별로 안 붐비는 카페",
+        "붐비지 않는 카페",
+    ],
+)
+def test_negation_goes_to_llm(query):
+    assert rule_based_refine(LOC, query) is None
+
+
+def test_multiple_categories_go_to_llm():
+    # 나중 카테고리가 앞의 것을 덮어쓰지 않고 LLM으로 넘김
+    assert rule_based_refine(LOC, "시장 근처 맛집") is None
+    assert rule_based_refine(LOC, "카페 술집") is None
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        # 이/면/구로 끝나는 음식 이름이 잘리지 않아야 함
+        ("떡볶이 맛집", f"{LOC} 떡볶이 맛집"),
+        ("짜장면 맛집 추천해줘", f"{LOC} 짜장면 맛집"),
+        ("조개구이 맛집", f"{LOC} 조개구이 맛집"),
+        ("물냉면 맛집", f"{LOC} 물냉면 맛집"),
+        ("떡볶이가 맛있는 카페", f"{LOC} 떡볶이 맛집 카페"),
+    ],
+)
+def test_food_names_are_kept_whole(query, expected):
+    assert rule_based_refine(LOC, query) == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        # 요청 어미는 단어 단위로만 제거 (맛있어요의 "있어"를 빼지 않음)
+        ("맛있어요 카페", f"{LOC} 맛집 카페"),
+        ("이 근처에서 전시회 하는 곳 추천", f"{LOC} 전시회"),
+        ("여기서 가까운 공원 알려 줘", f"{LOC} 공원"),
+        ("강남역에서 가까운 카페", f"{LOC} 강남역 카페"),
+    ],
+)
+def test_fillers_removed_on_word_boundaries(query, expected):
+    assert rule_based_refine(LOC, query) == expected